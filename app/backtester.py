@@ -1,45 +1,366 @@
 import argparse
+import json
 import logging
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import partial
+from typing import Callable, Generator, Iterator
+
+import numpy as np
+import numpy.typing as npt
 
 from app.exchange_client.dummy import Dummy
-from app.models import Tick
-from app.settings import APP_PATH, app_settings
-from app.strategy import get_strategy_instance
+from app.models import Tick, TickBatch
+from app.rates_utils import catalog
+from app.rates_utils.cache import load_rates_columns
+from app.rates_utils.columns import RatesColumns, parse_rate_time, read_csv_columns
+from app.rates_utils.follow import follow_rates_lines
+from app.rates_utils.index import iter_rates_lines
+from app.rates_utils.intrabar import expand_ohlc
+from app.rates_utils.resampler import load_resampled_columns, resample
+from app.rates_utils.shared import SharedRates, SharedRatesHandle, attach_rates
+from app.rates_utils.store import is_store
+from app.rates_utils.synthetic import (
+    PATH_GENERATORS,
+    SYNTHETIC_MODELS,
+    generate_block_bootstrap,
+    get_log_returns,
+    paths_to_columns,
+)
+from app.rates_utils.ticks import TICKS_EXTENSION, read_ticks
+from app.rates_utils.trades import TRADES_EXTENSION, read_trades
+from app.settings import APP_PATH, AppSettings, app_settings
+from app.strategy import BasicStrategy, get_strategy_instance
+from app.strategy_config import get_strategy_config
+from app.telemetry.replay import MAX_TIMESTAMP, iter_telemetry_rows
+from app.vectorized_strategy import VectorizedBasicStrategy
 
 logger = logging.getLogger(__name__)
 
 
 BACKTESTER_TICK_QTY = Decimal(999999999999)
+TICKS_CHUNK_SIZE = 65536
+REFERENCE_ENGINE = 'reference'
+VECTORIZED_ENGINE = 'vectorized'
+ENGINES: tuple[str, ...] = (REFERENCE_ENGINE, VECTORIZED_ENGINE)
+# lockstep position of strategy without ticks left
+_FINISHED_ROW = np.iinfo(np.int64).max
+
+# rates attached by backtest worker process
+_worker_columns: RatesColumns | None = None
+
+
+class FollowResults:
+    """Show strategy results every follow_show_results_seconds while rates file is followed, idle or not."""
+
+    def __init__(self) -> None:
+        self.strategy: BasicStrategy | None = None
+        self._shown_at: float = time.monotonic()
+
+    def __call__(self) -> None:
+        if self.strategy and time.monotonic() - self._shown_at >= app_settings.follow_show_results_seconds:
+            self.strategy.show_results()
+            self._shown_at = time.monotonic()
 
 
 def main(
     use_every_n_tick: int = 1,
     start_date: datetime | None = None,
     end_date: datetime | None = None,
+    intrabar_steps: int = 0,
+    symbol: str | None = None,
+    interval: str = '1m',
+    resample_interval: str | None = None,
+    follow: bool = False,
+    follow_idle_timeout: float | None = None,
+    telemetry_bot_name: str | None = None,
+    synthetic_model: str | None = None,
+    synthetic_paths: int = 1,
+    synthetic_steps: int = 10000,
+    seed: int | None = None,
+    settings_grid: list[dict] | None = None,
+    workers: int = 1,
+    engine: str = REFERENCE_ENGINE,
 ) -> None:
+    if settings_grid:
+        grid_results = run_parallel_backtests(
+            settings_grid,
+            workers,
+            use_every_n_tick,
+            start_date,
+            end_date,
+            intrabar_steps,
+            resample_interval,
+            engine,
+        )
+        for settings_overrides, results in zip(settings_grid, grid_results):
+            print('')
+            print(settings_overrides)
+            for key, value in results.items():
+                print('    {0}: {1}'.format(key, value))
+        return
+
+    if synthetic_model:
+        synthetic_columns = get_synthetic_columns(synthetic_model, synthetic_paths, synthetic_steps, seed)
+        for path_num, columns in enumerate(synthetic_columns):
+            logger.info('synthetic {0} path {1}'.format(synthetic_model, path_num))
+            if engine == VECTORIZED_ENGINE:
+                run_vectorized_backtest(columns.open, columns.price_digits)
+            else:
+                run_backtest(_columns_to_ticks(columns, slice(0, len(columns))))
+        return
+
+    if engine == VECTORIZED_ENGINE:
+        if follow or telemetry_bot_name:
+            raise ValueError('Vectorized engine backtests rates files and rates catalog only')
+
+        start_ms, end_ms = _get_range_ms(start_date, end_date)
+        if symbol:
+            columns = catalog.load_range(symbol, interval, start_ms, end_ms)
+            if resample_interval:
+                columns = resample(columns, resample_interval)
+            rows = _get_range_rows(columns.timestamp, use_every_n_tick)
+        else:
+            filepath = os.path.abspath(os.path.join(app_settings.rates_path, app_settings.rates_filename))
+            if filepath.endswith(TICKS_EXTENSION):
+                raise ValueError('Vectorized engine backtests rates files and rates catalog only')
+            columns = _load_columns(filepath, resample_interval)
+            rows = _get_range_rows(columns.timestamp, use_every_n_tick, start_ms, end_ms)
+
+        run_vectorized_backtest(_get_columns_prices(columns, rows, intrabar_steps), columns.price_digits)
+        return
+
+    # follow iterator shows results while waiting for new rates too
+    follow_results = FollowResults()
+    if telemetry_bot_name:
+        ticks = iter_telemetry_rates(telemetry_bot_name, start_date, end_date)
+    elif follow:
+        ticks = iter_follow_rates(
+            app_settings.rates_filename,
+            use_every_n_tick,
+            start_date,
+            end_date,
+            idle_timeout=follow_idle_timeout,
+            on_idle=follow_results,
+        )
+    elif symbol:
+        ticks = iter_catalog_rates(
+            symbol,
+            interval,
+            use_every_n_tick,
+            start_date,
+            end_date,
+            intrabar_steps,
+            resample_interval=resample_interval,
+        )
+    else:
+        ticks = iter_rates(
+            app_settings.rates_filename,
+            use_every_n_tick,
+            start_date,
+            end_date,
+            intrabar_steps,
+            resample_interval,
+        )
+
+    run_backtest(ticks, follow, follow_results=follow_results)
+
+
+def run_backtest(
+    ticks: Iterator[Tick],
+    follow: bool = False,
+    show_results: bool = True,
+    settings: AppSettings = app_settings,
+    follow_results: FollowResults | None = None,
+) -> BasicStrategy:
     strategy = get_strategy_instance(
-        strategy_type=app_settings.strategy_type,
+        strategy_type=settings.strategy_type,
         exchange_client=Dummy(symbol='dummy'),
         dry_run=True,
+        config=get_strategy_config(settings),
     )
 
-    for tick in get_rates(
-        app_settings.rates_filename,
-        use_every_n_tick,
-        start_date,
-        end_date,
-    ):
-        logger.info('tick {0}'.format(tick))
+    follow_results = follow_results or FollowResults()
+    follow_results.strategy = strategy
+    try:
+        for tick in ticks:
+            logger.info('tick {0}'.format(tick))
+
+            go_to_next_step = strategy.tick(tick=tick)
+            if not go_to_next_step:
+                logger.info('end trading')
+                break
 
-        go_to_next_step = strategy.tick(tick=tick)
-        if not go_to_next_step:
-            logger.info('end trading')
-            break
+            if follow:
+                follow_results()
+    except KeyboardInterrupt:
+        logger.info('end trading by keyboard interrupt')
+
+    if show_results:
+        strategy.show_results()
+    return strategy
+
+
+def run_vectorized_backtest(
+    prices: npt.NDArray[np.int64],
+    price_digits: int,
+    show_results: bool = True,
+    settings: AppSettings = app_settings,
+) -> BasicStrategy:
+    """Backtest fixed-point prices (bid equals ask) with vectorized engine, results are the same as run_backtest gives."""
+    strategy = VectorizedBasicStrategy(
+        exchange_client=Dummy(symbol='dummy'),
+        dry_run=True,
+        config=get_strategy_config(settings),
+    )
+    try:
+        strategy.run(TickBatch(bid=prices, ask=prices, price_digits=price_digits, tick_qty=BACKTESTER_TICK_QTY))
+    except KeyboardInterrupt:
+        logger.info('end trading by keyboard interrupt')
+
+    if show_results:
+        strategy.show_results()
+    return strategy
+
+
+def run_parallel_backtests(
+    settings_grid: list[dict],
+    workers: int,
+    use_every_n_tick: int = 1,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    intrabar_steps: int = 0,
+    resample_interval: str | None = None,
+    engine: str = REFERENCE_ENGINE,
+) -> list[dict]:
+    """Backtest rates_filename with every settings overrides of grid in worker processes, return results in grid order.
+
+    Rates are loaded once into shared memory, workers attach to it without copying.
+    With vectorized engine every worker backtests its contiguous part of grid in lockstep.
+    """
+    columns = _load_columns(
+        os.path.abspath(os.path.join(app_settings.rates_path, app_settings.rates_filename)),
+        resample_interval,
+    )
+    start_ms, end_ms = _get_range_ms(start_date, end_date)
+    with SharedRates(columns) as shared_rates, ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_backtest_worker,
+        initargs=(shared_rates.handle,),
+    ) as executor:
+        if engine == VECTORIZED_ENGINE:
+            chunk_size = -(-len(settings_grid) // max(workers, 1))
+            grid_chunks = [settings_grid[start:start + chunk_size] for start in range(0, len(settings_grid), chunk_size)]
+            chunks_results = executor.map(
+                partial(
+                    _run_worker_lockstep,
+                    use_every_n_tick=use_every_n_tick,
+                    start_ms=start_ms,
+                    end_ms=end_ms,
+                    intrabar_steps=intrabar_steps,
+                ),
+                grid_chunks,
+            )
+            return [results for chunk_results in chunks_results for results in chunk_results]
 
-    strategy.show_results()
+        return list(executor.map(
+            partial(
+                _run_worker_backtest,
+                use_every_n_tick=use_every_n_tick,
+                start_ms=start_ms,
+                end_ms=end_ms,
+                intrabar_steps=intrabar_steps,
+            ),
+            settings_grid,
+        ))
+
+
+def run_lockstep_backtests(
+    settings_grid: list[dict],
+    prices: npt.NDArray[np.int64],
+    price_digits: int,
+) -> list[dict]:
+    """Backtest every settings overrides of grid with vectorized engine in one pass over prices, return results in grid order.
+
+    Strategies step through the same prices together: strategy with the least processed tick goes next,
+    so prices window stays hot in cpu cache for all of them. Every strategy gets its own config,
+    app settings stay untouched.
+    """
+    grid_settings = [app_settings.model_copy(update=validate_settings(overrides)) for overrides in settings_grid]
+
+    batch = TickBatch(bid=prices, ask=prices, price_digits=price_digits, tick_qty=BACKTESTER_TICK_QTY)
+    strategies: list[VectorizedBasicStrategy] = []
+    rows = np.full(len(grid_settings), _FINISHED_ROW, dtype=np.int64)
+    for num, settings in enumerate(grid_settings):
+        strategy = VectorizedBasicStrategy(
+            exchange_client=Dummy(symbol='dummy'),
+            dry_run=True,
+            config=get_strategy_config(settings),
+        )
+        if strategy.start(batch):
+            rows[num] = strategy.row
+        strategies.append(strategy)
+
+    while rows.min() != _FINISHED_ROW:
+        num = int(np.argmin(rows))
+        strategy = strategies[num]
+        rows[num] = strategy.row if strategy.step() else _FINISHED_ROW
+
+    return [strategy.get_results() for strategy in strategies]
+
+
+def validate_settings(settings_overrides: dict) -> dict:
+    """Return settings overrides converted to app settings types, raise ValueError for invalid ones."""
+    unknown_names = set(settings_overrides) - set(AppSettings.model_fields)
+    if unknown_names:
+        raise ValueError('Unknown settings {0}'.format(sorted(unknown_names)))
+
+    validated_settings = AppSettings(**settings_overrides)
+    return {
+        name: getattr(validated_settings, name)
+        for name in settings_overrides
+    }
+
+
+def _init_backtest_worker(handle: SharedRatesHandle) -> None:
+    global _worker_columns
+    _worker_columns = attach_rates(handle)
+
+
+def _run_worker_backtest(
+    settings_overrides: dict,
+    use_every_n_tick: int = 1,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+    intrabar_steps: int = 0,
+) -> dict:
+    if _worker_columns is None:
+        raise RuntimeError('Backtest worker is not attached to shared rates')
+
+    settings = app_settings.model_copy(update=validate_settings(settings_overrides))
+    ticks = _iter_columns_range_ticks(_worker_columns, use_every_n_tick, start_ms, end_ms, intrabar_steps)
+    return run_backtest(ticks, show_results=False, settings=settings).get_results()
+
+
+def _run_worker_lockstep(
+    settings_grid: list[dict],
+    use_every_n_tick: int = 1,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+    intrabar_steps: int = 0,
+) -> list[dict]:
+    if _worker_columns is None:
+        raise RuntimeError('Backtest worker is not attached to shared rates')
+
+    prices = _get_columns_prices(
+        _worker_columns,
+        _get_range_rows(_worker_columns.timestamp, use_every_n_tick, start_ms, end_ms),
+        intrabar_steps,
+    )
+    return run_lockstep_backtests(settings_grid, prices, _worker_columns.price_digits)
 
 
 def get_rates(
@@ -47,37 +368,299 @@ def get_rates(
     use_every_n_tick: int = 1,
     start_date: datetime | None = None,
     end_date: datetime | None = None,
+    intrabar_steps: int = 0,
+    resample_interval: str | None = None,
 ) -> list[Tick]:
+    return list(iter_rates(filename, use_every_n_tick, start_date, end_date, intrabar_steps, resample_interval))
+
+
+def get_synthetic_rates(
+    model: str,
+    paths: int = 1,
+    steps: int = 10000,
+    seed: int | None = None,
+    start_price: Decimal | None = None,
+    price_digits: int = 4,
+    block_size: int = 60,
+) -> list[Iterator[Tick]]:
+    """Generate synthetic paths at once and return lazy ticks iterator per path, ticks are the same as get_rates gives."""
+    return [
+        _columns_to_ticks(columns, slice(0, len(columns)))
+        for columns in get_synthetic_columns(model, paths, steps, seed, start_price, price_digits, block_size)
+    ]
+
+
+def get_synthetic_columns(
+    model: str,
+    paths: int = 1,
+    steps: int = 10000,
+    seed: int | None = None,
+    start_price: Decimal | None = None,
+    price_digits: int = 4,
+    block_size: int = 60,
+) -> list[RatesColumns]:
+    """Generate synthetic paths at once as rates columns, one flat candle per tick.
+
+    Block bootstrap resamples returns of rates_filename, starts from its first price and keeps its price digits.
+    """
+    if model == 'bootstrap':
+        source_columns = _load_columns(os.path.abspath(os.path.join(app_settings.rates_path, app_settings.rates_filename)))
+        start_price = start_price or source_columns.to_decimal(source_columns.close[0])
+        price_digits = source_columns.price_digits
+        prices = generate_block_bootstrap(get_log_returns(source_columns), paths, steps, float(start_price), block_size, seed)
+    else:
+        prices = PATH_GENERATORS[model](paths, steps, float(start_price or Decimal(100)), seed=seed)
+
+    return paths_to_columns(prices, price_digits)
+
+
+def iter_rates(
+    filename: str,
+    use_every_n_tick: int = 1,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    intrabar_steps: int = 0,
+    resample_interval: str | None = None,
+) -> Generator[Tick, None, None]:
+    """Yield ticks from rates file one by one without loading whole file into memory.
+
+    With resample_interval rates aggregated into OHLC candles of this interval first.
+    With intrabar_steps every OHLC candle expands into synthetic intrabar path of 3 * intrabar_steps + 1 ticks.
+    """
     filepath = os.path.abspath(os.path.join(
         app_settings.rates_path,
         filename,
     ))
 
-    output: list[Tick] = []
-    with open(filepath) as fd:
-        tick_number = 0
-        for num, line in enumerate(fd):
-            if not num or not line:
-                continue
+    start_ms, end_ms = _get_range_ms(start_date, end_date)
+    if filepath.endswith(TICKS_EXTENSION):
+        # recorded bid/ask ticks are not candles, resampling and intrabar path are not applicable
+        yield from _iter_ticks_file_rates(filepath, use_every_n_tick, start_ms, end_ms)
+        return
+
+    is_columnar_file = app_settings.rates_cache_enabled or filepath.endswith(TRADES_EXTENSION) or is_store(filepath)
+    if is_columnar_file or intrabar_steps or resample_interval:
+        yield from _iter_columns_rates(filepath, use_every_n_tick, start_ms, end_ms, intrabar_steps, resample_interval)
+        return
+
+    tick_number = 0
+    for num, line in iter_rates_lines(filepath, start_ms, end_ms):
+        if num % use_every_n_tick:
+            continue
+
+        price = Decimal(line.split(',')[1])
+        yield Tick(
+            number=tick_number,
+            bid=price,
+            ask=price,
+            bid_qty=BACKTESTER_TICK_QTY,
+            ask_qty=BACKTESTER_TICK_QTY,
+        )
+        tick_number += 1
+
 
-            if num % use_every_n_tick:
+def iter_catalog_rates(
+    symbol: str,
+    interval: str,
+    use_every_n_tick: int = 1,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    intrabar_steps: int = 0,
+    exchange: str | None = None,
+    resample_interval: str | None = None,
+) -> Generator[Tick, None, None]:
+    """Yield ticks stitched from all rates files of symbol and interval found in rates catalog."""
+    start_ms, end_ms = _get_range_ms(start_date, end_date)
+    columns = catalog.load_range(symbol, interval, start_ms, end_ms, exchange)
+    if resample_interval:
+        columns = resample(columns, resample_interval)
+
+    rows = np.arange(len(columns))
+    rows = rows[(rows + 1) % use_every_n_tick == 0]
+    yield from _columns_to_ticks(columns, rows, intrabar_steps)
+
+
+def iter_follow_rates(
+    filename: str,
+    use_every_n_tick: int = 1,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    poll_interval: float = 1.0,
+    idle_timeout: float | None = None,
+    on_idle: Callable[[], None] | None = None,
+) -> Generator[Tick, None, None]:
+    """Yield ticks from rates file and keep waiting for new rates appended to it."""
+    filepath = os.path.abspath(os.path.join(
+        app_settings.rates_path,
+        filename,
+    ))
+    start_ms, end_ms = _get_range_ms(start_date, end_date)
+
+    tick_number = 0
+    for num, line in follow_rates_lines(filepath, poll_interval, idle_timeout, on_idle):
+        if num % use_every_n_tick:
+            continue
+
+        if start_ms is not None and end_ms is not None:
+            tick_ms = parse_rate_time(line.split(',', 1)[0])
+            if tick_ms < start_ms:
                 continue
+            if tick_ms > end_ms:
+                break
 
-            if start_date and end_date:
-                tick_date = datetime.fromisoformat(line.split(',')[0]).replace(tzinfo=timezone.utc)
-                if tick_date < start_date or tick_date > end_date:
-                    continue
+        price = Decimal(line.split(',')[1])
+        yield Tick(
+            number=tick_number,
+            bid=price,
+            ask=price,
+            bid_qty=BACKTESTER_TICK_QTY,
+            ask_qty=BACKTESTER_TICK_QTY,
+        )
+        tick_number += 1
 
-            price = Decimal(line.split(',')[1])
-            output.append(Tick(
-                number=tick_number,
-                bid=price,
-                ask=price,
-                bid_qty=BACKTESTER_TICK_QTY,
-                ask_qty=BACKTESTER_TICK_QTY,
-            ))
-            tick_number += 1
-    return output
+
+def iter_telemetry_rates(
+    bot_name: str,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+) -> Generator[Tick, None, None]:
+    """Yield real bid/ask ticks recorded by bot telemetry."""
+    start_timestamp, end_timestamp = 0, MAX_TIMESTAMP
+    if start_date and end_date:
+        start_timestamp, end_timestamp = int(start_date.timestamp()), int(end_date.timestamp())
+
+    for tick_number, row in enumerate(iter_telemetry_rows(bot_name, start_timestamp, end_timestamp)):
+        yield Tick(
+            number=tick_number,
+            bid=row['bid'],
+            ask=row['ask'],
+            bid_qty=BACKTESTER_TICK_QTY,
+            ask_qty=BACKTESTER_TICK_QTY,
+        )
+
+
+def _iter_columns_rates(
+    filepath: str,
+    use_every_n_tick: int = 1,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+    intrabar_steps: int = 0,
+    resample_interval: str | None = None,
+) -> Generator[Tick, None, None]:
+    columns = _load_columns(filepath, resample_interval)
+    yield from _iter_columns_range_ticks(columns, use_every_n_tick, start_ms, end_ms, intrabar_steps)
+
+
+def _iter_columns_range_ticks(
+    columns: RatesColumns,
+    use_every_n_tick: int = 1,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+    intrabar_steps: int = 0,
+) -> Generator[Tick, None, None]:
+    rows = _get_range_rows(columns.timestamp, use_every_n_tick, start_ms, end_ms)
+    yield from _columns_to_ticks(columns, rows, intrabar_steps)
+
+
+def _iter_ticks_file_rates(
+    filepath: str,
+    use_every_n_tick: int = 1,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+) -> Generator[Tick, None, None]:
+    ticks = read_ticks(filepath)
+    rows = _get_range_rows(ticks.timestamp, use_every_n_tick, start_ms, end_ms)
+    yield from ticks.to_tick_batch(rows)
+
+
+def _get_range_rows(
+    timestamp: npt.NDArray[np.int64],
+    use_every_n_tick: int = 1,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+) -> slice:
+    first_row, last_row = 0, len(timestamp)
+    if start_ms is not None and end_ms is not None:
+        first_row = int(np.searchsorted(timestamp, start_ms, side='left'))
+        last_row = int(np.searchsorted(timestamp, end_ms, side='right'))
+
+    # csv line numbers: first rate on line 1 after header
+    first_row += (use_every_n_tick - (first_row + 1) % use_every_n_tick) % use_every_n_tick
+    return slice(first_row, last_row, use_every_n_tick)
+
+
+def _load_columns(filepath: str, resample_interval: str | None = None) -> RatesColumns:
+    if filepath.endswith(TRADES_EXTENSION):
+        columns = read_trades(filepath).to_rates_columns()
+        if resample_interval:
+            columns = resample(columns, resample_interval)
+    elif app_settings.rates_cache_enabled or is_store(filepath):
+        if resample_interval:
+            columns = load_resampled_columns(filepath, resample_interval)
+        else:
+            columns = load_rates_columns(filepath)
+    else:
+        columns = read_csv_columns(filepath)
+        if resample_interval:
+            columns = resample(columns, resample_interval)
+
+    return columns
+
+
+def _columns_to_ticks(
+    columns: RatesColumns,
+    rows: slice,
+    intrabar_steps: int = 0,
+) -> Generator[Tick, None, None]:
+    # rows slice is a view of (maybe memory-mapped or shared) columns, only current chunk is copied
+    timestamp, open_price, high, low, close = (
+        getattr(columns, name)[rows]
+        for name in ('timestamp', 'open', 'high', 'low', 'close')
+    )
+    tick_number = 0
+    for chunk_start in range(0, len(timestamp), TICKS_CHUNK_SIZE):
+        chunk = slice(chunk_start, chunk_start + TICKS_CHUNK_SIZE)
+        prices = open_price[chunk]
+        if intrabar_steps:
+            _, prices = expand_ohlc(
+                timestamp[chunk],
+                prices,
+                high[chunk],
+                low[chunk],
+                close[chunk],
+                steps_per_leg=intrabar_steps,
+            )
+
+        batch = TickBatch(
+            bid=prices,
+            ask=prices,
+            price_digits=columns.price_digits,
+            tick_qty=BACKTESTER_TICK_QTY,
+            first_number=tick_number,
+        )
+        yield from batch
+        tick_number += len(batch)
+
+
+def _get_columns_prices(columns: RatesColumns, rows: slice, intrabar_steps: int = 0) -> npt.NDArray[np.int64]:
+    """Return all fixed-point tick prices of rows at once, the same prices _columns_to_ticks yields."""
+    prices = columns.open[rows]
+    if intrabar_steps:
+        _, prices = expand_ohlc(
+            columns.timestamp[rows],
+            prices,
+            columns.high[rows],
+            columns.low[rows],
+            columns.close[rows],
+            steps_per_leg=intrabar_steps,
+        )
+    return np.ascontiguousarray(prices, dtype=np.int64)
+
+
+def _get_range_ms(start_date: datetime | None, end_date: datetime | None) -> tuple[int | None, int | None]:
+    if not start_date or not end_date:
+        return None, None
+    return int(start_date.timestamp() * 1000), int(end_date.timestamp() * 1000)
 
 
 def valid_datetime(s: str) -> datetime:
@@ -88,6 +671,18 @@ def valid_datetime(s: str) -> datetime:
         raise argparse.ArgumentTypeError(msg)
 
 
+def valid_settings_grid(s: str) -> list[dict]:
+    try:
+        with open(s) as fd:
+            settings_grid = json.load(fd)
+    except (OSError, ValueError) as exc:
+        raise argparse.ArgumentTypeError('Not a valid settings grid file {0!r}: {1}'.format(s, exc))
+
+    if not isinstance(settings_grid, list) or not all(isinstance(item, dict) for item in settings_grid):
+        raise argparse.ArgumentTypeError('Settings grid must be a list of settings objects: {0!r}'.format(s))
+    return settings_grid
+
+
 if __name__ == '__main__':
     logging.basicConfig(
         filename=os.path.join(APP_PATH, 'backtest.log'),
@@ -99,11 +694,64 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('--from-date', default=None, help='Use ticks from datetime (eg. 2023-01-01 00:00:00)', type=valid_datetime)
     parser.add_argument('--to-date', default=None, help='Use ticks to datetime (eg. 2023-02-02 23:59:59)', type=valid_datetime)
-    parser.add_argument('--used-ticks', default=1, help='Use every N tick', type=int)
+    parser.add_argument('--used-ticks', default=1, help='Use every N tick (deprecated, use --resample)', type=int)
+    parser.add_argument(
+        '--resample',
+        default=None,
+        choices=list(catalog.INTERVAL_MS),
+        help='Aggregate rates into OHLC candles of interval (eg. 15m)',
+    )
+    parser.add_argument(
+        '--intrabar-steps',
+        default=0,
+        help='Expand every OHLC candle into synthetic O-L-H-C / O-H-L-C path with N ticks per leg (0 - open price only)',
+        type=int,
+    )
+    parser.add_argument('--symbol', default=None, help='Use rates catalog for symbol instead of rates_filename setting')
+    parser.add_argument('--interval', default='1m', choices=list(catalog.INTERVAL_MS), help='Rates catalog interval')
+    parser.add_argument('--follow', action='store_true', help='Wait for new rates appended to rates file like tail -f')
+    parser.add_argument(
+        '--follow-idle-timeout',
+        default=None,
+        help='Stop following when rates file does not grow N seconds',
+        type=float,
+    )
+    parser.add_argument('--telemetry-bot', default=None, help='Replay bid/ask recorded in mysql telemetry of bot')
+    parser.add_argument('--synthetic', default=None, choices=SYNTHETIC_MODELS, help='Backtest synthetic price paths of model')
+    parser.add_argument('--synthetic-paths', default=1, help='Synthetic paths count, every path backtested separately', type=int)
+    parser.add_argument('--synthetic-steps', default=10000, help='Ticks count of every synthetic path', type=int)
+    parser.add_argument('--seed', default=None, help='Random seed of synthetic paths', type=int)
+    parser.add_argument(
+        '--settings-grid',
+        default=None,
+        help='JSON file with list of settings overrides, every item backtested on the same rates in worker processes',
+        type=valid_settings_grid,
+    )
+    parser.add_argument('--workers', default=os.cpu_count() or 1, help='Worker processes for --settings-grid', type=int)
+    parser.add_argument(
+        '--engine',
+        default=REFERENCE_ENGINE,
+        choices=ENGINES,
+        help='Backtest engine: reference tick by tick or vectorized with the same results (basic strategy, no stop loss and liquidation)',
+    )
     args = parser.parse_args()
 
     main(
         use_every_n_tick=args.used_ticks,
         start_date=args.from_date,
         end_date=args.to_date,
+        intrabar_steps=args.intrabar_steps,
+        symbol=args.symbol,
+        interval=args.interval,
+        resample_interval=args.resample,
+        follow=args.follow,
+        follow_idle_timeout=args.follow_idle_timeout,
+        telemetry_bot_name=args.telemetry_bot,
+        synthetic_model=args.synthetic,
+        synthetic_paths=args.synthetic_paths,
+        synthetic_steps=args.synthetic_steps,
+        seed=args.seed,
+        settings_grid=args.settings_grid,
+        workers=args.workers,
+        engine=args.engine,
     )
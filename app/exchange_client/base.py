@@ -21,8 +21,21 @@ class OrderResult:
 
 @dataclass
 class HistoryPrice:
+    price: Decimal  # open rate
+    timestamp: int
+    high: Decimal | None = None
+    low: Decimal | None = None
+    close: Decimal | None = None
+    volume: Decimal | None = None
+
+
+@dataclass
+class AggTrade:
+    trade_id: int
     price: Decimal
+    qty: Decimal
     timestamp: int
+    is_buyer_maker: bool = False
 
 
 class BaseClient(ABC):
@@ -41,6 +54,10 @@ class BaseClient(ABC):
     def get_klines(self, interval: str, start_ms: int, limit: int) -> list[HistoryPrice]:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_agg_trades(self, start_ms: int, end_ms: int, limit: int, from_id: int | None = None) -> list[AggTrade]:
+        raise NotImplementedError
+
     @abstractmethod
     def buy(self, quantity: Decimal, price: Decimal) -> OrderResult | None:
         pass
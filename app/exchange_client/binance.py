@@ -6,13 +6,15 @@ from typing import Generator
 
 from binance.spot import Spot  # type: ignore
 
-from app.exchange_client.base import BaseClient, HistoryPrice, OrderResult
+from app.exchange_client.base import AggTrade, BaseClient, HistoryPrice, OrderResult
 from app.models import Fee, Tick
 
 logger = logging.getLogger(__name__)
 
 
 class Binance(BaseClient):
+    agg_trades_max_window_ms: int = 60 * 60 * 1000
+
     def __init__(
         self,
         symbol: str,
@@ -59,6 +61,34 @@ class Binance(BaseClient):
             HistoryPrice(
                 price=Decimal(line[1]),  # open rate
                 timestamp=line[0],       # Kline open time
+                high=Decimal(line[2]),
+                low=Decimal(line[3]),
+                close=Decimal(line[4]),
+                volume=Decimal(line[5]),
+            )
+            for line in response
+        ]
+
+    def get_agg_trades(self, start_ms: int, end_ms: int, limit: int, from_id: int | None = None) -> list[AggTrade]:
+        if from_id is not None:
+            # binance does not combine fromId with time range
+            response = self._client_spot.agg_trades(symbol=self.symbol, fromId=from_id, limit=limit)
+            response = [line for line in response if int(line['T']) <= end_ms]
+        else:
+            # binance limits aggTrades time window by one hour
+            response = self._client_spot.agg_trades(
+                symbol=self.symbol,
+                startTime=start_ms,
+                endTime=min(end_ms, start_ms + self.agg_trades_max_window_ms - 1),
+                limit=limit,
+            )
+        return [
+            AggTrade(
+                trade_id=int(line['a']),
+                price=Decimal(line['p']),
+                qty=Decimal(line['q']),
+                timestamp=int(line['T']),
+                is_buyer_maker=bool(line['m']),
             )
             for line in response
         ]
@@ -6,7 +6,7 @@ from typing import Generator
 
 from pybit.unified_trading import HTTP  # type: ignore
 
-from app.exchange_client.base import BaseClient, HistoryPrice, OrderResult
+from app.exchange_client.base import AggTrade, BaseClient, HistoryPrice, OrderResult
 from app.models import Fee, Tick
 
 logger = logging.getLogger(__name__)
@@ -75,10 +75,37 @@ class ByBit(BaseClient):
             HistoryPrice(
                 price=Decimal(line[1]),  # open rate
                 timestamp=int(line[0]),  # Kline open time
+                high=Decimal(line[2]),
+                low=Decimal(line[3]),
+                close=Decimal(line[4]),
+                volume=Decimal(line[5]),
             )
             for line in reversed(response.get('result')['list'])
         ]
 
+    def get_agg_trades(self, start_ms: int, end_ms: int, limit: int, from_id: int | None = None) -> list[AggTrade]:
+        """Return public trades in range. ByBit API gives only the most recent trades, not full history."""
+        response = self._exchange_session.get_public_trade_history(
+            category='spot',
+            symbol=self.symbol,
+            limit=limit,
+        )
+        trades = [
+            AggTrade(
+                trade_id=int(line['execId']),
+                price=Decimal(line['price']),
+                qty=Decimal(line['size']),
+                timestamp=int(line['time']),
+                is_buyer_maker=line['side'] == 'Sell',
+            )
+            for line in reversed(response.get('result')['list'])
+        ]
+        return [
+            trade
+            for trade in trades
+            if start_ms <= trade.timestamp <= end_ms and (from_id is None or trade.trade_id >= from_id)
+        ]
+
     def buy(self, quantity: Decimal, price: Decimal, is_gtc: bool = False) -> OrderResult | None:
         price_str = '{:f}'.format(price)
         try:
@@ -2,7 +2,7 @@ from typing import Generator
 
 from _decimal import Decimal
 
-from app.exchange_client.base import BaseClient, HistoryPrice, OrderResult
+from app.exchange_client.base import AggTrade, BaseClient, HistoryPrice, OrderResult
 from app.models import Tick
 
 
@@ -19,6 +19,9 @@ class Dummy(BaseClient):
     def get_klines(self, interval: str, start_ms: int, limit: int) -> list[HistoryPrice]:
         raise NotImplementedError
 
+    def get_agg_trades(self, start_ms: int, end_ms: int, limit: int, from_id: int | None = None) -> list[AggTrade]:
+        raise NotImplementedError
+
     def next_price(self, start_tick_numeration: int = -1) -> Generator[Tick | None, None, None]:
         raise NotImplementedError
 
@@ -4,13 +4,14 @@ from decimal import Decimal
 
 from app.exchange_client.base import OrderResult
 from app.models import Tick
-from app.settings import app_settings
+from app.strategy_config import StrategyConfig, get_strategy_config
 
 logger = logging.getLogger(__file__)
 
 
 class Liquidation:
-    def __init__(self) -> None:
+    def __init__(self, config: StrategyConfig | None = None) -> None:
+        self._config: StrategyConfig = config or get_strategy_config()
         self._is_active: bool = False
         self.tries: int = 0
         self.order_id: str | int | None = None
@@ -18,18 +19,26 @@ class Liquidation:
         self.order_created_at: datetime = datetime.utcnow()
 
     def is_active(self, tick: Tick) -> bool:
-        if not app_settings.liquidation_enabled:
+        if not self._config.liquidation_enabled:
             return False
 
         if self._is_active:
             return True
 
-        if tick.bid > app_settings.liquidation_threshold:
+        if tick.bid > self._config.liquidation_threshold:
             return False
 
         self._is_active = True
         return True
 
+    def get_trigger_price(self) -> Decimal:
+        """Return the highest bid activating liquidation, every bid keeps active liquidation going."""
+        if not self._config.liquidation_enabled:
+            return Decimal('-Infinity')
+        if self._is_active:
+            return Decimal('Infinity')
+        return self._config.liquidation_threshold
+
     def process_order_cancel(self) -> None:
         self.tries += 1
         self.order_id = None
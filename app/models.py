@@ -1,16 +1,32 @@
+from collections.abc import Iterator
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 
+import numpy as np
+import numpy.typing as npt
 
-@dataclass
-class Fee:
+
+class _SlotsPickleMixin:
+    """Unpickle states saved before models got slots: their state is instance __dict__."""
+    __slots__ = ()
+
+    def __setstate__(self, state: dict | tuple[None, dict]) -> None:
+        if isinstance(state, tuple):
+            state = state[1]
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+
+@dataclass(slots=True)
+class Fee(_SlotsPickleMixin):
     qty: Decimal
     ticker: str
 
 
-@dataclass
-class Position:
+@dataclass(slots=True)
+class Position(_SlotsPickleMixin):
     amount: Decimal
 
     open_tick_number: int
@@ -31,8 +47,8 @@ class Position:
         return self.close_tick_number >= 0
 
 
-@dataclass
-class OnHoldPositions:
+@dataclass(slots=True)
+class OnHoldPositions(_SlotsPickleMixin):
     quantity: Decimal
     buy_amount: Decimal
     tick_number: int
@@ -40,7 +56,27 @@ class OnHoldPositions:
 
 
 @dataclass
-class Tick:
+class GridBand:
+    """Buy prices [low, high) of basket with all grid cells filled."""
+    basket_number: int
+    low: Decimal
+    high: Decimal
+
+
+@dataclass
+class PriceTriggers:
+    """Prices where strategy with current open positions may act."""
+    sell_price: Decimal | None  # the lowest minimal sell price, None without open positions
+    filled_grid_numbers: AbstractSet[str]
+    basket_counts: dict[int, int]
+    # current P/L is pl_base + bid * open_quantity
+    pl_base: Decimal
+    open_quantity: Decimal
+    grid_band: GridBand | None = None
+
+
+@dataclass(slots=True)
+class Tick(_SlotsPickleMixin):
     number: int
     bid: Decimal
     ask: Decimal
@@ -53,6 +89,45 @@ class Tick:
         return (self.ask + self.bid) / Decimal(2)
 
 
+@dataclass(slots=True)
+class TickBatch:
+    """Ticks as fixed-point columns, Tick objects are made one by one on reading.
+
+    Ticks are numbered from first_number. Without quantity columns every tick has tick_qty
+    bid and ask quantity. Bid and ask of the same array give the same Decimal price object.
+    """
+    bid: npt.NDArray[np.int64]
+    ask: npt.NDArray[np.int64]
+    price_digits: int
+    tick_qty: Decimal = Decimal(0)
+    bid_qty: npt.NDArray[np.int64] | None = None
+    ask_qty: npt.NDArray[np.int64] | None = None
+    qty_digits: int = 0
+    first_number: int = 0
+
+    def __post_init__(self) -> None:
+        if len(self.bid) != len(self.ask):
+            raise ValueError('bid and ask must have the same length')
+        if (self.bid_qty is None) != (self.ask_qty is None):
+            raise ValueError('bid_qty and ask_qty must be set together')
+
+    def __len__(self) -> int:
+        return len(self.bid)
+
+    def __iter__(self) -> Iterator[Tick]:
+        for row in range(len(self.bid)):
+            yield self.get_tick(row)
+
+    def get_tick(self, row: int) -> Tick:
+        bid = Decimal(int(self.bid[row])).scaleb(-self.price_digits)
+        ask = bid if self.ask is self.bid else Decimal(int(self.ask[row])).scaleb(-self.price_digits)
+        bid_qty = ask_qty = self.tick_qty
+        if self.bid_qty is not None and self.ask_qty is not None:
+            bid_qty = Decimal(int(self.bid_qty[row])).scaleb(-self.qty_digits)
+            ask_qty = Decimal(int(self.ask_qty[row])).scaleb(-self.qty_digits)
+        return Tick(number=self.first_number + row, bid=bid, ask=ask, bid_qty=bid_qty, ask_qty=ask_qty)
+
+
 @dataclass
 class FloatingStep:
     percent: Decimal
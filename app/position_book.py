@@ -0,0 +1,76 @@
+"""Index of open positions maintained on every open and close."""
+from bisect import bisect_left, bisect_right
+from collections.abc import KeysView
+from decimal import Decimal
+
+from app.models import Position
+
+
+class PositionBook:
+    """Open positions ordered by open rate with grid cells and per basket counters.
+
+    Positions with the same open rate keep opening order, as stable sort of open positions list does.
+    """
+
+    def __init__(self, positions: list[Position] | None = None) -> None:
+        self._positions: list[Position] = []
+        self._open_rates: list[Decimal] = []
+        self._grid_counts: dict[str, int] = {}
+        self.basket_counts: dict[int, int] = {}
+
+        for position in positions or []:
+            self.add(position)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @property
+    def grid_numbers(self) -> KeysView[str]:
+        """Filled grid cells, live view."""
+        return self._grid_counts.keys()
+
+    def add(self, position: Position) -> None:
+        index = bisect_right(self._open_rates, position.open_rate)
+        self._open_rates.insert(index, position.open_rate)
+        self._positions.insert(index, position)
+        self._grid_counts[position.grid_number] = self._grid_counts.get(position.grid_number, 0) + 1
+        self.basket_counts[position.basket_number] = self.basket_counts.get(position.basket_number, 0) + 1
+
+    def remove(self, position: Position) -> None:
+        """Remove the position itself or the first one equal to it, ValueError when not found."""
+        first_index = bisect_left(self._open_rates, position.open_rate)
+        last_index = bisect_right(self._open_rates, position.open_rate)
+        candidates = range(first_index, last_index)
+        index = next((num for num in candidates if self._positions[num] is position), None)
+        if index is None:
+            index = next((num for num in candidates if self._positions[num] == position), None)
+        if index is None:
+            raise ValueError('Position not found in position book {0}'.format(position))
+
+        del self._open_rates[index]
+        del self._positions[index]
+        _decrement(self._grid_counts, position.grid_number)
+        _decrement(self.basket_counts, position.basket_number)
+
+    def get_sorted_by_open_rate(self) -> list[Position]:
+        """Return snapshot of positions ordered by open rate, positions may be closed while iterating it."""
+        return list(self._positions)
+
+    def get_lowest_open_rate(self) -> Decimal | None:
+        return self._open_rates[0] if self._open_rates else None
+
+    def get_highest_open_rate(self) -> Decimal | None:
+        return self._open_rates[-1] if self._open_rates else None
+
+    def get_basket_count(self, basket_number: int) -> int:
+        return self.basket_counts.get(basket_number, 0)
+
+    def is_grid_filled(self, grid_number: str) -> bool:
+        return grid_number in self._grid_counts
+
+
+def _decrement(counters: dict, key: str | int) -> None:
+    if counters[key] > 1:
+        counters[key] -= 1
+    else:
+        del counters[key]
@@ -0,0 +1,110 @@
+"""Binary columnar cache of rates csv files.
+
+Every rates file converted once into a set of .npy columns near the source file
+and memory-mapped on the next loads. Cache is rebuilt when source file mtime or size changes.
+Rates store written by sampler is a directory of the same layout and is loaded as is.
+"""
+import json
+import logging
+import os
+
+import numpy as np
+
+from app.rates_utils.columns import PRICE_COLUMNS, RatesColumns, read_csv_columns
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRNAME: str = '.cache'
+CACHE_VERSION: int = 1
+_META_FILENAME: str = 'meta.json'
+_VOLUME_COLUMN: str = 'volume'
+
+
+def get_cache_path(filepath: str) -> str:
+    return os.path.join(
+        os.path.dirname(filepath),
+        CACHE_DIRNAME,
+        os.path.basename(filepath),
+    )
+
+
+def load_rates_columns(filepath: str) -> RatesColumns:
+    """Return memory-mapped rates columns for csv file or rates store, build cache if needed."""
+    if os.path.isdir(filepath):
+        return load_cache(filepath)
+
+    cache_path = get_cache_path(filepath)
+    if not is_cache_actual(filepath, cache_path):
+        logger.info('build rates cache for {0}'.format(filepath))
+        save_cache(cache_path, read_csv_columns(filepath), get_source_signature(filepath))
+
+    return load_cache(cache_path)
+
+
+def is_cache_actual(filepath: str, cache_path: str) -> bool:
+    meta = read_meta(os.path.join(cache_path, _META_FILENAME))
+    if not meta:
+        return False
+
+    return meta.get('version') == CACHE_VERSION and meta.get('source') == get_source_signature(filepath)
+
+
+def save_cache(cache_path: str, columns: RatesColumns, source_signature: dict) -> None:
+    os.makedirs(cache_path, exist_ok=True)
+
+    # meta file is a commit marker: drop it first and write it last
+    meta_path = os.path.join(cache_path, _META_FILENAME)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    for name in ('timestamp', *PRICE_COLUMNS):
+        np.save(os.path.join(cache_path, '{0}.npy'.format(name)), getattr(columns, name))
+    if columns.volume is not None:
+        np.save(os.path.join(cache_path, '{0}.npy'.format(_VOLUME_COLUMN)), columns.volume)
+
+    with open(meta_path, 'w') as fd:
+        json.dump({
+            'version': CACHE_VERSION,
+            'source': source_signature,
+            'price_digits': columns.price_digits,
+            'volume_digits': columns.volume_digits if columns.volume is not None else None,
+            'rows': len(columns),
+        }, fd)
+
+
+def load_cache(cache_path: str) -> RatesColumns:
+    meta = read_meta(os.path.join(cache_path, _META_FILENAME))
+    if not meta:
+        raise RuntimeError('Rates cache not found {0}'.format(cache_path))
+
+    loaded = {
+        name: np.load(os.path.join(cache_path, '{0}.npy'.format(name)), mmap_mode='r')
+        for name in ('timestamp', *PRICE_COLUMNS)
+    }
+    if meta.get('volume_digits') is not None:
+        loaded[_VOLUME_COLUMN] = np.load(os.path.join(cache_path, '{0}.npy'.format(_VOLUME_COLUMN)), mmap_mode='r')
+    return RatesColumns(
+        price_digits=meta['price_digits'],
+        volume_digits=meta.get('volume_digits') or 0,
+        **loaded,
+    )
+
+
+def read_meta(meta_path: str) -> dict | None:
+    try:
+        with open(meta_path) as fd:
+            return json.load(fd)
+    except (OSError, ValueError):
+        return None
+
+
+def get_source_signature(filepath: str) -> dict:
+    """Return source file signature for cache invalidation."""
+    if os.path.isdir(filepath):
+        # rates store: meta file is written last, so it changes on every store rewrite
+        filepath = os.path.join(filepath, _META_FILENAME)
+    stat = os.stat(filepath)
+    return {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }
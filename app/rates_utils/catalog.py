@@ -0,0 +1,306 @@
+"""Catalog of rates files under rates_path.
+
+Every known rates file indexed by exchange/symbol/interval with actual time span,
+rows count and min/max price. Requested range stitched from all overlapped files without duplicates.
+"""
+import json
+import logging
+import os
+import re
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+
+import numpy as np
+
+from app.rates_utils.cache import CACHE_DIRNAME, get_source_signature, load_rates_columns, read_meta
+from app.rates_utils.columns import PRICE_COLUMNS, RatesColumns
+from app.rates_utils.store import is_store
+from app.settings import app_settings
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION: int = 1
+_CATALOG_FILENAME: str = 'catalog.json'
+_EMPTY_RANGES_FILENAME: str = 'empty_ranges.json'
+
+INTERVAL_MS: dict[str, int] = {
+    '1s': 1000,
+    '1m': 60 * 1000,
+    '3m': 3 * 60 * 1000,
+    '5m': 5 * 60 * 1000,
+    '15m': 15 * 60 * 1000,
+    '30m': 30 * 60 * 1000,
+    '1h': 60 * 60 * 1000,
+    '4h': 4 * 60 * 60 * 1000,
+    '1d': 24 * 60 * 60 * 1000,
+}
+
+# sampler output: binance_SOLUSDT_1m_2023-01-01_00-00-00_2023-02-01_00-00-00.csv or the same .rates store
+_sampler_filename_re = re.compile(r'^(?P<exchange>[a-z]+)_(?P<symbol>[A-Z0-9]+)_(?P<interval>\d+[smhd])_.+\.(csv(\.gz|\.xz|\.zst)?|rates)$')
+# tradingview export: BINANCE_SOLUSDT, 60.csv
+_tradingview_filename_re = re.compile(r'^(?P<exchange>[A-Za-z]+)_(?P<symbol>[A-Z0-9]+), (?P<minutes>\d+)\.csv(\.gz|\.xz|\.zst)?$')
+
+
+@dataclass
+class CatalogEntry:
+    filename: str
+    exchange: str
+    symbol: str
+    interval: str
+    first_ms: int
+    last_ms: int
+    rows: int
+    min_price: Decimal
+    max_price: Decimal
+    source: dict
+
+
+def parse_rates_filename(filename: str) -> tuple[str, str, str] | None:
+    """Return (exchange, symbol, interval) by rates filename."""
+    sampler_match = _sampler_filename_re.match(filename)
+    if sampler_match:
+        return sampler_match['exchange'], sampler_match['symbol'], sampler_match['interval']
+
+    tradingview_match = _tradingview_filename_re.match(filename)
+    if tradingview_match:
+        minutes = int(tradingview_match['minutes'])
+        interval = '{0}h'.format(minutes // 60) if not minutes % 60 else '{0}m'.format(minutes)
+        return tradingview_match['exchange'].lower(), tradingview_match['symbol'], interval
+
+    return None
+
+
+def refresh_catalog(rates_path: str | None = None) -> list[CatalogEntry]:
+    """Index new and changed rates files, drop removed ones and return actual catalog."""
+    rates_path = rates_path or app_settings.rates_path
+    catalog_path = os.path.join(rates_path, CACHE_DIRNAME, _CATALOG_FILENAME)
+
+    saved_catalog = read_meta(catalog_path) or {}
+    saved_entries: dict[str, dict] = {}
+    if saved_catalog.get('version') == CATALOG_VERSION:
+        saved_entries = saved_catalog.get('entries', {})
+
+    entries: list[CatalogEntry] = []
+    for filename in sorted(os.listdir(rates_path)):
+        filepath = os.path.join(rates_path, filename)
+        parsed_name = parse_rates_filename(filename)
+        if not parsed_name or not (os.path.isfile(filepath) or is_store(filepath)):
+            continue
+
+        saved_entry = saved_entries.get(filename)
+        if saved_entry and saved_entry['source'] == get_source_signature(filepath):
+            entries.append(_entry_from_json(saved_entry))
+            continue
+
+        logger.info('catalog: index {0}'.format(filename))
+        entry = _build_entry(filepath, *parsed_name)
+        if entry:
+            entries.append(entry)
+
+    os.makedirs(os.path.dirname(catalog_path), exist_ok=True)
+    with open(catalog_path, 'w') as fd:
+        json.dump({
+            'version': CATALOG_VERSION,
+            'entries': {entry.filename: _entry_to_json(entry) for entry in entries},
+        }, fd)
+
+    return entries
+
+
+def find_entries(
+    symbol: str,
+    interval: str,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+    exchange: str | None = None,
+    rates_path: str | None = None,
+) -> list[CatalogEntry]:
+    return [
+        entry
+        for entry in refresh_catalog(rates_path)
+        if entry.symbol == symbol
+        and entry.interval == interval
+        and (not exchange or entry.exchange == exchange)
+        and (start_ms is None or entry.last_ms >= start_ms)
+        and (end_ms is None or entry.first_ms <= end_ms)
+    ]
+
+
+def is_covered(
+    symbol: str,
+    interval: str,
+    start_ms: int,
+    end_ms: int,
+    exchange: str | None = None,
+    rates_path: str | None = None,
+) -> bool:
+    """Check that rates for whole range already downloaded (up to one candle on the edges)."""
+    tolerance_ms = INTERVAL_MS.get(interval, 0)
+    spans = sorted(
+        (entry.first_ms, entry.last_ms)
+        for entry in find_entries(symbol, interval, start_ms, end_ms, exchange, rates_path)
+    )
+
+    covered_until = start_ms - 1
+    for first_ms, last_ms in spans:
+        if first_ms > covered_until + 1 + tolerance_ms:
+            return False
+        covered_until = max(covered_until, last_ms)
+
+    return covered_until + tolerance_ms >= end_ms
+
+
+def load_range(
+    symbol: str,
+    interval: str,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+    exchange: str | None = None,
+    rates_path: str | None = None,
+) -> RatesColumns:
+    """Stitch rates from all overlapped files into one time-sorted columns set without duplicated timestamps."""
+    rates_path = rates_path or app_settings.rates_path
+    parts: list[RatesColumns] = []
+    for entry in find_entries(symbol, interval, start_ms, end_ms, exchange, rates_path):
+        columns = load_rates_columns(os.path.join(rates_path, entry.filename))
+        first_row = 0 if start_ms is None else int(np.searchsorted(columns.timestamp, start_ms, side='left'))
+        last_row = len(columns) if end_ms is None else int(np.searchsorted(columns.timestamp, end_ms, side='right'))
+        parts.append(_slice_columns(columns, first_row, last_row))
+
+    return merge_columns(parts)
+
+
+def get_empty_ranges(
+    symbol: str,
+    interval: str,
+    exchange: str,
+    rates_path: str | None = None,
+) -> list[tuple[int, int]]:
+    """Return [from_ms, to_ms] ranges already confirmed to have no rates on exchange."""
+    empty_ranges = read_meta(_get_empty_ranges_path(rates_path)) or {}
+    return [
+        (int(from_ms), int(to_ms))
+        for from_ms, to_ms in empty_ranges.get(_get_empty_ranges_key(symbol, interval, exchange), [])
+    ]
+
+
+def add_empty_ranges(
+    symbol: str,
+    interval: str,
+    exchange: str,
+    ranges: list[tuple[int, int]],
+    rates_path: str | None = None,
+) -> None:
+    """Remember ranges without rates on exchange, so resume does not request them again."""
+    if not ranges:
+        return
+
+    empty_ranges_path = _get_empty_ranges_path(rates_path)
+    empty_ranges = read_meta(empty_ranges_path) or {}
+    key = _get_empty_ranges_key(symbol, interval, exchange)
+
+    merged_ranges: list[list[int]] = []
+    for from_ms, to_ms in sorted([*map(tuple, empty_ranges.get(key, [])), *ranges]):
+        if merged_ranges and from_ms <= merged_ranges[-1][1] + 1:
+            merged_ranges[-1][1] = max(merged_ranges[-1][1], to_ms)
+        else:
+            merged_ranges.append([from_ms, to_ms])
+    empty_ranges[key] = merged_ranges
+
+    os.makedirs(os.path.dirname(empty_ranges_path), exist_ok=True)
+    with open(empty_ranges_path, 'w') as fd:
+        json.dump(empty_ranges, fd)
+
+
+def merge_columns(parts: list[RatesColumns]) -> RatesColumns:
+    price_digits = max([0, *(part.price_digits for part in parts)])
+    timestamp = np.concatenate([part.timestamp for part in parts] or [np.empty(0, dtype=np.int64)])
+    order = np.argsort(timestamp, kind='stable')
+    timestamp = timestamp[order]
+    is_unique = np.ones(len(timestamp), dtype=bool)
+    is_unique[1:] = np.diff(timestamp) != 0
+
+    prices = {}
+    for name in PRICE_COLUMNS:
+        column = np.concatenate([
+            np.asarray(getattr(part, name), dtype=np.int64) * 10 ** (price_digits - part.price_digits)
+            for part in parts
+        ] or [np.empty(0, dtype=np.int64)])
+        prices[name] = column[order][is_unique]
+
+    # volume survives only when every part has it
+    volume = None
+    volume_digits = max([0, *(part.volume_digits for part in parts)])
+    if parts and all(part.volume is not None for part in parts):
+        volume = np.concatenate([
+            np.asarray(part.volume, dtype=np.int64) * 10 ** (volume_digits - part.volume_digits)
+            for part in parts
+        ])[order][is_unique]
+
+    return RatesColumns(
+        timestamp=timestamp[is_unique],
+        price_digits=price_digits,
+        volume=volume,
+        volume_digits=volume_digits if volume is not None else 0,
+        **prices,
+    )
+
+
+def _slice_columns(columns: RatesColumns, first_row: int, last_row: int) -> RatesColumns:
+    return RatesColumns(
+        timestamp=columns.timestamp[first_row:last_row],
+        open=columns.open[first_row:last_row],
+        high=columns.high[first_row:last_row],
+        low=columns.low[first_row:last_row],
+        close=columns.close[first_row:last_row],
+        price_digits=columns.price_digits,
+        volume=columns.volume[first_row:last_row] if columns.volume is not None else None,
+        volume_digits=columns.volume_digits,
+    )
+
+
+def _build_entry(filepath: str, exchange: str, symbol: str, interval: str) -> CatalogEntry | None:
+    try:
+        columns = load_rates_columns(filepath)
+    except (ValueError, ArithmeticError, IndexError) as exc:
+        logger.warning('catalog: skip invalid rates file {0} {1}'.format(filepath, exc))
+        return None
+
+    if not len(columns):
+        return None
+
+    return CatalogEntry(
+        filename=os.path.basename(filepath),
+        exchange=exchange,
+        symbol=symbol,
+        interval=interval,
+        first_ms=int(columns.timestamp[0]),
+        last_ms=int(columns.timestamp[-1]),
+        rows=len(columns),
+        min_price=columns.to_decimal(columns.low.min()),
+        max_price=columns.to_decimal(columns.high.max()),
+        source=get_source_signature(filepath),
+    )
+
+
+def _get_empty_ranges_path(rates_path: str | None) -> str:
+    return os.path.join(rates_path or app_settings.rates_path, CACHE_DIRNAME, _EMPTY_RANGES_FILENAME)
+
+
+def _get_empty_ranges_key(symbol: str, interval: str, exchange: str) -> str:
+    return '{0}_{1}_{2}'.format(exchange, symbol, interval)
+
+
+def _entry_to_json(entry: CatalogEntry) -> dict:
+    serialized = asdict(entry)
+    serialized['min_price'] = str(entry.min_price)
+    serialized['max_price'] = str(entry.max_price)
+    return serialized
+
+
+def _entry_from_json(serialized: dict) -> CatalogEntry:
+    return CatalogEntry(**{
+        **serialized,
+        'min_price': Decimal(serialized['min_price']),
+        'max_price': Decimal(serialized['max_price']),
+    })
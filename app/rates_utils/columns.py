@@ -0,0 +1,105 @@
+"""Columnar in-memory representation of rates."""
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+
+import numpy as np
+import numpy.typing as npt
+
+from app.rates_utils.compression import open_rates
+
+logger = logging.getLogger(__name__)
+
+PRICE_COLUMNS: tuple[str, ...] = ('open', 'high', 'low', 'close')
+# sampler csv: time,open,high,low,close,volume
+_VOLUME_INDEX: int = len(PRICE_COLUMNS) + 1
+
+
+@dataclass
+class RatesColumns:
+    """Rates as int64 columns: timestamps in ms and fixed-point prices scaled by 10 ** price_digits.
+
+    Volume is optional: only sampler csv files, sampled candles and trades have it.
+    """
+
+    timestamp: npt.NDArray[np.int64]
+    open: npt.NDArray[np.int64]
+    high: npt.NDArray[np.int64]
+    low: npt.NDArray[np.int64]
+    close: npt.NDArray[np.int64]
+    price_digits: int
+    volume: npt.NDArray[np.int64] | None = None
+    volume_digits: int = 0
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def to_decimal(self, price: int) -> Decimal:
+        return Decimal(int(price)).scaleb(-self.price_digits)
+
+
+def parse_rate_time(raw_time: str) -> int:
+    """Return timestamp in ms for rates file time column (wall clock time treated as UTC like backtester does)."""
+    return int(datetime.fromisoformat(raw_time).replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def get_price_digits(prices: list[Decimal]) -> int:
+    return max([0, *(-int(price.as_tuple().exponent) for price in prices)])
+
+
+def to_fixed_point(prices: list[Decimal], price_digits: int) -> npt.NDArray[np.int64]:
+    return np.array(
+        [int(price.scaleb(price_digits)) for price in prices],
+        dtype=np.int64,
+    )
+
+
+def read_csv_columns(filepath: str) -> RatesColumns:
+    """Parse plain or compressed rates csv file (time,open[,high,low,close[,volume]]) into columns."""
+    timestamps: list[int] = []
+    prices: dict[str, list[Decimal]] = {name: [] for name in PRICE_COLUMNS}
+    volumes: list[Decimal] = []
+    has_volume: bool = False
+
+    with open_rates(filepath) as fd:
+        for num, line in enumerate(fd):
+            if not num:
+                header = line.rstrip('\n').split(',')
+                has_volume = len(header) > _VOLUME_INDEX and header[_VOLUME_INDEX] == 'volume'
+                continue
+            if not line.strip():
+                continue
+
+            values = line.rstrip('\n').split(',')
+            try:
+                timestamp = parse_rate_time(values[0])
+                row_prices = [Decimal(values[1])]
+                for column_index in range(2, len(PRICE_COLUMNS) + 1):
+                    row_prices.append(Decimal(values[column_index]) if len(values) > column_index else row_prices[0])
+                row_volume = Decimal(values[_VOLUME_INDEX]) if has_volume else None
+            except (ValueError, IndexError, InvalidOperation):
+                if line.endswith('\n'):
+                    raise
+                # last line partially written by interrupted sampler
+                logger.warning('skip broken last line of {0}: {1!r}'.format(filepath, line))
+                break
+
+            timestamps.append(timestamp)
+            for name, price in zip(PRICE_COLUMNS, row_prices):
+                prices[name].append(price)
+            if row_volume is not None:
+                volumes.append(row_volume)
+
+    price_digits = max(get_price_digits(column) for column in prices.values())
+    volume_digits = get_price_digits(volumes)
+    return RatesColumns(
+        timestamp=np.array(timestamps, dtype=np.int64),
+        open=to_fixed_point(prices['open'], price_digits),
+        high=to_fixed_point(prices['high'], price_digits),
+        low=to_fixed_point(prices['low'], price_digits),
+        close=to_fixed_point(prices['close'], price_digits),
+        price_digits=price_digits,
+        volume=to_fixed_point(volumes, volume_digits) if has_volume else None,
+        volume_digits=volume_digits if has_volume else 0,
+    )
@@ -0,0 +1,32 @@
+"""Transparent streaming (de)compression of rates files by file extension."""
+import gzip
+import lzma
+import os
+from typing import IO, Any, cast
+
+COMPRESSION_EXTENSIONS: dict[str, str] = {
+    'gzip': '.gz',
+    'xz': '.xz',
+    'zstd': '.zst',
+}
+
+
+def is_compressed(filepath: str) -> bool:
+    return os.path.splitext(filepath)[1] in COMPRESSION_EXTENSIONS.values()
+
+
+def open_rates(filepath: str, mode: str = 'rt') -> IO[Any]:
+    """Open plain, .gz, .xz or .zst rates file. Compressed data is streamed, never loaded whole."""
+    extension = os.path.splitext(filepath)[1]
+    if extension == COMPRESSION_EXTENSIONS['gzip']:
+        return cast(IO[Any], gzip.open(filepath, mode))
+
+    if extension == COMPRESSION_EXTENSIONS['xz']:
+        return lzma.open(filepath, mode)
+
+    if extension == COMPRESSION_EXTENSIONS['zstd']:
+        import zstandard  # noqa: WPS433
+
+        return zstandard.open(filepath, mode)
+
+    return open(filepath, mode)
@@ -0,0 +1,50 @@
+"""Follow live-appending rates file like `tail -f`."""
+import logging
+import time
+from typing import Callable, Generator
+
+from app.rates_utils.compression import is_compressed
+
+logger = logging.getLogger(__name__)
+
+
+def follow_rates_lines(
+    filepath: str,
+    poll_interval: float = 1.0,
+    idle_timeout: float | None = None,
+    on_idle: Callable[[], None] | None = None,
+) -> Generator[tuple[int, str], None, None]:
+    """Yield (line number, line) of rates file and wait for new lines appended to it.
+
+    Partially written last line is held until its line break arrives.
+    Stop when file does not grow idle_timeout seconds (follow forever by default).
+    on_idle is called on every poll while waiting for new lines.
+    """
+    if is_compressed(filepath):
+        raise ValueError('Compressed rates file can not be followed {0}'.format(filepath))
+
+    num = 0
+    pending_line = ''
+    last_activity = time.monotonic()
+    with open(filepath) as fd:
+        while True:
+            chunk = fd.readline()
+            if chunk:
+                last_activity = time.monotonic()
+                pending_line += chunk
+                if not pending_line.endswith('\n'):
+                    continue
+
+                line, pending_line = pending_line, ''
+                if num and line.strip():
+                    yield num, line
+                num += 1
+                continue
+
+            if idle_timeout is not None and time.monotonic() - last_activity >= idle_timeout:
+                logger.info('stop following {0}: no new rates for {1}s'.format(filepath, idle_timeout))
+                return
+
+            if on_idle:
+                on_idle()
+            time.sleep(poll_interval)
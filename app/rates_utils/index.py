@@ -0,0 +1,105 @@
+"""Sparse timestamp index of rates csv files for fast date range seeks.
+
+Index keeps (timestamp, byte offset, line number) of every INDEX_STEP-th line,
+so reader can binary-search to the range start and stop right after the range end.
+Compressed files can't be seeked, they are streamed from the start and stopped after the range end.
+Rates in file must be sorted from old to new.
+"""
+import json
+import logging
+import os
+from typing import Generator
+
+import numpy as np
+import numpy.typing as npt
+
+from app.rates_utils.cache import get_cache_path, get_source_signature, read_meta
+from app.rates_utils.columns import parse_rate_time
+from app.rates_utils.compression import is_compressed, open_rates
+
+logger = logging.getLogger(__name__)
+
+INDEX_STEP: int = 1024
+INDEX_VERSION: int = 1
+_INDEX_FILENAME: str = 'offsets.npy'
+_INDEX_META_FILENAME: str = 'offsets.json'
+
+
+def iter_rates_lines(
+    filepath: str,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+) -> Generator[tuple[int, str], None, None]:
+    """Yield (line number, line) of rates file, only lines in [start_ms, end_ms] when range passed."""
+    if start_ms is None or end_ms is None:
+        with open_rates(filepath) as fd:
+            for num, line in enumerate(fd):
+                if num and line.strip():
+                    yield num, line
+        return
+
+    if is_compressed(filepath):
+        with open_rates(filepath) as fd:
+            for num, line in enumerate(fd):
+                if not num or not line.strip():
+                    continue
+
+                tick_ms = parse_rate_time(line.split(',', 1)[0])
+                if tick_ms > end_ms:
+                    break
+                if tick_ms >= start_ms:
+                    yield num, line
+        return
+
+    index = load_offsets_index(filepath)
+    entry = max(0, int(np.searchsorted(index[:, 0], start_ms, side='left')) - 1)
+    offset, num = (int(index[entry, 1]), int(index[entry, 2])) if len(index) else (0, 0)
+
+    with open(filepath, 'rb') as fd:
+        fd.seek(offset)
+        for raw_line in fd:
+            line = raw_line.decode()
+            line_num = num
+            num += 1
+            if not line_num or not line.strip():
+                continue
+
+            tick_ms = parse_rate_time(line.split(',', 1)[0])
+            if tick_ms < start_ms:
+                continue
+            if tick_ms > end_ms:
+                break
+            yield line_num, line
+
+
+def load_offsets_index(filepath: str) -> npt.NDArray[np.int64]:
+    """Return (timestamp, byte offset, line number) rows of sparse index, build index if needed."""
+    cache_path = get_cache_path(filepath)
+    index_path = os.path.join(cache_path, _INDEX_FILENAME)
+    meta_path = os.path.join(cache_path, _INDEX_META_FILENAME)
+
+    meta = read_meta(meta_path)
+    if not meta or meta.get('version') != INDEX_VERSION or meta.get('source') != get_source_signature(filepath):
+        logger.info('build rates index for {0}'.format(filepath))
+        source_signature = get_source_signature(filepath)
+        os.makedirs(cache_path, exist_ok=True)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        np.save(index_path, build_offsets_index(filepath))
+        with open(meta_path, 'w') as fd:
+            json.dump({'version': INDEX_VERSION, 'source': source_signature}, fd)
+
+    return np.load(index_path)
+
+
+def build_offsets_index(filepath: str, step: int = INDEX_STEP) -> npt.NDArray[np.int64]:
+    rows: list[tuple[int, int, int]] = []
+    offset = 0
+    with open(filepath, 'rb') as fd:
+        for num, raw_line in enumerate(fd):
+            if num and (num - 1) % step == 0 and raw_line.strip():
+                rows.append((parse_rate_time(raw_line.decode().split(',', 1)[0]), offset, num))
+            offset += len(raw_line)
+
+    return np.array(rows, dtype=np.int64).reshape(-1, 3)
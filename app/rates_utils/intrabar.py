@@ -0,0 +1,51 @@
+"""Synthetic intrabar price path from OHLC candles.
+
+Every candle expands into deterministic path O -> L -> H -> C for bullish candle
+and O -> H -> L -> C for bearish one, every leg linearly split into steps_per_leg ticks.
+"""
+import numpy as np
+import numpy.typing as npt
+
+LEGS_PER_CANDLE: int = 3
+
+
+def expand_ohlc(
+    timestamp: npt.NDArray[np.int64],
+    open_price: npt.NDArray[np.int64],
+    high_price: npt.NDArray[np.int64],
+    low_price: npt.NDArray[np.int64],
+    close_price: npt.NDArray[np.int64],
+    steps_per_leg: int = 1,
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Return (timestamps, fixed-point prices) of intrabar path, 3 * steps_per_leg + 1 ticks per candle."""
+    if steps_per_leg < 1:
+        raise ValueError('steps_per_leg must be positive')
+
+    candles_count = len(timestamp)
+    points_per_candle = LEGS_PER_CANDLE * steps_per_leg + 1
+    if not candles_count:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    is_bullish = close_price >= open_price
+    anchors = np.stack([
+        open_price,
+        np.where(is_bullish, low_price, high_price),
+        np.where(is_bullish, high_price, low_price),
+        close_price,
+    ], axis=1).astype(np.float64)
+
+    fractions = np.arange(steps_per_leg, dtype=np.float64) / steps_per_leg
+    legs_start = anchors[:, :-1, np.newaxis]
+    legs_end = anchors[:, 1:, np.newaxis]
+    path = (legs_start + (legs_end - legs_start) * fractions).reshape(candles_count, -1)
+    path = np.concatenate([path, anchors[:, -1:]], axis=1)
+    prices = np.rint(path).astype(np.int64).ravel()
+
+    durations = np.zeros(candles_count, dtype=np.int64)
+    if candles_count > 1:
+        durations[:-1] = np.diff(timestamp)
+        durations[-1] = durations[-2]
+    offsets = durations[:, np.newaxis] * np.arange(points_per_candle, dtype=np.int64) // points_per_candle
+    timestamps = (timestamp[:, np.newaxis] + offsets).ravel()
+
+    return timestamps, prices
@@ -0,0 +1,93 @@
+"""Background recorder of live ticks into rotating binary ticks files."""
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+
+from app.models import Tick
+from app.rates_utils.ticks import TICKS_EXTENSION, TicksWriter
+from app.settings import app_settings
+
+logger = logging.getLogger(__name__)
+
+
+class TickRecorder:
+    """Record ticks without blocking tick loop: record() only enqueues, writer thread flushes chunks periodically.
+
+    Every rotate_seconds period written into own file named by period start:
+    binance_SOLUSDT_ticks_2024-03-01_00-00-00.ticks
+    """
+
+    def __init__(
+        self,
+        exchange: str,
+        symbol: str,
+        rates_path: str | None = None,
+        flush_seconds: float = 60,
+        rotate_seconds: int = 24 * 60 * 60,
+    ) -> None:
+        self._exchange = exchange
+        self._symbol = symbol
+        self._rates_path = rates_path or app_settings.rates_path
+        self._flush_seconds = flush_seconds
+        self._rotate_seconds = rotate_seconds
+
+        self._queue: queue.SimpleQueue[tuple[int, Tick] | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name='tick-recorder', daemon=True)
+        self._thread.start()
+
+    def record(self, tick: Tick, timestamp: int | None = None) -> None:
+        if timestamp is None:
+            timestamp = int(time.time() * 1000)
+        self._queue.put((timestamp, tick))
+
+    def close(self) -> None:
+        """Flush recorded ticks and stop writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def get_filepath(self, timestamp: int) -> str:
+        period_start = timestamp // 1000 // self._rotate_seconds * self._rotate_seconds
+        return os.path.join(
+            self._rates_path,
+            '{0}_{1}_ticks_{2}{3}'.format(
+                self._exchange,
+                self._symbol,
+                datetime.fromtimestamp(period_start, tz=timezone.utc).strftime('%Y-%m-%d_%H-%M-%S'),
+                TICKS_EXTENSION,
+            ),
+        )
+
+    def _run(self) -> None:
+        buffer: list[tuple[int, Tick]] = []
+        flush_at = time.monotonic() + self._flush_seconds
+        is_closed = False
+        while not is_closed:
+            try:
+                item = self._queue.get(timeout=max(flush_at - time.monotonic(), 0))
+                if item is None:
+                    is_closed = True
+                else:
+                    buffer.append(item)
+            except queue.Empty:
+                pass
+
+            if is_closed or time.monotonic() >= flush_at:
+                self._flush(buffer)
+                buffer = []
+                flush_at = time.monotonic() + self._flush_seconds
+
+    def _flush(self, buffer: list[tuple[int, Tick]]) -> None:
+        # chunk never crosses file rotation border
+        chunks: dict[str, list[tuple[int, Tick]]] = {}
+        for timestamp, tick in buffer:
+            chunks.setdefault(self.get_filepath(timestamp), []).append((timestamp, tick))
+
+        for filepath, chunk in chunks.items():
+            try:
+                with TicksWriter(filepath) as writer:
+                    writer.write(chunk)
+            except (OSError, ArithmeticError, ValueError) as exc:
+                logger.exception('tick recorder: lost {0} ticks for {1} {2}'.format(len(chunk), filepath, exc))
@@ -0,0 +1,44 @@
+"""Time-based resampling of rates into bigger intervals with OHLC semantics."""
+import logging
+import os
+
+import numpy as np
+
+from app.rates_utils.cache import get_cache_path, get_source_signature, is_cache_actual, load_cache, load_rates_columns, save_cache
+from app.rates_utils.catalog import INTERVAL_MS
+from app.rates_utils.columns import RatesColumns
+
+logger = logging.getLogger(__name__)
+
+
+def resample(columns: RatesColumns, interval: str) -> RatesColumns:
+    """Aggregate time-sorted rates into interval buckets: first open, max high, min low, last close, sum volume."""
+    interval_ms = INTERVAL_MS[interval]
+    if not len(columns):
+        return columns
+
+    buckets = np.asarray(columns.timestamp) // interval_ms * interval_ms
+    starts = np.flatnonzero(np.concatenate([[True], buckets[1:] != buckets[:-1]]))
+    ends = np.concatenate([starts[1:], [len(buckets)]]) - 1
+
+    return RatesColumns(
+        timestamp=buckets[starts],
+        open=np.asarray(columns.open)[starts],
+        high=np.maximum.reduceat(np.asarray(columns.high), starts),
+        low=np.minimum.reduceat(np.asarray(columns.low), starts),
+        close=np.asarray(columns.close)[ends],
+        price_digits=columns.price_digits,
+        volume=np.add.reduceat(np.asarray(columns.volume), starts) if columns.volume is not None else None,
+        volume_digits=columns.volume_digits,
+    )
+
+
+def load_resampled_columns(filepath: str, interval: str) -> RatesColumns:
+    """Return memory-mapped rates of file resampled to interval, cached per (file, interval)."""
+    cache_path = os.path.join(get_cache_path(filepath), 'resampled_{0}'.format(interval))
+    if not is_cache_actual(filepath, cache_path):
+        logger.info('build resampled {0} rates cache for {1}'.format(interval, filepath))
+        source_signature = get_source_signature(filepath)
+        save_cache(cache_path, resample(load_rates_columns(filepath), interval), source_signature)
+
+    return load_cache(cache_path)
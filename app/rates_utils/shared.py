@@ -0,0 +1,93 @@
+"""Rates columns in shared memory for backtest worker processes.
+
+Owner process copies rates columns once into one shared memory block, workers attach
+to it by picklable handle and get read-only numpy views without copying.
+"""
+import os
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+
+import numpy as np
+
+from app.rates_utils.columns import PRICE_COLUMNS, RatesColumns
+
+_COLUMN_BYTES: int = np.dtype(np.int64).itemsize
+
+# keep attached blocks open while worker views are alive
+_attached_memory: dict[str, SharedMemory] = {}
+
+
+@dataclass(frozen=True)
+class SharedRatesHandle:
+    name: str
+    owner_pid: int
+    rows: int
+    price_digits: int
+    volume_digits: int | None = None  # None when rates have no volume
+
+
+class SharedRates:
+    """Shared memory block with rates columns, block is removed on close."""
+
+    def __init__(self, columns: RatesColumns) -> None:
+        names = _get_column_names(columns.volume is not None)
+        rows = len(columns)
+        self._memory = SharedMemory(create=True, size=max(rows * _COLUMN_BYTES * len(names), 1))
+        for num, name in enumerate(names):
+            view = np.ndarray((rows,), dtype=np.int64, buffer=self._memory.buf, offset=num * rows * _COLUMN_BYTES)
+            view[:] = getattr(columns, name)
+            del view
+
+        self.handle = SharedRatesHandle(
+            name=self._memory.name,
+            owner_pid=os.getpid(),
+            rows=rows,
+            price_digits=columns.price_digits,
+            volume_digits=columns.volume_digits if columns.volume is not None else None,
+        )
+
+    def __enter__(self) -> 'SharedRates':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._memory.close()
+        self._memory.unlink()
+
+
+def attach_rates(handle: SharedRatesHandle) -> RatesColumns:
+    """Return read-only rates columns backed by shared memory block of handle."""
+    memory = _attached_memory.get(handle.name)
+    if memory is None:
+        memory = SharedMemory(name=handle.name)
+        # owner and its child processes share one resource tracker which removes the block after owner,
+        # foreign process must not remove the block on its exit
+        if handle.owner_pid not in (os.getpid(), os.getppid()):
+            resource_tracker.unregister(memory._name, 'shared_memory')  # type: ignore[attr-defined]
+        _attached_memory[handle.name] = memory
+
+    names = _get_column_names(handle.volume_digits is not None)
+    views = {}
+    for num, name in enumerate(names):
+        view = np.ndarray((handle.rows,), dtype=np.int64, buffer=memory.buf, offset=num * handle.rows * _COLUMN_BYTES)
+        view.flags.writeable = False
+        views[name] = view
+
+    return RatesColumns(
+        price_digits=handle.price_digits,
+        volume_digits=handle.volume_digits or 0,
+        **views,
+    )
+
+
+def _get_column_names(has_volume: bool) -> tuple[str, ...]:
+    return ('timestamp', *PRICE_COLUMNS, *(('volume',) if has_volume else ()))
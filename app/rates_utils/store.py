@@ -0,0 +1,56 @@
+"""Binary columnar rates store written by sampler.
+
+Store is a directory of .npy OHLCV columns with meta file, the same layout as rates cache,
+so backtester memory-maps it directly without any csv formatting and parsing.
+"""
+import os
+import shutil
+
+import numpy as np
+
+from app.exchange_client.base import HistoryPrice
+from app.rates_utils.cache import save_cache
+from app.rates_utils.columns import RatesColumns, get_price_digits, to_fixed_point
+
+STORE_EXTENSION: str = '.rates'
+
+
+def is_store(filepath: str) -> bool:
+    return filepath.endswith(STORE_EXTENSION) and os.path.isdir(filepath)
+
+
+def save_store(store_path: str, columns: RatesColumns) -> None:
+    """Write rates store into temporary directory and swap it in place of the old one."""
+    tmp_path = os.path.join(os.path.dirname(store_path), '.tmp_{0}'.format(os.path.basename(store_path)))
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    save_cache(tmp_path, columns, {'store': True})
+
+    shutil.rmtree(store_path, ignore_errors=True)
+    os.replace(tmp_path, store_path)
+
+
+def history_to_columns(rates: list[HistoryPrice]) -> RatesColumns:
+    """Convert exchange candles into rates columns, candles with open rate only become flat."""
+    opens = [rate.price for rate in rates]
+    highs = [rate.price if rate.high is None else rate.high for rate in rates]
+    lows = [rate.price if rate.low is None else rate.low for rate in rates]
+    closes = [rate.price if rate.close is None else rate.close for rate in rates]
+    price_digits = max(get_price_digits(column) for column in (opens, highs, lows, closes))
+
+    volume = None
+    volume_digits = 0
+    if rates and all(rate.volume is not None for rate in rates):
+        volumes = [rate.volume.normalize() for rate in rates if rate.volume is not None]
+        volume_digits = get_price_digits(volumes)
+        volume = to_fixed_point(volumes, volume_digits)
+
+    return RatesColumns(
+        timestamp=np.array([rate.timestamp for rate in rates], dtype=np.int64),
+        open=to_fixed_point(opens, price_digits),
+        high=to_fixed_point(highs, price_digits),
+        low=to_fixed_point(lows, price_digits),
+        close=to_fixed_point(closes, price_digits),
+        price_digits=price_digits,
+        volume=volume,
+        volume_digits=volume_digits,
+    )
@@ -0,0 +1,140 @@
+"""Vectorized synthetic price paths for stress backtests.
+
+Every generator is seeded and returns float64 prices shaped (paths, steps + 1),
+one row per path, every row starts with start_price.
+"""
+from typing import Callable
+
+import numpy as np
+import numpy.typing as npt
+
+from app.rates_utils.columns import RatesColumns
+
+SYNTHETIC_MODELS: tuple[str, ...] = ('gbm', 'jump', 'regime', 'bootstrap')
+
+
+def generate_gbm(
+    paths: int,
+    steps: int,
+    start_price: float,
+    drift: float = 0.0,
+    volatility: float = 0.001,
+    seed: int | None = None,
+) -> npt.NDArray[np.float64]:
+    """Geometric brownian motion, drift and volatility are per step."""
+    rng = np.random.default_rng(seed)
+    log_returns = drift - volatility ** 2 / 2 + volatility * rng.standard_normal((paths, steps))
+    return _to_prices(start_price, log_returns)
+
+
+def generate_jump_diffusion(
+    paths: int,
+    steps: int,
+    start_price: float,
+    drift: float = 0.0,
+    volatility: float = 0.001,
+    jump_intensity: float = 0.001,
+    jump_mean: float = -0.02,
+    jump_std: float = 0.03,
+    seed: int | None = None,
+) -> npt.NDArray[np.float64]:
+    """Merton jump-diffusion: GBM with poisson jumps of normal log size (crashes with default negative jump_mean)."""
+    rng = np.random.default_rng(seed)
+    diffusion = volatility * rng.standard_normal((paths, steps))
+    jumps_count = rng.poisson(jump_intensity, (paths, steps))
+    jumps = jumps_count * jump_mean + np.sqrt(jumps_count) * jump_std * rng.standard_normal((paths, steps))
+    # keep expected drift the same as without jumps
+    compensator = jump_intensity * (np.exp(jump_mean + jump_std ** 2 / 2) - 1)
+    log_returns = drift - volatility ** 2 / 2 - compensator + diffusion + jumps
+    return _to_prices(start_price, log_returns)
+
+
+def generate_regime_switching(
+    paths: int,
+    steps: int,
+    start_price: float,
+    drifts: tuple[float, ...] = (0.0002, -0.0005, 0.0),
+    volatilities: tuple[float, ...] = (0.0005, 0.003, 0.001),
+    switch_probability: float = 0.001,
+    seed: int | None = None,
+) -> npt.NDArray[np.float64]:
+    """GBM with drift and volatility of current regime (default: calm growth, crash, chop).
+
+    Every step regime switches with switch_probability to one of the other regimes.
+    """
+    if len(drifts) != len(volatilities):
+        raise ValueError('drifts and volatilities must have the same regimes count')
+
+    rng = np.random.default_rng(seed)
+    regimes_count = len(drifts)
+    first_regimes = rng.integers(0, regimes_count, (paths, 1))
+    switches = (rng.random((paths, steps)) < switch_probability) * rng.integers(1, max(regimes_count, 2), (paths, steps))
+    regimes = (first_regimes + np.cumsum(switches, axis=1)) % regimes_count
+
+    drift = np.asarray(drifts, dtype=np.float64)[regimes]
+    volatility = np.asarray(volatilities, dtype=np.float64)[regimes]
+    log_returns = drift - volatility ** 2 / 2 + volatility * rng.standard_normal((paths, steps))
+    return _to_prices(start_price, log_returns)
+
+
+def generate_block_bootstrap(
+    log_returns: npt.NDArray[np.float64],
+    paths: int,
+    steps: int,
+    start_price: float,
+    block_size: int = 60,
+    seed: int | None = None,
+) -> npt.NDArray[np.float64]:
+    """Glue random blocks of historical log returns, blocks keep volatility clustering of history."""
+    if len(log_returns) < block_size:
+        raise ValueError('Not enough history for block size {0}: {1} returns'.format(block_size, len(log_returns)))
+
+    rng = np.random.default_rng(seed)
+    blocks_count = -(-steps // block_size)
+    block_starts = rng.integers(0, len(log_returns) - block_size + 1, (paths, blocks_count))
+    rows = (block_starts[:, :, np.newaxis] + np.arange(block_size)).reshape(paths, -1)[:, :steps]
+    return _to_prices(start_price, np.asarray(log_returns, dtype=np.float64)[rows])
+
+
+# models generated from parameters only, bootstrap needs history
+PATH_GENERATORS: dict[str, Callable[..., npt.NDArray[np.float64]]] = {
+    'gbm': generate_gbm,
+    'jump': generate_jump_diffusion,
+    'regime': generate_regime_switching,
+}
+
+
+def get_log_returns(columns: RatesColumns) -> npt.NDArray[np.float64]:
+    """Return log returns of close prices (fixed-point scale does not matter for returns)."""
+    close = np.asarray(columns.close, dtype=np.float64)
+    return np.diff(np.log(close))
+
+
+def paths_to_columns(
+    prices: npt.NDArray[np.float64],
+    price_digits: int,
+    start_ms: int = 0,
+    interval_ms: int = 1000,
+) -> list[RatesColumns]:
+    """Round synthetic paths to fixed-point rates columns, one flat candle per step."""
+    fixed_prices = np.maximum(np.rint(prices * 10 ** price_digits).astype(np.int64), 1)
+    timestamp = start_ms + np.arange(prices.shape[1], dtype=np.int64) * interval_ms
+    return [
+        RatesColumns(
+            timestamp=timestamp,
+            open=path,
+            high=path,
+            low=path,
+            close=path,
+            price_digits=price_digits,
+        )
+        for path in fixed_prices
+    ]
+
+
+def _to_prices(start_price: float, log_returns: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    log_prices = np.concatenate([
+        np.zeros((log_returns.shape[0], 1)),
+        np.cumsum(log_returns, axis=1),
+    ], axis=1)
+    return start_price * np.exp(log_prices)
@@ -0,0 +1,174 @@
+"""Compact binary storage of recorded bid/ask ticks.
+
+Same chunked layout as trades file: header followed by independent chunks, one chunk per recorder flush:
+chunk header (rows, payload size, price digits, qty digits, first timestamp)
+and zlib-compressed int64 payload of delta-encoded timestamps, delta-encoded
+fixed-point bid and ask prices and fixed-point bid and ask quantities.
+"""
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from decimal import Decimal
+from types import TracebackType
+
+import numpy as np
+import numpy.typing as npt
+
+from app.models import Tick, TickBatch
+from app.rates_utils.columns import get_price_digits, to_fixed_point
+
+TICKS_EXTENSION: str = '.ticks'
+
+_MAGIC: bytes = b'BTTK'
+_VERSION: int = 1
+_file_header = struct.Struct('<4sH')
+_chunk_header = struct.Struct('<IIbbq')
+
+
+@dataclass
+class TicksColumns:
+    timestamp: npt.NDArray[np.int64]
+    bid: npt.NDArray[np.int64]
+    ask: npt.NDArray[np.int64]
+    bid_qty: npt.NDArray[np.int64]
+    ask_qty: npt.NDArray[np.int64]
+    price_digits: int
+    qty_digits: int
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def to_decimal(self, value: int, digits: int) -> Decimal:
+        return Decimal(int(value)).scaleb(-digits)
+
+    def to_tick_batch(self, rows: slice = slice(None)) -> TickBatch:
+        """Return ticks of rows numbered from 0, rows slice is a view of columns."""
+        return TickBatch(
+            bid=self.bid[rows],
+            ask=self.ask[rows],
+            price_digits=self.price_digits,
+            bid_qty=self.bid_qty[rows],
+            ask_qty=self.ask_qty[rows],
+            qty_digits=self.qty_digits,
+        )
+
+
+class TicksWriter:
+    """Append timestamped ticks to binary ticks file chunk by chunk."""
+
+    def __init__(self, filepath: str) -> None:
+        self._fd = open(filepath, 'ab')
+        # killed recorder leaves partial chunk at file end, chunks appended after it would be unreadable
+        complete_size = _get_complete_size(filepath)
+        if complete_size < self._fd.tell():
+            self._fd.truncate(complete_size)
+        if not complete_size:
+            self._fd.write(_file_header.pack(_MAGIC, _VERSION))
+
+    def __enter__(self) -> 'TicksWriter':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def write(self, ticks: list[tuple[int, Tick]]) -> None:
+        """Write chunk of (timestamp ms, tick) pairs."""
+        if not ticks:
+            return
+
+        prices = [tick.bid for _, tick in ticks] + [tick.ask for _, tick in ticks]
+        quantities = [tick.bid_qty for _, tick in ticks] + [tick.ask_qty for _, tick in ticks]
+        price_digits = get_price_digits(prices)
+        qty_digits = get_price_digits(quantities)
+
+        timestamps = np.array([timestamp for timestamp, _ in ticks], dtype=np.int64)
+        bid, ask = to_fixed_point(prices, price_digits).reshape(2, -1)
+        payload = zlib.compress(np.concatenate([
+            np.diff(timestamps, prepend=timestamps[0]),
+            np.diff(bid, prepend=0),
+            np.diff(ask, prepend=0),
+            to_fixed_point(quantities, qty_digits),
+        ]).tobytes())
+
+        self._fd.write(_chunk_header.pack(len(ticks), len(payload), price_digits, qty_digits, timestamps[0]))
+        self._fd.write(payload)
+        self._fd.flush()
+
+    def close(self) -> None:
+        self._fd.close()
+
+
+def _get_complete_size(filepath: str) -> int:
+    """Return size of file header and complete chunks, 0 for file without complete header."""
+    file_size = os.path.getsize(filepath)
+    with open(filepath, 'rb') as fd:
+        raw_file_header = fd.read(_file_header.size)
+        if len(raw_file_header) < _file_header.size:
+            return 0
+        magic, version = _file_header.unpack(raw_file_header)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('Unknown ticks file format {0}'.format(filepath))
+
+        complete_size = _file_header.size
+        while len(raw_header := fd.read(_chunk_header.size)) == _chunk_header.size:
+            payload_size = _chunk_header.unpack(raw_header)[1]
+            if complete_size + _chunk_header.size + payload_size > file_size:
+                break
+            complete_size += _chunk_header.size + payload_size
+            fd.seek(complete_size)
+    return complete_size
+
+
+def read_ticks(filepath: str) -> TicksColumns:
+    chunks: list[tuple[npt.NDArray[np.int64], ...]] = []
+    chunks_digits: list[tuple[int, int]] = []
+
+    with open(filepath, 'rb') as fd:
+        magic, version = _file_header.unpack(fd.read(_file_header.size))
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('Unknown ticks file format {0}'.format(filepath))
+
+        while raw_header := fd.read(_chunk_header.size):
+            if len(raw_header) < _chunk_header.size:
+                break  # truncated by killed recorder
+
+            rows, payload_size, price_digits, qty_digits, first_timestamp = _chunk_header.unpack(raw_header)
+            raw_payload = fd.read(payload_size)
+            if len(raw_payload) < payload_size:
+                break
+
+            payload = np.frombuffer(zlib.decompress(raw_payload), dtype=np.int64).reshape(5, rows)
+            chunks.append((
+                first_timestamp + np.cumsum(payload[0]),
+                np.cumsum(payload[1]),
+                np.cumsum(payload[2]),
+                payload[3],
+                payload[4],
+            ))
+            chunks_digits.append((price_digits, qty_digits))
+
+    price_digits = max([0, *(digits[0] for digits in chunks_digits)])
+    qty_digits = max([0, *(digits[1] for digits in chunks_digits)])
+    empty = np.empty(0, dtype=np.int64)
+
+    def _join(column: int, digits_index: int, target_digits: int) -> npt.NDArray[np.int64]:
+        return np.concatenate([
+            chunk[column] * 10 ** (target_digits - digits[digits_index])
+            for chunk, digits in zip(chunks, chunks_digits)
+        ] or [empty])
+
+    return TicksColumns(
+        timestamp=np.concatenate([chunk[0] for chunk in chunks] or [empty]),
+        bid=_join(1, 0, price_digits),
+        ask=_join(2, 0, price_digits),
+        bid_qty=_join(3, 1, qty_digits),
+        ask_qty=_join(4, 1, qty_digits),
+        price_digits=price_digits,
+        qty_digits=qty_digits,
+    )
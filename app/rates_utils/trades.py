@@ -0,0 +1,135 @@
+"""Compact binary storage of aggregated trades.
+
+File is a header followed by independent chunks, one chunk per sampler batch:
+chunk header (rows, payload size, price digits, qty digits, first timestamp)
+and zlib-compressed int64 payload of delta-encoded timestamps, delta-encoded
+fixed-point prices and fixed-point quantities.
+"""
+import struct
+import zlib
+from dataclasses import dataclass
+from decimal import Decimal
+from types import TracebackType
+
+import numpy as np
+import numpy.typing as npt
+
+from app.exchange_client.base import AggTrade
+from app.rates_utils.columns import RatesColumns, get_price_digits, to_fixed_point
+
+TRADES_EXTENSION: str = '.trades'
+
+_MAGIC: bytes = b'BTTR'
+_VERSION: int = 1
+_file_header = struct.Struct('<4sH')
+_chunk_header = struct.Struct('<IIbbq')
+
+
+@dataclass
+class TradesColumns:
+    timestamp: npt.NDArray[np.int64]
+    price: npt.NDArray[np.int64]
+    qty: npt.NDArray[np.int64]
+    price_digits: int
+    qty_digits: int
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def to_rates_columns(self) -> RatesColumns:
+        return RatesColumns(
+            timestamp=self.timestamp,
+            open=self.price,
+            high=self.price,
+            low=self.price,
+            close=self.price,
+            price_digits=self.price_digits,
+            volume=self.qty,
+            volume_digits=self.qty_digits,
+        )
+
+
+class TradesWriter:
+    """Append aggregated trades to binary trades file chunk by chunk."""
+
+    def __init__(self, filepath: str) -> None:
+        self._fd = open(filepath, 'wb')
+        self._fd.write(_file_header.pack(_MAGIC, _VERSION))
+
+    def __enter__(self) -> 'TradesWriter':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def write(self, trades: list[AggTrade]) -> None:
+        if not trades:
+            return
+
+        prices = [trade.price for trade in trades]
+        quantities = [trade.qty for trade in trades]
+        price_digits = get_price_digits(prices)
+        qty_digits = get_price_digits(quantities)
+
+        timestamps = np.array([trade.timestamp for trade in trades], dtype=np.int64)
+        fixed_prices = to_fixed_point(prices, price_digits)
+        payload = zlib.compress(np.concatenate([
+            np.diff(timestamps, prepend=timestamps[0]),
+            np.diff(fixed_prices, prepend=0),
+            to_fixed_point(quantities, qty_digits),
+        ]).tobytes())
+
+        self._fd.write(_chunk_header.pack(len(trades), len(payload), price_digits, qty_digits, timestamps[0]))
+        self._fd.write(payload)
+
+    def close(self) -> None:
+        self._fd.close()
+
+
+def read_trades(filepath: str) -> TradesColumns:
+    timestamps: list[npt.NDArray[np.int64]] = []
+    prices: list[npt.NDArray[np.int64]] = []
+    quantities: list[npt.NDArray[np.int64]] = []
+    chunks_digits: list[tuple[int, int]] = []
+
+    with open(filepath, 'rb') as fd:
+        magic, version = _file_header.unpack(fd.read(_file_header.size))
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('Unknown trades file format {0}'.format(filepath))
+
+        while raw_header := fd.read(_chunk_header.size):
+            if len(raw_header) < _chunk_header.size:
+                break  # truncated by interrupted sampler
+
+            rows, payload_size, price_digits, qty_digits, first_timestamp = _chunk_header.unpack(raw_header)
+            raw_payload = fd.read(payload_size)
+            if len(raw_payload) < payload_size:
+                break
+
+            payload = np.frombuffer(zlib.decompress(raw_payload), dtype=np.int64)
+            timestamps.append(first_timestamp + np.cumsum(payload[:rows]))
+            prices.append(np.cumsum(payload[rows:2 * rows]))
+            quantities.append(payload[2 * rows:])
+            chunks_digits.append((price_digits, qty_digits))
+
+    price_digits = max([0, *(digits[0] for digits in chunks_digits)])
+    qty_digits = max([0, *(digits[1] for digits in chunks_digits)])
+    empty = np.empty(0, dtype=np.int64)
+    return TradesColumns(
+        timestamp=np.concatenate(timestamps or [empty]),
+        price=np.concatenate([
+            chunk * 10 ** (price_digits - digits[0])
+            for chunk, digits in zip(prices, chunks_digits)
+        ] or [empty]),
+        qty=np.concatenate([
+            chunk * 10 ** (qty_digits - digits[1])
+            for chunk, digits in zip(quantities, chunks_digits)
+        ] or [empty]),
+        price_digits=price_digits,
+        qty_digits=qty_digits,
+    )
@@ -0,0 +1,72 @@
+"""Running totals of strategy positions, updated on every open and close."""
+from bisect import bisect_left, insort
+from datetime import datetime
+from decimal import Decimal
+
+from app.models import Position
+
+
+class ResultsAccumulator:
+    """Buy, sell and open positions totals for strategy results and P/L.
+
+    Totals are rounded by the current decimal context on every step the same way sums over
+    positions lists are. Closed positions are appended only, so their running sums are the
+    same sums. Open positions leave the list in any order, their totals are summed over the
+    shared open positions list once after every change.
+    """
+
+    def __init__(self, open_positions: list[Position] | None = None, closed_positions: list[Position] | None = None) -> None:
+        self._open_positions: list[Position] = open_positions if open_positions is not None else []
+        self._open_totals: tuple[Decimal, Decimal] | None = None
+        self._closed_buy_amount: Decimal = Decimal(0)
+        self._closed_sell_amount: Decimal = Decimal(0)
+        self._closed_qty: Decimal = Decimal(0)
+        self._close_datetimes: list[datetime] = []
+
+        for position in closed_positions or []:
+            self.add_closed(position)
+
+    @property
+    def open_amount(self) -> Decimal:
+        return self._get_open_totals()[0]
+
+    @property
+    def open_qty(self) -> Decimal:
+        return self._get_open_totals()[1]
+
+    @property
+    def closed_buy_amount(self) -> Decimal:
+        return self._closed_buy_amount
+
+    @property
+    def closed_sell_amount(self) -> Decimal:
+        return self._closed_sell_amount
+
+    @property
+    def closed_qty(self) -> Decimal:
+        return self._closed_qty
+
+    def reset_open(self) -> None:
+        """Forget open totals after open positions list was changed."""
+        self._open_totals = None
+
+    def add_closed(self, position: Position) -> None:
+        self._closed_buy_amount += position.open_rate * position.amount
+        self._closed_sell_amount += position.close_rate * position.amount
+        self._closed_qty += position.amount
+        insort(self._close_datetimes, position.close_tick_datetime)
+
+    def get_pl_base(self) -> Decimal:
+        """Return P/L with open positions liquidated by zero price."""
+        return self._closed_sell_amount - self._closed_buy_amount - self.open_amount
+
+    def get_closed_count_since(self, threshold: datetime) -> int:
+        return len(self._close_datetimes) - bisect_left(self._close_datetimes, threshold)
+
+    def _get_open_totals(self) -> tuple[Decimal, Decimal]:
+        if self._open_totals is None:
+            self._open_totals = (
+                Decimal(sum([pos.open_rate * pos.amount for pos in self._open_positions])),
+                Decimal(sum([pos.amount for pos in self._open_positions])),
+            )
+        return self._open_totals
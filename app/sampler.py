@@ -1,14 +1,51 @@
 import argparse
 import logging
 import os
-from datetime import datetime, time, timezone
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import time as dt_time
+from datetime import timezone
+from decimal import Decimal
 
+import numpy as np
+import numpy.typing as npt
+
+from app.exchange_client.base import BaseClient, HistoryPrice
 from app.exchange_client.binance import Binance
 from app.exchange_client.bybit import ByBit
+from app.rates_utils import catalog
+from app.rates_utils.columns import PRICE_COLUMNS, RatesColumns
+from app.rates_utils.compression import COMPRESSION_EXTENSIONS, open_rates
+from app.rates_utils.store import STORE_EXTENSION, history_to_columns, save_store
+from app.rates_utils.trades import TRADES_EXTENSION, TradesWriter
 from app.settings import app_settings
 
 logger = logging.getLogger(__name__)
 
+TRADES_WINDOW_MS: int = 60 * 60 * 1000
+
+_thread_clients = threading.local()
+
+
+class RateLimiter:
+    """Thread-safe limiter of exchange requests frequency shared by sampler workers."""
+
+    def __init__(self, requests_per_second: float) -> None:
+        self._interval: float = 1 / requests_per_second if requests_per_second > 0 else 0
+        self._next_request_at: float = 0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            request_at = max(now, self._next_request_at)
+            self._next_request_at = request_at + self._interval
+
+        if request_at > now:
+            time.sleep(request_at - now)
+
 
 def main(
     symbol: str,
@@ -16,51 +53,321 @@ def main(
     end_date: datetime,
     interval: str = '5m',
     exchange: str = 'binance',
+    force: bool = False,
+    compression: str | None = None,
+    store: bool = False,
 ) -> int:
+    """Download klines of range into csv rates file or into binary OHLCV rates store."""
     logger.info('Loading data for {0}-{1} from {2} to {3}'.format(symbol, interval, start_date, end_date))
 
-    exchange_client = {
-        'binance': Binance(
-            symbol=symbol,
-            test_mode=False,
-        ),
-        'bybit': ByBit(
-            symbol=symbol,
-            test_mode=False,
-        ),
-    }[exchange]
+    if not force and catalog.is_covered(
+        symbol,
+        interval,
+        int(start_date.timestamp() * 1000),
+        int(end_date.timestamp() * 1000),
+        exchange,
+    ):
+        logger.info('Rates already downloaded, skip (use --force to download again)')
+        return 0
+
+    limit: int = 1000
+
+    # every window is exactly one request, windows are downloaded concurrently and written in order
+    windows = split_windows(
+        int(start_date.timestamp() * 1000),
+        int(end_date.timestamp() * 1000),
+        limit * catalog.INTERVAL_MS[interval],
+    )
+    rate_limiter = RateLimiter(app_settings.sampler_requests_per_second)
+
+    with ThreadPoolExecutor(max_workers=app_settings.sampler_workers) as executor:
+        windows_rates = executor.map(
+            lambda window: _get_klines_window(exchange, symbol, interval, window, limit, rate_limiter),
+            windows,
+        )
+
+        # empty windows have no volume column and would drop it from merged rates
+        rates_columns = catalog.merge_columns([history_to_columns(rates) for rates in windows_rates if rates])
+
+    if store:
+        save_store(
+            _get_rates_filepath(exchange, symbol, interval, start_date, end_date, STORE_EXTENSION),
+            rates_columns,
+        )
+    else:
+        _save_csv(
+            _get_rates_filepath(exchange, symbol, interval, start_date, end_date, _get_csv_extension(compression)),
+            rates_columns,
+        )
 
+    logger.info('Saved {0} rows'.format(len(rates_columns)))
+    return len(rates_columns)
+
+
+def resume(
+    symbol: str,
+    start_date: datetime,
+    end_date: datetime,
+    interval: str = '5m',
+    exchange: str = 'binance',
+    compression: str | None = None,
+) -> int:
+    """Download only rates missed in already downloaded files and splice all of them into one file of range."""
     limit: int = 1000
+    interval_ms = catalog.INTERVAL_MS[interval]
+    start_ms: int = int(start_date.timestamp() * 1000)
+    end_ms: int = int(end_date.timestamp() * 1000)
+
+    existing_rates = catalog.load_range(symbol, interval, start_ms, end_ms, exchange)
+    missing_ranges = subtract_ranges(
+        find_missing_ranges(existing_rates.timestamp, start_ms, end_ms, interval_ms),
+        catalog.get_empty_ranges(symbol, interval, exchange),
+    )
+    logger.info('Resume {0}-{1}: {2} rows found, missing ranges {3}'.format(
+        symbol,
+        interval,
+        len(existing_rates),
+        missing_ranges,
+    ))
+
+    windows = [
+        window
+        for missing_range in missing_ranges
+        for window in split_windows(missing_range[0], missing_range[1], limit * interval_ms)
+    ]
+    rate_limiter = RateLimiter(app_settings.sampler_requests_per_second)
+    with ThreadPoolExecutor(max_workers=app_settings.sampler_workers) as executor:
+        new_rates = [
+            rate
+            for rates in executor.map(
+                lambda window: _get_klines_window(exchange, symbol, interval, window, limit, rate_limiter),
+                windows,
+            )
+            for rate in rates
+        ]
+
+    new_columns = history_to_columns(new_rates)
+    # only closed candles are confirmed, the latest ones may be not published yet
+    closed_ms = int(time.time() * 1000) - interval_ms
+    catalog.add_empty_ranges(symbol, interval, exchange, [
+        (empty_range[0], min(empty_range[1], closed_ms))
+        for missing_range in missing_ranges
+        for empty_range in find_missing_ranges(
+            _slice_timestamps(new_columns.timestamp, *missing_range),
+            missing_range[0],
+            missing_range[1],
+            interval_ms,
+        )
+        if empty_range[0] <= closed_ms
+    ])
+
+    # empty parts have no volume column and would drop it from merged rates
+    merged_rates = catalog.merge_columns([part for part in (existing_rates, new_columns) if len(part)])
+
+    _save_csv(
+        _get_rates_filepath(exchange, symbol, interval, start_date, end_date, _get_csv_extension(compression)),
+        merged_rates,
+    )
+
+    logger.info('Saved {0} new rows, {1} rows total'.format(len(new_rates), len(merged_rates)))
+    return len(new_rates)
+
+
+def find_missing_ranges(
+    timestamps: npt.NDArray[np.int64],
+    start_ms: int,
+    end_ms: int,
+    interval_ms: int,
+) -> list[tuple[int, int]]:
+    """Return [from_ms, to_ms] ranges of range not covered by time-sorted candles timestamps."""
+    bounds = np.concatenate([[start_ms - interval_ms], timestamps, [end_ms + interval_ms]]).astype(np.int64)
+    gaps = np.flatnonzero(np.diff(bounds) > interval_ms)
+    missing_ranges = [
+        (int(bounds[gap] + interval_ms), int(bounds[gap + 1] - interval_ms))
+        for gap in gaps
+    ]
+    return [
+        missing_range
+        for missing_range in missing_ranges
+        if missing_range[0] <= missing_range[1]
+    ]
+
+
+def sample_trades(
+    symbol: str,
+    start_date: datetime,
+    end_date: datetime,
+    exchange: str = 'binance',
+    limit: int = 1000,
+) -> int:
+    """Download aggregated trades into compact binary trades file."""
+    logger.info('Loading trades for {0} from {1} to {2}'.format(symbol, start_date, end_date))
+    exchange_client = _get_exchange_client(exchange, symbol)
+
     counter: int = 0
+    last_trade_id: int = -1
+    from_id: int | None = None
 
     filepath = os.path.join(
         app_settings.rates_path,
-        f'{exchange}_{symbol}_{interval}_{start_date.strftime("%Y-%m-%d_%H-%M-%S")}_{end_date.strftime("%Y-%m-%d_%H-%M-%S")}.csv',
+        f'{exchange}_{symbol}_trades_{start_date.strftime("%Y-%m-%d_%H-%M-%S")}_{end_date.strftime("%Y-%m-%d_%H-%M-%S")}{TRADES_EXTENSION}',
     )
 
-    with open(filepath, 'w') as output_fd:
-        output_fd.write('time,open\n')
+    with TradesWriter(filepath) as writer:
         start_ms: int = int(start_date.timestamp() * 1000)
         end_ms: int = int(end_date.timestamp() * 1000)
 
         while start_ms <= end_ms:
-            rates = exchange_client.get_klines(interval, start_ms, limit)
-            counter += len(rates)
-            for rate in rates:
-                tick_date = datetime.utcfromtimestamp(rate.timestamp / 1000).replace(tzinfo=timezone.utc)
-                if start_date <= tick_date <= end_date:
-                    formatted_time = tick_date.strftime('%Y-%m-%dT%H:%M:%S')
-                    output_fd.write('{0},{1}\n'.format(formatted_time, rate.price))
+            window_end_ms = min(end_ms, start_ms + TRADES_WINDOW_MS - 1)
+            trades = exchange_client.get_agg_trades(start_ms, window_end_ms, limit, from_id=from_id)
+            new_trades = [
+                trade
+                for trade in trades
+                if trade.trade_id > last_trade_id
+            ]
+            writer.write(new_trades)
+            counter += len(new_trades)
 
-            if not rates:
-                break
+            if len(trades) < limit:
+                # window exhausted
+                start_ms = window_end_ms + 1
+                from_id = None
+            else:
+                # page by trade id: more than limit trades may share one ms
+                start_ms = trades[-1].timestamp
+                from_id = trades[-1].trade_id + 1
 
-            start_ms = rates[-1].timestamp + 1
+            if new_trades:
+                last_trade_id = new_trades[-1].trade_id
 
-    logger.info('Saved {0} rows'.format(counter))
+    logger.info('Saved {0} trades'.format(counter))
     return counter
 
 
+def subtract_ranges(ranges: list[tuple[int, int]], excluded_ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Return parts of [from_ms, to_ms] ranges not overlapped by excluded ranges."""
+    result: list[tuple[int, int]] = []
+    for from_ms, to_ms in ranges:
+        for excluded_from_ms, excluded_to_ms in sorted(excluded_ranges):
+            if excluded_to_ms < from_ms or excluded_from_ms > to_ms:
+                continue
+            if excluded_from_ms > from_ms:
+                result.append((from_ms, excluded_from_ms - 1))
+            from_ms = excluded_to_ms + 1
+
+        if from_ms <= to_ms:
+            result.append((from_ms, to_ms))
+
+    return result
+
+
+def split_windows(start_ms: int, end_ms: int, window_ms: int) -> list[tuple[int, int]]:
+    """Split [start_ms, end_ms] range into consecutive non-overlapped windows."""
+    return [
+        (window_start_ms, min(end_ms, window_start_ms + window_ms - 1))
+        for window_start_ms in range(start_ms, end_ms + 1, window_ms)
+    ]
+
+
+def _get_klines_window(
+    exchange: str,
+    symbol: str,
+    interval: str,
+    window: tuple[int, int],
+    limit: int,
+    rate_limiter: RateLimiter,
+) -> list[HistoryPrice]:
+    # exchange clients are not thread-safe: one client per worker thread
+    clients: dict[tuple[str, str], BaseClient] = _thread_clients.__dict__.setdefault('clients', {})
+    if (exchange, symbol) not in clients:
+        clients[(exchange, symbol)] = _get_exchange_client(exchange, symbol)
+
+    rate_limiter.wait()
+    rates = clients[(exchange, symbol)].get_klines(interval, window[0], limit)
+    return [
+        rate
+        for rate in rates
+        if window[0] <= rate.timestamp <= window[1]
+    ]
+
+
+def _get_rates_filepath(
+    exchange: str,
+    symbol: str,
+    interval: str,
+    start_date: datetime,
+    end_date: datetime,
+    extension: str,
+) -> str:
+    return os.path.join(
+        app_settings.rates_path,
+        f'{exchange}_{symbol}_{interval}_{start_date.strftime("%Y-%m-%d_%H-%M-%S")}_{end_date.strftime("%Y-%m-%d_%H-%M-%S")}{extension}',
+    )
+
+
+def _get_csv_extension(compression: str | None) -> str:
+    return '.csv{0}'.format(COMPRESSION_EXTENSIONS[compression] if compression else '')
+
+
+def _get_tmp_filepath(filepath: str) -> str:
+    # keep extension for the same compression, leading dot hides file from rates catalog
+    return os.path.join(os.path.dirname(filepath), '.tmp_{0}'.format(os.path.basename(filepath)))
+
+
+def _save_csv(filepath: str, columns: RatesColumns) -> None:
+    """Write OHLCV rates into temporary file and swap it in place, never leave half-written rates file."""
+    tmp_filepath = _get_tmp_filepath(filepath)
+    try:
+        with open_rates(tmp_filepath, 'wt') as output_fd:
+            output_fd.write('time,open,high,low,close{0}\n'.format(',volume' if columns.volume is not None else ''))
+            for row in range(len(columns)):
+                output_fd.write('{0},{1}\n'.format(
+                    _format_rate_time(int(columns.timestamp[row])),
+                    ','.join(_format_rate_values(columns, row)),
+                ))
+        os.replace(tmp_filepath, filepath)
+    except BaseException:
+        _remove_tmp_file(tmp_filepath)
+        raise
+
+
+def _remove_tmp_file(tmp_filepath: str) -> None:
+    if os.path.exists(tmp_filepath):
+        os.remove(tmp_filepath)
+
+
+def _slice_timestamps(timestamps: npt.NDArray[np.int64], from_ms: int, to_ms: int) -> npt.NDArray[np.int64]:
+    return timestamps[np.searchsorted(timestamps, from_ms, side='left'):np.searchsorted(timestamps, to_ms, side='right')]
+
+
+def _format_rate_values(columns: RatesColumns, row: int) -> list[str]:
+    values = [
+        '{0:f}'.format(columns.to_decimal(getattr(columns, name)[row]).normalize())
+        for name in PRICE_COLUMNS
+    ]
+    if columns.volume is not None:
+        values.append('{0:f}'.format(Decimal(int(columns.volume[row])).scaleb(-columns.volume_digits).normalize()))
+    return values
+
+
+def _format_rate_time(timestamp: int) -> str:
+    tick_date = datetime.utcfromtimestamp(timestamp / 1000).replace(tzinfo=timezone.utc)
+    return tick_date.strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def _get_exchange_client(exchange: str, symbol: str) -> BaseClient:
+    return {
+        'binance': Binance(
+            symbol=symbol,
+            test_mode=False,
+        ),
+        'bybit': ByBit(
+            symbol=symbol,
+            test_mode=False,
+        ),
+    }[exchange]
+
+
 def valid_date(s: str) -> datetime:
     try:
         return datetime.strptime(s, "%Y-%m-%d")
@@ -69,7 +376,7 @@ def valid_date(s: str) -> datetime:
         raise argparse.ArgumentTypeError(msg)
 
 
-def valid_time(s: str) -> time:
+def valid_time(s: str) -> dt_time:
     try:
         return datetime.strptime(s, "%H:%M:%S").time()
     except ValueError:
@@ -83,7 +390,7 @@ if __name__ == '__main__':
         format='%(asctime)s %(levelname)-8s %(message)s',
     )
     parser = argparse.ArgumentParser()
-    parser.add_argument('--symbol', required=True, help='Symbol code')
+    parser.add_argument('--symbol', required=True, nargs='+', help='Symbol code (several symbols allowed)')
     parser.add_argument('--from-date', required=True, help='History from date (eg. 2023-01-01)', type=valid_date)
     parser.add_argument('--from-time', required=True, help='History from time (eg. 00:00:00)', type=valid_time)
     parser.add_argument('--end-date', required=True, help='History to date (eg. 2023-01-25)', type=valid_date)
@@ -100,9 +407,27 @@ if __name__ == '__main__':
         help='Exchange name',
         default='binance',
     )
+    parser.add_argument(
+        '--compression',
+        choices=list(COMPRESSION_EXTENSIONS),
+        help='Compress rates file',
+        default=None,
+    )
+    parser.add_argument('--store', action='store_true', help='Write OHLCV rates into binary .rates store instead of csv')
+    parser.add_argument('--resume', action='store_true', help='Download only rates missed in already downloaded files')
+    parser.add_argument('--trades', action='store_true', help='Download aggregated trades instead of klines')
+    parser.add_argument('--force', action='store_true', help='Download rates even if they are already in rates catalog')
     args = parser.parse_args()
+    if args.store and args.compression:
+        parser.error('--store is not compressed, use it without --compression')
 
     start_date = datetime.combine(args.from_date, args.from_time).replace(tzinfo=timezone.utc)
     end_date = datetime.combine(args.end_date, args.end_time).replace(tzinfo=timezone.utc)
 
-    main(args.symbol, start_date, end_date, args.interval, args.exchange)
+    for symbol in args.symbol:
+        if args.trades:
+            sample_trades(symbol, start_date, end_date, args.exchange)
+        elif args.resume:
+            resume(symbol, start_date, end_date, args.interval, args.exchange, args.compression)
+        else:
+            main(symbol, start_date, end_date, args.interval, args.exchange, args.force, args.compression, args.store)
@@ -101,6 +101,25 @@ class AppSettings(BaseSettings, extra='ignore'):
         default='BINANCE_SOLUSDT, 60.csv',
         description='имя файла с ценой монеты, от старой к новой',
     )
+    rates_cache_enabled: bool = Field(
+        default=False,
+        description='Один раз конвертировать файл с ценами в бинарный колоночный кеш и читать дальше из него, цены из кеша приходят с общим числом знаков после запятой (21.6 станет 21.60)',
+    )
+    results_verification_enabled: bool = Field(
+        default=False,
+        description='Сверять накопленные итоги результатов с полным пересчётом по всем позициям (медленно, для отладки)',
+    )
+    follow_show_results_seconds: int = Field(
+        default=60,
+        description='Как часто выводить результаты бектеста в режиме --follow, в секундах',
+    )
+
+    # sampler settings
+    sampler_workers: int = Field(default=4, description='Количество параллельных загрузок окон котировок')
+    sampler_requests_per_second: float = Field(
+        default=10,
+        description='Ограничение частоты запросов к бирже при загрузке котировок (0 - без ограничений)',
+    )
 
     # trader settings
     exchange: Literal['binance', 'bybit'] = 'binance'
@@ -117,6 +136,9 @@ class AppSettings(BaseSettings, extra='ignore'):
     dry_run: bool = Field(default=True)
     exchange_test_mode: bool = Field(default=False)
     telemetry_enabled: bool = Field(default=False, description='вкл/выкл запись телеметрии в мускуль')
+    recorder_enabled: bool = Field(default=False, description='вкл/выкл запись всех тиков в файлы .ticks для бектеста')
+    recorder_flush_seconds: int = Field(default=60, description='Как часто сбрасывать записанные тики на диск, в секундах')
+    recorder_rotate_hours: int = Field(default=24, description='Период ротации файлов с записанными тиками, в часах')
 
 
 app_settings = AppSettings(
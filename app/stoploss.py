@@ -1,27 +1,31 @@
 import logging
-from decimal import Decimal
+from decimal import ROUND_CEILING, Decimal, localcontext
 
-from app.settings import app_settings
+from app.strategy_config import StrategyConfig, get_strategy_config
 
 logger = logging.getLogger(__file__)
 
 
 class StopLoss:
-    def __init__(self) -> None:
+    def __init__(self, config: StrategyConfig | None = None) -> None:
         self._max_pl: Decimal = Decimal(0)
 
-        self._steps: list[tuple[Decimal, Decimal]] = [
-            (
-                Decimal(step.split(':')[0]),
-                Decimal(step.split(':')[1]),
-            )
-            for step in app_settings.stop_loss_steps.split(';')
-        ]
-        self._steps.sort(key=lambda x: x[0], reverse=True)
+        self._steps: list[tuple[Decimal, Decimal]] = list((config or get_strategy_config()).stop_loss_steps)
 
         if not self._steps:
             raise RuntimeError('Stop loss steps not found!')
 
+        self._trigger_price_key: tuple[Decimal, Decimal, Decimal] | None = None
+        self._trigger_price: Decimal = Decimal('Infinity')
+
+    @property
+    def max_pl(self) -> Decimal:
+        return self._max_pl
+
+    @property
+    def min_threshold(self) -> Decimal:
+        return min(step[1] for step in self._steps)
+
     def update_max_pl(self, current_pl: Decimal) -> None:
         self._max_pl = max(self._max_pl, current_pl)
 
@@ -39,6 +43,25 @@ class StopLoss:
         ))
         return diff >= threshold
 
+    def get_trigger_price(self, pl_base: Decimal, open_quantity: Decimal) -> Decimal:
+        """Return the highest bid which may fire stop loss when current P/L is pl_base + bid * open_quantity.
+
+        Rounded up: bid above it never fires, bid not above it is checked by is_stop_loss_shot.
+        Recalculated after max P/L or open positions change only.
+        """
+        if open_quantity <= 0:
+            # P/L does not depend on bid: fires on any bid or never
+            diff = self._max_pl - pl_base
+            return Decimal('Infinity') if diff > 0 and diff >= self._get_threshold() else Decimal('-Infinity')
+
+        trigger_price_key = (self._max_pl, pl_base, open_quantity)
+        if trigger_price_key != self._trigger_price_key:
+            with localcontext() as ctx:
+                ctx.rounding = ROUND_CEILING
+                self._trigger_price = (self._max_pl - self._get_threshold() - pl_base) / open_quantity
+            self._trigger_price_key = trigger_price_key
+        return self._trigger_price
+
     def _get_threshold(self) -> Decimal:
         for step in self._steps:
             if self._max_pl >= step[0]:
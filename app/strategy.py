@@ -1,19 +1,22 @@
-import copy
 import logging
+import math
 import time
+from collections.abc import Set as AbstractSet
 from datetime import datetime, timedelta
 from decimal import ROUND_DOWN, Decimal
 
-from app import baskets, storage
+from app import storage
 from app.exchange_client.base import BaseClient, OrderResult
 from app.fees_utils.fees_accounting import FeesAccountingMixin
 from app.floating_steps import FloatingSteps
-from app.grid import get_grid_num_by_price
 from app.liquidation import Liquidation
-from app.models import FloatingMatrix, OnHoldPositions, Position, Tick, Fee
+from app.models import FloatingMatrix, GridBand, OnHoldPositions, Position, PriceTriggers, Tick, Fee
+from app.position_book import PositionBook
+from app.results_accumulator import ResultsAccumulator
 from app.settings import app_settings
 from app.state_utils.state_saver import StateSaverMixin
 from app.stoploss import StopLoss
+from app.strategy_config import StrategyConfig, get_strategy_config
 from app.telemetry.client import DummyClient, TelemetryClient
 from app.xirr import calculate_xirr
 
@@ -23,9 +26,10 @@ logger = logging.getLogger(__name__)
 class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
     tick_history_limit: int = 10
 
-    def __init__(self, exchange_client: BaseClient, dry_run: bool = False) -> None:
+    def __init__(self, exchange_client: BaseClient, dry_run: bool = False, config: StrategyConfig | None = None) -> None:
         super().__init__(exchange_client, dry_run)
 
+        self._config: StrategyConfig = config or get_strategy_config()
         self._xirr_cached_ttl: float = time.time()
         self._xirr_cached: Decimal = Decimal(0)
         self._start_date: datetime = datetime.utcnow()
@@ -36,10 +40,14 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
         self._max_sell_percent_tick: int = 0
         self._ticks_history: list[Tick] = []
         self._first_open_position_rate: Decimal = Decimal(0)
+        # positions index, updated by _open_position and _close_position, see _reset_positions_index
+        self._position_book: PositionBook = PositionBook()
+        self._results_accumulator: ResultsAccumulator = ResultsAccumulator(self._open_positions)
+        self._price_triggers: PriceTriggers | None = None
 
         self._current_pl: Decimal = Decimal(0)
-        self._stop_loss = StopLoss()
-        self._liquidation = Liquidation()
+        self._stop_loss = StopLoss(self._config)
+        self._liquidation = Liquidation(self._config)
 
         self._exchange_client: BaseClient = exchange_client
         self._dry_run: bool = dry_run
@@ -61,7 +69,7 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
         self._update_stats(tick)
         buy_completed: bool = False
 
-        if not app_settings.enabled:
+        if not self._config.enabled:
             logger.warning('end trading session by enabled setting')
             return False
 
@@ -69,16 +77,16 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
             logger.info('init buy')
             self._telemetry.cleanup()
 
-            buy_amount = baskets.get_continue_buy_amount(tick.ask)
+            buy_amount = self._config.get_continue_buy_amount(tick.ask)
             buy_completed = self._open_position(
                 quantity=calculate_ticker_quantity(
                     buy_amount,
                     tick.ask,
-                    app_settings.ticker_amount_digits,
+                    self._config.ticker_amount_digits,
                 ),
                 price=tick.ask,
                 tick_number=tick.number,
-                grid_number=get_grid_num_by_price(tick.ask),
+                grid_number=self._config.get_grid_number(tick.ask),
             )
 
             buy_price = None if not buy_completed else self._open_positions[-1].open_rate
@@ -92,19 +100,24 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
             self._update_stats(tick)
             return True
 
-        if self._liquidation.is_active(tick):
-            logger.info('liquidation is active!')
-            return self._liquidation_execute(tick)
+        if tick.bid <= self._get_risk_trigger_price():
+            if self._liquidation.is_active(tick):
+                logger.info('liquidation is active!')
+                return self._liquidation_execute(tick)
 
-        if app_settings.stop_loss_enabled and self._stop_loss.is_stop_loss_shot(self._current_pl):
-            logger.info('adaptive stop loss fired!')
-            self._stop_loss_execute()
-            return False
+            if self._config.stop_loss_enabled and self._stop_loss.is_stop_loss_shot(self._current_pl):
+                logger.info('adaptive stop loss fired!')
+                self._stop_loss_execute()
+                return False
 
-        if app_settings.stop_loss_hard_enabled and app_settings.stop_loss_hard_threshold >= tick.bid:
-            logger.info('hard stop loss fired!')
-            self._stop_loss_execute()
-            return False
+            if self._config.stop_loss_hard_enabled and self._config.stop_loss_hard_threshold >= tick.bid:
+                logger.info('hard stop loss fired!')
+                self._stop_loss_execute()
+                return False
+
+        if self._is_inert_tick(tick):
+            # nothing to sell and buy: tick changes stats only
+            return True
 
         # sale position[s]
         sale_completed = self._sell_something(bid_price=tick.bid, bid_qty=tick.bid_qty, tick_number=tick.number)
@@ -210,6 +223,22 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
         storage.save_stats(app_settings.instance_name, self.get_results())
 
     def get_results(self) -> dict:
+        last_day_threshold = datetime.utcnow() - timedelta(hours=24)
+        results = self._get_results(last_day_threshold)
+        if app_settings.results_verification_enabled:
+            self._verify_results(results, last_day_threshold)
+        return results
+
+    def _verify_results(self, results: dict, last_day_threshold: datetime) -> None:
+        """Compare results of running totals with results summed over all positions lists."""
+        expected = self._get_reference_results(last_day_threshold)
+        mismatched = sorted(name for name, value in expected.items() if results[name] != value)
+        if mismatched:
+            logger.error('results mismatch {0}'.format({name: (results[name], expected[name]) for name in mismatched}))
+            raise RuntimeError('Running results totals mismatch: {0}'.format(', '.join(mismatched)))
+
+    def _get_reference_results(self, last_day_threshold: datetime) -> dict:
+        """Return results of positions totals summed over open and closed positions lists."""
         buy_amount_without_current_opened = sum(
             [pos.open_rate * pos.amount for pos in self._closed_positions]
         )
@@ -225,9 +254,6 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
         sell_amount_without_current_opened = sum(
             [pos.close_rate * pos.amount for pos in self._closed_positions]
         )
-        sell_without_current_opened = sum(
-            [pos.amount for pos in self._closed_positions]
-        )
         liquidation_amount = sum(
             [self.get_last_tick().bid * pos.amount for pos in self._open_positions]
         )
@@ -235,6 +261,46 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
             [pos.amount for pos in self._open_positions]
         )
 
+        open_position_average_rate = Decimal(0)
+        if self._open_positions:
+            liquidation_open_amount = sum(
+                [pos.open_rate * pos.amount for pos in self._open_positions]
+            )
+            open_position_average_rate = Decimal(liquidation_open_amount / (liquidation_qty or Decimal(1)))
+
+        return {
+            'min_open_position_amount_usd': min([pos.open_rate for pos in self._open_positions], default=Decimal(0)),
+            'max_open_position_amount_usd': max([pos.open_rate for pos in self._open_positions], default=Decimal(0)),
+            'buy_total_amount_usd': buy_amount_total,
+            'buy_total_qty': buy_total,
+            'buy_without_current_opened_amount_usd': buy_amount_without_current_opened,
+            'buy_without_current_opened_qty': buy_without_current_opened,
+            'sell_without_current_opened_amount_usd': sell_amount_without_current_opened,
+            'dirty_pl_amount_usd': sell_amount_without_current_opened - buy_amount_without_current_opened,
+            'open_position_average_rate': open_position_average_rate,
+            'liquidation_qty': liquidation_qty,
+            'pl_amount_usd': sell_amount_without_current_opened + liquidation_amount - buy_amount_total,
+            'last_24h_success_deals': len([
+                position
+                for position in self._closed_positions
+                if position.close_tick_datetime >= last_day_threshold
+            ]),
+        }
+
+    def _get_results(self, last_day_threshold: datetime) -> dict:
+        results_accumulator = self._results_accumulator
+        position_book = self._position_book
+        buy_amount_without_current_opened = results_accumulator.closed_buy_amount
+        buy_without_current_opened = results_accumulator.closed_qty
+        buy_amount_total = buy_amount_without_current_opened + results_accumulator.open_amount
+        buy_total = buy_without_current_opened + results_accumulator.open_qty
+        sell_amount_without_current_opened = results_accumulator.closed_sell_amount
+        sell_without_current_opened = results_accumulator.closed_qty
+        liquidation_qty = results_accumulator.open_qty
+        liquidation_amount = sum(
+            [self.get_last_tick().bid * pos.amount for pos in self._open_positions]
+        )
+
         # считаем доходность относительно максимума средств в обороте
         max_amount_onhold: Decimal = self._max_onhold_positions.buy_amount if self._max_onhold_positions else Decimal(0)
         profit_amount_without_current_opened = sell_amount_without_current_opened - buy_amount_without_current_opened
@@ -246,13 +312,11 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
         min_open_rate = Decimal(0)
         max_open_rate = Decimal(0)
         open_position_average_rate = Decimal(0)
-        if self._open_positions:
-            min_open_rate = min(pos.open_rate for pos in self._open_positions)
-            max_open_rate = max(pos.open_rate for pos in self._open_positions)
+        if len(position_book):
+            min_open_rate = position_book.get_lowest_open_rate() or Decimal(0)
+            max_open_rate = position_book.get_highest_open_rate() or Decimal(0)
 
-            liquidation_open_amount = sum(
-                [pos.open_rate * pos.amount for pos in self._open_positions]
-            )
+            liquidation_open_amount = results_accumulator.open_amount
             logger.debug(f'debug: {liquidation_open_amount=} {liquidation_qty=}')
             open_position_average_rate = Decimal(liquidation_open_amount / (liquidation_qty or Decimal(1)))
 
@@ -264,7 +328,7 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
             )
             self._xirr_cached_ttl = time.time() + app_settings.xirr_cache_ttl
 
-        last_day_threshold = datetime.utcnow() - timedelta(hours=24)
+        invest_body = self._get_invest_body()
 
         return {
             'start_date': self._start_date,
@@ -307,7 +371,7 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
             'pl_amount_usd': profit_amount_total,
             'pl_amount_btc': profit_amount_total,
             'pl_percent': float(profit_percent_total),
-            'invest_body': float(self._get_invest_body()),
+            'invest_body': float(invest_body),
 
             'onhold_amount_usd': self._max_onhold_positions.buy_amount if self._max_onhold_positions else 0,
             'onhold_amount_btc': self._max_onhold_positions.buy_amount if self._max_onhold_positions else 0,
@@ -318,15 +382,11 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
             'count_sell_transactions': len(self._closed_positions),
             'count_unsuccessful_deals': len(self._open_positions),
             'count_success_deals': len(self._closed_positions),
-            'last_24h_success_deals': len([
-                position
-                for position in self._closed_positions
-                if position.close_tick_datetime >= last_day_threshold
-            ]),
+            'last_24h_success_deals': results_accumulator.get_closed_count_since(last_day_threshold),
         }
 
     def _get_invest_body(self) -> Decimal:
-        total_deposit_amount: Decimal = baskets.get_total_deposit()
+        total_deposit_amount: Decimal = self._config.get_total_deposit()
         liquidation_amount = Decimal(0)
         buy_amount = Decimal(0)
 
@@ -334,35 +394,29 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
             liquidation_amount = Decimal(sum(
                 [self.get_last_tick().bid * pos.amount for pos in self._open_positions]
             ))
-            buy_amount = Decimal(sum(
-                [pos.open_rate * pos.amount for pos in self._open_positions]
-            ))
+            buy_amount = self._results_accumulator.open_amount
         logger.info(f'invest body calculations {total_deposit_amount=} {liquidation_amount=} {buy_amount=}')
         return total_deposit_amount - buy_amount + liquidation_amount
 
     def _is_buy_allowed(self, tick: Tick, sale_completed: bool) -> bool:
-        basket_number = baskets.get_basket_number(tick.avg_price)
-        positions_limit = baskets.get_hold_position_limit(tick.avg_price)
-        open_positions_for_current_basket = sum(
-            1
-            for pos in self._open_positions
-            if pos.basket_number == basket_number
-        )
+        basket_number = self._config.get_basket_number(tick.avg_price)
+        positions_limit = self._config.get_hold_position_limit(tick.avg_price)
+        open_positions_for_current_basket = self._position_book.get_basket_count(basket_number)
 
         if open_positions_for_current_basket >= positions_limit:
             logger.info('skip buy: positions limit')
             return False
 
-        if app_settings.close_positions_only:
+        if self._config.close_positions_only:
             logger.info('skip buy: sell only mode')
             return False
 
-        if sale_completed and not app_settings.sell_and_buy_onetime_enabled:
+        if sale_completed and not self._config.sell_and_buy_onetime_enabled:
             logger.info('skip buy: already sale on tick')
             return False
 
         is_red_candle = tick.bid < self._get_previous_tick().bid
-        if app_settings.buy_only_red_candles and not is_red_candle:
+        if self._config.buy_only_red_candles and not is_red_candle:
             logger.info('skip buy: red candles mode')
             return False
 
@@ -370,20 +424,89 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
         return True
 
     def _update_stats(self, tick: Tick):
+        results_accumulator = self._results_accumulator
         on_hold_current = OnHoldPositions(
-            quantity=Decimal(sum([pos.amount for pos in self._open_positions])),
-            buy_amount=Decimal(sum([pos.amount * pos.open_rate for pos in self._open_positions])),
+            quantity=results_accumulator.open_qty,
+            buy_amount=results_accumulator.open_amount,
             tick_number=tick.number,
             tick_rate=tick.bid,
         )
         if not self._max_onhold_positions or self._max_onhold_positions.buy_amount <= on_hold_current.buy_amount:
             self._max_onhold_positions = on_hold_current
 
-        self._current_pl = Decimal(self.get_results()['pl_amount_usd'])
+        self._current_pl = self._get_current_pl(tick.bid)
         self._stop_loss.update_max_pl(self._current_pl)
 
+    def _get_current_pl(self, bid: Decimal) -> Decimal:
+        """Return P/L with open positions liquidated by bid (pl_amount_usd of results) without results recalculation."""
+        price_triggers = self._get_price_triggers()
+        return price_triggers.pl_base + bid * price_triggers.open_quantity
+
+    def _get_risk_trigger_price(self) -> Decimal:
+        """Return the highest bid which may fire liquidation, adaptive or hard stop loss, higher bid skips risk checks."""
+        trigger_prices = [self._liquidation.get_trigger_price()]
+        if self._config.stop_loss_enabled:
+            price_triggers = self._get_price_triggers()
+            trigger_prices.append(self._stop_loss.get_trigger_price(price_triggers.pl_base, price_triggers.open_quantity))
+        if self._config.stop_loss_hard_enabled:
+            trigger_prices.append(self._config.stop_loss_hard_threshold)
+        return max(trigger_prices)
+
+    def _is_inert_tick(self, tick: Tick) -> bool:
+        """Return True when tick can not sell or buy anything with current open positions.
+
+        Bid under the lowest sell price of open positions sells nothing, buy is blocked by
+        sell only mode, red candles mode, basket positions limit or filled grid cell of buy price.
+        """
+        price_triggers = self._get_price_triggers()
+        if price_triggers.sell_price is not None and tick.bid >= price_triggers.sell_price:
+            return False
+
+        if self._config.close_positions_only:
+            return True
+
+        if self._config.buy_only_red_candles and not tick.bid < self._get_previous_tick().bid:
+            return True
+
+        basket_number = self._config.get_basket_number(tick.avg_price)
+        if price_triggers.basket_counts.get(basket_number, 0) >= self._config.get_hold_position_limit(tick.avg_price):
+            return True
+
+        buy_price = tick.ask.quantize(self._config.ticker_price_digits)
+        grid_band = price_triggers.grid_band
+        if grid_band is None or not grid_band.low <= buy_price < grid_band.high or self._config.get_basket_number(buy_price) != grid_band.basket_number:
+            grid_band = _get_filled_grid_band(self._config, buy_price, price_triggers.filled_grid_numbers)
+            price_triggers.grid_band = grid_band
+        return grid_band is not None
+
+    def _get_price_triggers(self) -> PriceTriggers:
+        """Return price triggers of open positions, they are recalculated after positions change only."""
+        if self._price_triggers is None:
+            position_book = self._position_book
+            lowest_open_rate = position_book.get_lowest_open_rate()
+
+            self._price_triggers = PriceTriggers(
+                # minimal sell price grows with open rate
+                sell_price=None if lowest_open_rate is None else self._config.get_minimal_sell_price(lowest_open_rate),
+                filled_grid_numbers=position_book.grid_numbers,
+                basket_counts=position_book.basket_counts,
+                pl_base=self._results_accumulator.get_pl_base(),
+                open_quantity=self._results_accumulator.open_qty,
+            )
+        return self._price_triggers
+
     def _get_open_positions_for_sell(self) -> list[Position]:
-        return sorted(copy.deepcopy(self._open_positions), key=lambda x: x.open_rate)
+        return self._position_book.get_sorted_by_open_rate()
+
+    def restore_state_from(self, saved_state: dict) -> None:
+        super().restore_state_from(saved_state)
+        self._reset_positions_index()
+
+    def _reset_positions_index(self) -> None:
+        """Rebuild position book, running totals and price triggers after positions lists were replaced."""
+        self._position_book = PositionBook(self._open_positions)
+        self._results_accumulator = ResultsAccumulator(self._open_positions, self._closed_positions)
+        self._price_triggers = None
 
     def _open_position(self, quantity: Decimal, price: Decimal, tick_number: int, grid_number: str) -> bool:
         if self._dry_run:
@@ -413,20 +536,24 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
 
         logger.info('open new position w/o fees {0} {1}'.format(buy_response.qty, buy_response.price))
 
-        order_response = self.apply_buy_fee(buy_response, app_settings.ticker_amount_digits)
+        order_response = self.apply_buy_fee(buy_response, self._config.ticker_amount_digits)
         logger.info('open new position {0} {1}'.format(order_response.qty, order_response.price))
 
         if not self._first_open_position_rate:
             self._first_open_position_rate = order_response.price
 
-        self._open_positions.append(Position(
+        position = Position(
             amount=order_response.qty,
             open_rate=order_response.price,
             open_fee=order_response.raw_fees[0] if order_response.raw_fees else None,
             open_tick_number=tick_number,
             grid_number=grid_number,
-            basket_number=baskets.get_basket_number(price),
-        ))
+            basket_number=self._config.get_basket_number(price),
+        )
+        self._open_positions.append(position)
+        self._position_book.add(position)
+        self._results_accumulator.reset_open()
+        self._price_triggers = None
         return True
 
     def _close_position(self, position_for_close: Position, price: Decimal, tick_number: int) -> bool:
@@ -460,12 +587,22 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
         order_response = self.apply_sell_fee(sell_response)
         logger.info('close the position {0} {1} {2}'.format(order_response.qty, order_response.price, position_for_close))
 
-        self._open_positions.remove(position_for_close)
+        # closed position object moves to closed positions, equal one must stay open
+        open_index = next((num for num, pos in enumerate(self._open_positions) if pos is position_for_close), None)
+        if open_index is None:
+            self._open_positions.remove(position_for_close)
+        else:
+            del self._open_positions[open_index]
+        self._position_book.remove(position_for_close)
+        self._results_accumulator.reset_open()
+
         position_for_close.close_rate = order_response.price
         position_for_close.close_fee = order_response.raw_fees[0] if order_response.raw_fees else None
         position_for_close.close_tick_number = tick_number
         position_for_close.close_tick_datetime = datetime.utcnow()
         self._closed_positions.append(position_for_close)
+        self._results_accumulator.add_closed(position_for_close)
+        self._price_triggers = None
         return True
 
     def _sell_something(self, bid_price: Decimal, bid_qty: Decimal, tick_number: int) -> bool:
@@ -475,7 +612,7 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
         sale_completed: bool = False
         for position in self._get_open_positions_for_sell():
             logger.debug(position)
-            minimal_sell_price = position.open_rate + position.open_rate * app_settings.avg_rate_sell_limit / Decimal(100)
+            minimal_sell_price = self._config.get_minimal_sell_price(position.open_rate)
 
             # условия на продажу
             # - текущая цена выше цены покупки на N%
@@ -487,8 +624,12 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
                 bid_price >= minimal_sell_price,
             ))
 
-            if bid_price >= minimal_sell_price and qty_left >= position.amount:
-                sell_price = bid_price.quantize(app_settings.ticker_price_digits)
+            if bid_price < minimal_sell_price:
+                # positions are ordered by open rate, the next ones have even higher sell price
+                break
+
+            if qty_left >= position.amount:
+                sell_price = bid_price.quantize(self._config.ticker_price_digits)
                 sell_response = self._close_position(
                     position_for_close=position,
                     price=sell_price,
@@ -499,37 +640,34 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
                 if sell_response:
                     qty_left = qty_left - position.amount
 
-            if sale_completed and not app_settings.multiple_sell_on_tick:
+            if sale_completed and not self._config.multiple_sell_on_tick:
                 break
 
         return sale_completed
 
     def _buy_something(self, ask_price: Decimal, ask_qty: Decimal, tick_number: int) -> bool:
-        buy_price = ask_price.quantize(app_settings.ticker_price_digits)
-        buy_amount = baskets.get_continue_buy_amount(buy_price)
-        grid_step = baskets.get_grid_step(buy_price)
+        buy_price = ask_price.quantize(self._config.ticker_price_digits)
+        buy_amount = self._config.get_continue_buy_amount(buy_price)
+        grid_step = self._config.get_grid_step(buy_price)
 
         buy_qty = calculate_ticker_quantity(
             buy_amount,
             buy_price,
-            app_settings.ticker_amount_digits,
+            self._config.ticker_amount_digits,
         )
 
-        current_price_grid: str = get_grid_num_by_price(buy_price)
-        filled_grid_numbers: set[str] = {
-            position.grid_number
-            for position in self._open_positions
-        }
+        current_price_grid: str = self._config.get_grid_number(buy_price)
+        position_book = self._position_book
 
         is_buy_available_by_qty = (buy_qty <= ask_qty) or ask_qty == 0
-        is_buy_available_by_grid = current_price_grid not in filled_grid_numbers
+        is_buy_available_by_grid = not position_book.is_grid_filled(current_price_grid)
 
         logger.info(
             'buy conditions: buy price: %.10f, grid step is %.10f, current grid %s, filled grids [%s], grid check %s, qty check %s' % (
                 float(buy_price),
                 float(grid_step),
                 current_price_grid,
-                filled_grid_numbers,
+                set(position_book.grid_numbers),
                 is_buy_available_by_grid,
                 is_buy_available_by_qty,
             ),
@@ -546,7 +684,7 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
 
     def _stop_loss_execute(self) -> None:
         quantity = self._exchange_client.get_asset_balance().quantize(
-            app_settings.ticker_amount_digits,
+            self._config.ticker_amount_digits,
             rounding=ROUND_DOWN,
         )
         logger.info('stop loss execution: qty={0}'.format(quantity))
@@ -591,7 +729,7 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
                 return False
 
             # if order too fresh - just wait
-            order_created_threshold = datetime.utcnow() - timedelta(minutes=app_settings.liquidation_order_ttl_minutes)
+            order_created_threshold = datetime.utcnow() - timedelta(minutes=self._config.liquidation_order_ttl_minutes)
             if self._liquidation.order_created_at >= order_created_threshold:
                 logger.info('liquidation execution: order too fresh')
                 return True
@@ -611,13 +749,13 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
 
         # get actual qty from exchange
         actual_quantity = self._exchange_client.get_asset_balance().quantize(
-            app_settings.ticker_amount_digits,
+            self._config.ticker_amount_digits,
             rounding=ROUND_DOWN,
         )
         logger.info('liquidation execution: actual qty on exchange {0}'.format(actual_quantity))
         self._liquidation.qty_left = actual_quantity
 
-        if self._liquidation.tries > app_settings.liquidation_max_tries:
+        if self._liquidation.tries > self._config.liquidation_max_tries:
             # if too much tries - end liquidation
             logger.info('liquidation execution: too much tries')
             return False
@@ -627,8 +765,8 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
             logger.info('liquidation execution: not enough quantity')
             return False
 
-        discount_percent = Decimal(self._liquidation.tries * app_settings.liquidation_discount_percent_step)
-        price = (tick.bid / Decimal(100) * (Decimal(100) - discount_percent)).quantize(app_settings.ticker_price_digits)
+        discount_percent = Decimal(self._liquidation.tries * self._config.liquidation_discount_percent_step)
+        price = (tick.bid / Decimal(100) * (Decimal(100) - discount_percent)).quantize(self._config.ticker_price_digits)
         logger.info('liquidation execution: new order {0} {1} {2}'.format(
             actual_quantity,
             discount_percent,
@@ -674,15 +812,14 @@ class BasicStrategy(StateSaverMixin, FeesAccountingMixin):
 
 
 class FloatingStrategy(BasicStrategy):
-    _matrix: dict[int, FloatingSteps] = {}
-
-    def __init__(self, exchange_client: BaseClient, dry_run: bool = False) -> None:
-        super().__init__(exchange_client, dry_run)
+    def __init__(self, exchange_client: BaseClient, dry_run: bool = False, config: StrategyConfig | None = None) -> None:
+        super().__init__(exchange_client, dry_run, config)
+        self._matrix: dict[int, FloatingSteps] = {}
 
     def _get_matrix(self, bid_price: Decimal) -> FloatingSteps:
-        basket_number = baskets.get_basket_number(bid_price)
+        basket_number = self._config.get_basket_number(bid_price)
         if basket_number not in self._matrix:
-            matrix: FloatingMatrix = baskets.get_floating_matrix(bid_price)
+            matrix: FloatingMatrix = self._config.get_floating_matrix(bid_price)
             self._matrix[basket_number] = FloatingSteps(matrix)
         return self._matrix[basket_number]
 
@@ -708,7 +845,7 @@ class FloatingStrategy(BasicStrategy):
                 step_percent,
             ))
 
-            sell_price = bid_price.quantize(app_settings.ticker_price_digits)
+            sell_price = bid_price.quantize(self._config.ticker_price_digits)
 
             if qty_left >= position.amount:
                 has_sale_try = True
@@ -719,7 +856,7 @@ class FloatingStrategy(BasicStrategy):
                     if sell_response:
                         qty_left = qty_left - position.amount
 
-            if sale_completed and not app_settings.multiple_sell_on_tick:
+            if sale_completed and not self._config.multiple_sell_on_tick:
                 break
 
         if has_sale_try:
@@ -730,6 +867,10 @@ class FloatingStrategy(BasicStrategy):
 
         return sale_completed
 
+    def _is_inert_tick(self, tick: Tick) -> bool:
+        # floating steps move on every tick with open positions
+        return False
+
     def _update_stats(self, tick: Tick):
         super()._update_stats(tick)
         if self._get_matrix(tick.bid).current_step >= self._max_sell_percent:
@@ -758,14 +899,38 @@ def calculate_ticker_quantity(needed_amount: Decimal, current_price: Decimal, ro
     return (needed_amount / current_price).quantize(round_digits)
 
 
-def get_strategy_instance(strategy_type: str, exchange_client: BaseClient, dry_run: bool) -> BasicStrategy:
-    return {
-        'basic': BasicStrategy(
-            exchange_client=exchange_client,
-            dry_run=dry_run,
-        ),
-        'floating': FloatingStrategy(
-            exchange_client=exchange_client,
-            dry_run=dry_run,
-        ),
+def _get_filled_grid_band(config: StrategyConfig, buy_price: Decimal, filled_grid_numbers: AbstractSet[str]) -> GridBand | None:
+    """Return band of filled grid cells around buy price inside its basket, None when grid cell of buy price is empty."""
+    if config.get_grid_number(buy_price) not in filled_grid_numbers:
+        return None
+
+    basket_number = config.get_basket_number(buy_price)
+    grid_step = config.get_grid_step(buy_price)
+    low_cell = high_cell = math.floor(buy_price / grid_step)
+    while '{0}_{1}'.format(basket_number, low_cell - 1) in filled_grid_numbers:
+        low_cell -= 1
+    while '{0}_{1}'.format(basket_number, high_cell + 1) in filled_grid_numbers:
+        high_cell += 1
+
+    return GridBand(
+        basket_number=basket_number,
+        low=low_cell * grid_step,
+        high=(high_cell + 1) * grid_step,
+    )
+
+
+def get_strategy_instance(
+    strategy_type: str,
+    exchange_client: BaseClient,
+    dry_run: bool,
+    config: StrategyConfig | None = None,
+) -> BasicStrategy:
+    strategy_class: type[BasicStrategy] = {
+        'basic': BasicStrategy,
+        'floating': FloatingStrategy,
     }[strategy_type]
+    return strategy_class(
+        exchange_client=exchange_client,
+        dry_run=dry_run,
+        config=config,
+    )
@@ -0,0 +1,159 @@
+"""Strategy settings parsed once into immutable config."""
+import json
+import math
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import cached_property
+from decimal import Decimal
+
+from app.models import FloatingMatrix, FloatingStep
+from app.settings import AppSettings, app_settings
+
+
+@dataclass(frozen=True)
+class StrategyConfig:
+    """Strategy settings with baskets, stop loss steps and floating matrices parsed.
+
+    Baskets disabled is one basket with plain grid_step, continue_buy_amount and hold_position_limit.
+    Basket of price is the first threshold not less than price. Floating matrices are parsed
+    on first use, configs of other strategies never read them.
+    """
+    enabled: bool
+    strategy_type: str
+    avg_rate_sell_limit: Decimal
+    ticker_amount_digits: Decimal
+    ticker_price_digits: Decimal
+    multiple_sell_on_tick: bool
+    close_positions_only: bool
+    sell_and_buy_onetime_enabled: bool
+    buy_only_red_candles: bool
+
+    stop_loss_enabled: bool
+    # (max P/L, threshold) from the highest max P/L
+    stop_loss_steps: tuple[tuple[Decimal, Decimal], ...]
+    stop_loss_hard_enabled: bool
+    stop_loss_hard_threshold: Decimal
+    liquidation_enabled: bool
+    liquidation_threshold: Decimal
+    liquidation_max_tries: int
+    liquidation_order_ttl_minutes: int
+    liquidation_discount_percent_step: Decimal
+
+    baskets_thresholds: tuple[Decimal, ...]
+    buy_amounts: tuple[Decimal, ...]
+    hold_position_limits: tuple[int, ...]
+    grid_steps: tuple[Decimal, ...]
+    # baskets_floating_matrix json with baskets enabled, float_steps_path csv file without them
+    floating_matrix_json: str | None
+    float_steps_path: str
+
+    @cached_property
+    def floating_matrices(self) -> tuple[FloatingMatrix, ...]:
+        if self.floating_matrix_json is not None:
+            return tuple(
+                FloatingMatrix(matrix=[FloatingStep(percent=Decimal(value[0]), tries=int(value[1])) for value in raw_matrix])
+                for raw_matrix in json.loads(self.floating_matrix_json)
+            )
+        return (_load_floating_matrix(self.float_steps_path),)
+
+    @property
+    def price_digits(self) -> int:
+        """Decimal places of ticker_price_digits."""
+        return -int(self.ticker_price_digits.as_tuple().exponent)
+
+    def get_basket_number(self, tick_price: Decimal) -> int:
+        return bisect_left(self.baskets_thresholds, tick_price)
+
+    def get_continue_buy_amount(self, tick_price: Decimal) -> Decimal:
+        return self.buy_amounts[self.get_basket_number(tick_price)]
+
+    def get_grid_step(self, tick_price: Decimal) -> Decimal:
+        return self.grid_steps[self.get_basket_number(tick_price)]
+
+    def get_hold_position_limit(self, tick_price: Decimal) -> int:
+        return self.hold_position_limits[self.get_basket_number(tick_price)]
+
+    def get_floating_matrix(self, tick_price: Decimal) -> FloatingMatrix:
+        return self.floating_matrices[self.get_basket_number(tick_price)]
+
+    def get_total_deposit(self) -> Decimal:
+        summary = Decimal(0)
+        for buy_amount, hold_position_limit in zip(self.buy_amounts, self.hold_position_limits):
+            summary += Decimal(buy_amount) * Decimal(hold_position_limit)
+        return summary
+
+    def get_grid_number(self, price: Decimal) -> str:
+        """Return grid cell of price as app.grid.get_grid_num_by_price does."""
+        return '{0}_{1}'.format(
+            self.get_basket_number(price),
+            math.floor(price / self.get_grid_step(price)),
+        )
+
+    def get_minimal_sell_price(self, open_rate: Decimal) -> Decimal:
+        return open_rate + open_rate * self.avg_rate_sell_limit / Decimal(100)
+
+
+def get_strategy_config(settings: AppSettings = app_settings) -> StrategyConfig:
+    """Parse strategy settings, raise ValueError for baskets thresholds out of ascending order."""
+    if settings.baskets_enabled:
+        thresholds = tuple(Decimal(value) for value in settings.baskets_thresholds.split(';'))
+        if list(thresholds) != sorted(thresholds):
+            raise ValueError('Baskets thresholds must be in ascending order, got {0}'.format(settings.baskets_thresholds))
+        buy_amounts = tuple(Decimal(value) for value in settings.baskets_buy_amount.split(';'))
+        hold_position_limits = tuple(int(value) for value in settings.baskets_hold_position_limit.split(';'))
+        grid_steps = tuple(Decimal(value) for value in settings.baskets_grid_step.split(';'))
+    else:
+        thresholds = ()
+        buy_amounts = (settings.continue_buy_amount,)
+        hold_position_limits = (settings.hold_position_limit,)
+        grid_steps = (settings.grid_step,)
+
+    stop_loss_steps = sorted(
+        (
+            (Decimal(step.split(':')[0]), Decimal(step.split(':')[1]))
+            for step in settings.stop_loss_steps.split(';')
+        ),
+        key=lambda x: x[0],
+        reverse=True,
+    )
+
+    return StrategyConfig(
+        enabled=settings.enabled,
+        strategy_type=settings.strategy_type,
+        avg_rate_sell_limit=settings.avg_rate_sell_limit,
+        ticker_amount_digits=settings.ticker_amount_digits,
+        ticker_price_digits=settings.ticker_price_digits,
+        multiple_sell_on_tick=settings.multiple_sell_on_tick,
+        close_positions_only=settings.close_positions_only,
+        sell_and_buy_onetime_enabled=settings.sell_and_buy_onetime_enabled,
+        buy_only_red_candles=settings.buy_only_red_candles,
+        stop_loss_enabled=settings.stop_loss_enabled,
+        stop_loss_steps=tuple(stop_loss_steps),
+        stop_loss_hard_enabled=settings.stop_loss_hard_enabled,
+        stop_loss_hard_threshold=settings.stop_loss_hard_threshold,
+        liquidation_enabled=settings.liquidation_enabled,
+        liquidation_threshold=settings.liquidation_threshold,
+        liquidation_max_tries=settings.liquidation_max_tries,
+        liquidation_order_ttl_minutes=settings.liquidation_order_ttl_minutes,
+        liquidation_discount_percent_step=settings.liquidation_discount_percent_step,
+        baskets_thresholds=thresholds,
+        buy_amounts=buy_amounts,
+        hold_position_limits=hold_position_limits,
+        grid_steps=grid_steps,
+        floating_matrix_json=settings.baskets_floating_matrix if settings.baskets_enabled else None,
+        float_steps_path=settings.float_steps_path,
+    )
+
+
+def _load_floating_matrix(filepath: str) -> FloatingMatrix:
+    with open(filepath, 'r') as fd:
+        return FloatingMatrix(
+            matrix=[
+                FloatingStep(
+                    percent=Decimal(line.split(',')[0]),
+                    tries=int(line.split(',')[1]),
+                )
+                for index, line in enumerate(fd.readlines())
+                if index and line
+            ],
+        )
@@ -0,0 +1,49 @@
+"""Stream recorded bot telemetry from mysql for backtesting."""
+import logging
+from typing import Generator
+
+import pymysql
+from pymysql.cursors import SSDictCursor
+
+from app.settings import app_settings
+
+logger = logging.getLogger(__name__)
+
+_select_query = """SELECT `tick_number`, `tick_timestamp`, `bid`, `ask`
+FROM `telemetry`
+WHERE `bot_name` = %s AND `tick_timestamp` BETWEEN %s AND %s
+ORDER BY `tick_timestamp`, `tick_number`"""
+
+MAX_TIMESTAMP: int = 2 ** 32 - 1
+
+
+def iter_telemetry_rows(
+    bot_name: str,
+    start_timestamp: int = 0,
+    end_timestamp: int = MAX_TIMESTAMP,
+    batch_size: int = 10000,
+) -> Generator[dict, None, None]:
+    """Yield telemetry rows of bot by unbuffered server-side cursor, batch_size rows per network roundtrip.
+
+    Own connection used: server-side cursor blocks connection until all rows are read.
+    """
+    connection = pymysql.connect(
+        host=app_settings.mysql_host,
+        user=app_settings.mysql_user,
+        password=app_settings.mysql_password,
+        database=app_settings.mysql_db,
+        charset='utf8mb4',
+        cursorclass=SSDictCursor,
+    )
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(_select_query, (bot_name, start_timestamp, end_timestamp))
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+
+                logger.debug('telemetry replay: fetched {0} rows'.format(len(rows)))
+                yield from rows
+    finally:
+        connection.close()
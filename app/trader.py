@@ -9,6 +9,7 @@ from app import storage
 from app.exchange_client.base import BaseClient
 from app.exchange_client.binance import Binance
 from app.exchange_client.bybit import ByBit
+from app.rates_utils.recorder import TickRecorder
 from app.settings import app_settings
 from app.storage import connection_mysql, drop_state
 from app.strategy import BasicStrategy, get_strategy_instance
@@ -26,7 +27,6 @@ def force_exit_request(*args, **kwargs) -> None:  # type: ignore
 
 def main() -> None:
     exchange_client = _get_exchange_client(app_settings.exchange)
-    failure_counter: int = 0
 
     strategy = get_strategy_instance(
         strategy_type=app_settings.strategy_type,
@@ -37,6 +37,32 @@ def main() -> None:
     _restore_strategy_state(app_settings.instance_name, strategy)
     start_tick_numeration = strategy.get_last_tick().number if strategy.has_tick_history() else -1
 
+    recorder: TickRecorder | None = None
+    if app_settings.recorder_enabled:
+        recorder = TickRecorder(
+            exchange=app_settings.exchange,
+            symbol=app_settings.symbol,
+            flush_seconds=app_settings.recorder_flush_seconds,
+            rotate_seconds=app_settings.recorder_rotate_hours * 60 * 60,
+        )
+
+    try:
+        _trade(exchange_client, strategy, start_tick_numeration, recorder)
+    finally:
+        if recorder:
+            recorder.close()
+
+    strategy.save_results()
+
+
+def _trade(
+    exchange_client: BaseClient,
+    strategy: BasicStrategy,
+    start_tick_numeration: int,
+    recorder: TickRecorder | None = None,
+) -> None:
+    failure_counter: int = 0
+
     for tick in exchange_client.next_price(start_tick_numeration):
         logger.info('tick {0}'.format(tick))
         if _has_stop_request:
@@ -54,6 +80,8 @@ def main() -> None:
             continue
 
         failure_counter = 0
+        if recorder:
+            recorder.record(tick)
 
         go_to_next_step = strategy.tick(tick=tick)
         strategy.show_debug_info()
@@ -70,8 +98,6 @@ def main() -> None:
 
         _continue_or_break()
 
-    strategy.save_results()
-
 
 def _get_exchange_client(name: str) -> BaseClient:
     return {
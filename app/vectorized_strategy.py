@@ -0,0 +1,243 @@
+"""BasicStrategy over whole arrays of fixed-point prices.
+
+Most ticks change nothing: no open position reaches its sell price and the buy price stays
+in a filled grid cell, a full basket or a green candle. NumPy finds the next tick where
+BasicStrategy may act, only this tick goes through reference tick() logic, so Decimal
+results are exactly the same as the reference engine gives. Inert ticks in between
+update ticks history, max on hold and P/L stats only.
+"""
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal, localcontext
+
+import numpy as np
+import numpy.typing as npt
+
+from app.models import OnHoldPositions, PriceTriggers, TickBatch
+from app.strategy import BasicStrategy
+from app.strategy_config import StrategyConfig
+
+# grid number "{basket}_{cell}" as one int64 key
+GRID_KEY_BASE: int = 2 ** 40
+MIN_WINDOW: int = 64
+MAX_WINDOW: int = 1 << 20
+
+
+def check_vectorized_config(config: StrategyConfig) -> None:
+    """Raise ValueError for strategy config vectorized engine does not support."""
+    if config.strategy_type != 'basic':
+        raise ValueError('Vectorized engine supports basic strategy only, got {0}'.format(config.strategy_type))
+
+
+class BasketsBounds:
+    """Baskets settings as integer bounds for fixed-point prices.
+
+    Basket of price is the first threshold not less than price (the same as StrategyConfig.get_basket_number).
+    Baskets out of settings lists are always candidates, so reference logic fails on them as it does.
+    """
+
+    def __init__(self, config: StrategyConfig, price_digits: int) -> None:
+        self.price_digits = price_digits
+        self.buy_price_digits = config.price_digits
+
+        thresholds = config.baskets_thresholds
+        hold_limits = config.hold_position_limits
+        grid_steps = config.grid_steps
+
+        baskets_count = len(thresholds) + 1
+        # avg price (ask + bid) / 2 compared as ask + bid
+        self.avg_bounds = [_to_fixed_point(threshold * 2, price_digits, ROUND_FLOOR) for threshold in thresholds]
+        self.buy_price_bounds = [_to_fixed_point(threshold, self.buy_price_digits, ROUND_FLOOR) for threshold in thresholds]
+        self.hold_limits = np.array(
+            [hold_limits[num] if num < len(hold_limits) else np.iinfo(np.int64).max for num in range(baskets_count)],
+            dtype=np.int64,
+        )
+
+        # cell = floor(price / step) = price_int * denominator // (numerator * 10 ** buy_price_digits)
+        steps = [step.as_integer_ratio() for step in grid_steps[:baskets_count]]
+        steps += [(0, 1)] * (baskets_count - len(steps))
+        self.grid_numerators = np.array([numerator * 10 ** self.buy_price_digits for numerator, _ in steps], dtype=np.int64)
+        self.grid_denominators = np.array([denominator for _, denominator in steps], dtype=np.int64)
+
+    def get_avg_baskets(self, ask_plus_bid: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+        return _get_baskets(ask_plus_bid, self.avg_bounds)
+
+    def get_buy_prices(self, ask: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+        """Quantize ask to ticker_price_digits with half even rounding as Decimal.quantize does."""
+        shift = self.buy_price_digits - self.price_digits
+        if shift >= 0:
+            return ask * 10 ** shift
+
+        divisor = 10 ** -shift
+        quotient, remainder = np.divmod(ask, divisor)
+        round_up = (remainder * 2 > divisor) | ((remainder * 2 == divisor) & (quotient % 2 == 1))
+        return quotient + round_up
+
+    def get_grid_keys(self, buy_prices: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+        baskets = _get_baskets(buy_prices, self.buy_price_bounds)
+        numerators = self.grid_numerators[baskets]
+        # basket without grid step is never filled
+        cells = np.where(numerators > 0, buy_prices * self.grid_denominators[baskets] // np.maximum(numerators, 1), -1)
+        return np.where(cells >= 0, baskets * GRID_KEY_BASE + cells, -1)
+
+
+class VectorizedBasicStrategy(BasicStrategy):
+    """BasicStrategy running over whole bid/ask arrays, see module docstring."""
+
+    def run(self, batch: TickBatch) -> None:
+        """Process all ticks of batch."""
+        is_running = self.start(batch)
+        while is_running:
+            is_running = self.step()
+
+    def start(self, batch: TickBatch) -> bool:
+        """Process first tick, return False when nothing left to process."""
+        check_vectorized_config(self._config)
+
+        self._batch = batch
+        self._bounds = BasketsBounds(self._config, batch.price_digits)
+        self._grid_keys: dict[str, int] = {}
+        self._filled_grid_keys: npt.NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+        self._filled_grid_keys_triggers: PriceTriggers | None = None
+        self.row = len(batch)
+        self._window = MIN_WINDOW
+        if not len(batch) or not self.tick(batch.get_tick(0)):
+            return False
+
+        self.row = 1
+        return self.row < len(batch)
+
+    def step(self) -> bool:
+        """Skip inert ticks up to the next event tick and process it, return False when nothing left to process.
+
+        Row is the first not processed tick after step.
+        """
+        ticks_count = len(self._batch)
+        while self.row < ticks_count:
+            end = min(self.row + self._window, ticks_count)
+            events = np.flatnonzero(self._get_events_mask(self._bounds, self.row, end))
+            if not len(events):
+                self._skip_ticks(self.row, end)
+                self.row, self._window = end, min(self._window * 2, MAX_WINDOW)
+                continue
+
+            event_row = self.row + int(events[0])
+            if event_row > self.row:
+                self._skip_ticks(self.row, event_row)
+            self.row, self._window = event_row + 1, MIN_WINDOW
+            if not self.tick(self._batch.get_tick(event_row)):
+                self.row = ticks_count
+                return False
+            return self.row < ticks_count
+
+        return False
+
+    def _get_events_mask(self, bounds: BasketsBounds, start: int, end: int) -> npt.NDArray[np.bool_]:
+        """Mark ticks of [start, end) where current positions may be sold or new one bought.
+
+        Marks are a superset of real events: quantity checks are left to reference logic.
+        """
+        bid, ask, price_digits = self._batch.bid, self._batch.ask, self._batch.price_digits
+        window_bid = bid[start:end]
+        window_ask = ask[start:end]
+        price_triggers = self._get_price_triggers()
+
+        mask = np.zeros(end - start, dtype=np.bool_)
+        if price_triggers.sell_price is not None:
+            mask |= window_bid >= _to_fixed_point(price_triggers.sell_price, price_digits, ROUND_CEILING)
+
+        risk_trigger_price = self._get_window_risk_trigger_price(window_bid, price_triggers)
+        if risk_trigger_price.is_infinite():
+            mask |= risk_trigger_price > 0
+        else:
+            mask |= window_bid <= _to_fixed_point(risk_trigger_price, price_digits, ROUND_FLOOR)
+
+        if self._config.close_positions_only:
+            return mask
+
+        open_counts = np.array(
+            [price_triggers.basket_counts.get(basket_number, 0) for basket_number in range(len(bounds.hold_limits))],
+            dtype=np.int64,
+        )
+        is_basket_allowed = open_counts < bounds.hold_limits
+        buy_mask = is_basket_allowed[bounds.get_avg_baskets(window_ask + window_bid)]
+        if self._config.buy_only_red_candles:
+            buy_mask &= window_bid < bid[start - 1:end - 1]
+
+        buy_rows = np.flatnonzero(buy_mask)
+        if len(buy_rows):
+            grid_keys = bounds.get_grid_keys(bounds.get_buy_prices(window_ask[buy_rows]))
+            buy_mask[buy_rows] = ~np.isin(grid_keys, self._get_filled_grid_keys(price_triggers))
+
+        return mask | buy_mask
+
+    def _get_filled_grid_keys(self, price_triggers: PriceTriggers) -> npt.NDArray[np.int64]:
+        """Return filled grid cells as int64 keys, keys are parsed once per grid number."""
+        if self._filled_grid_keys_triggers is not price_triggers:
+            grid_keys = self._grid_keys
+            for grid_number in price_triggers.filled_grid_numbers:
+                if grid_number not in grid_keys:
+                    grid_keys[grid_number] = _get_grid_key(grid_number)
+            self._filled_grid_keys = np.fromiter(
+                (grid_keys[grid_number] for grid_number in price_triggers.filled_grid_numbers),
+                dtype=np.int64,
+                count=len(price_triggers.filled_grid_numbers),
+            )
+            self._filled_grid_keys_triggers = price_triggers
+        return self._filled_grid_keys
+
+    def _get_window_risk_trigger_price(self, window_bid: npt.NDArray[np.int64], price_triggers: PriceTriggers) -> Decimal:
+        """Return bid not lower than risk trigger price of any tick of window."""
+        if not self._config.stop_loss_enabled or price_triggers.open_quantity <= 0:
+            return self._get_risk_trigger_price()
+
+        # max P/L grows with bid inside window: trigger price of every window tick is not above
+        # the price of the highest window P/L with the lowest stop loss threshold
+        price_digits = self._batch.price_digits
+        max_pl = max(
+            self._stop_loss.max_pl,
+            self._get_current_pl(Decimal(int(window_bid.max())).scaleb(-price_digits)),
+        )
+        with localcontext() as ctx:
+            ctx.rounding = ROUND_CEILING
+            stop_loss_price = (max_pl - self._stop_loss.min_threshold - price_triggers.pl_base) / price_triggers.open_quantity
+
+        trigger_prices = [stop_loss_price, self._liquidation.get_trigger_price()]
+        if self._config.stop_loss_hard_enabled:
+            trigger_prices.append(self._config.stop_loss_hard_threshold)
+        return max(trigger_prices)
+
+    def _skip_ticks(self, start: int, end: int) -> None:
+        """Apply inert ticks [start, end): the same ticks history and stats as reference tick() leaves."""
+        bid, price_digits = self._batch.bid, self._batch.price_digits
+        # P/L is monotonic by bid, max P/L of skipped ticks is P/L of the highest bid
+        max_bid = Decimal(int(bid[start:end].max())).scaleb(-price_digits)
+        self._stop_loss.update_max_pl(self._get_current_pl(max_bid))
+
+        for row in range(max(start, end - self.tick_history_limit), end):
+            self._push_ticks_history(self._batch.get_tick(row))
+
+        last_tick = self.get_last_tick()
+        self._current_pl = self._get_current_pl(last_tick.bid)
+        on_hold_current = OnHoldPositions(
+            quantity=self._results_accumulator.open_qty,
+            buy_amount=self._results_accumulator.open_amount,
+            tick_number=last_tick.number,
+            tick_rate=last_tick.bid,
+        )
+        if not self._max_onhold_positions or self._max_onhold_positions.buy_amount <= on_hold_current.buy_amount:
+            self._max_onhold_positions = on_hold_current
+
+
+def _to_fixed_point(value: Decimal, digits: int, rounding: str) -> int:
+    return int(value.scaleb(digits).to_integral_value(rounding=rounding))
+
+
+def _get_grid_key(grid_number: str) -> int:
+    basket_number, cell = grid_number.split('_')
+    return int(basket_number) * GRID_KEY_BASE + int(cell)
+
+
+def _get_baskets(prices: npt.NDArray[np.int64], bounds: list[int]) -> npt.NDArray[np.int64]:
+    baskets = np.full(len(prices), len(bounds), dtype=np.int64)
+    for num in range(len(bounds) - 1, -1, -1):
+        baskets[prices <= bounds[num]] = num
+    return baskets
@@ -0,0 +1,262 @@
+import os
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import GeneratorType
+from unittest.mock import Mock
+
+import pytest
+
+from app.backtester import (
+    FollowResults,
+    get_rates,
+    iter_catalog_rates,
+    iter_follow_rates,
+    iter_rates,
+    iter_telemetry_rates,
+    run_backtest,
+)
+from app.exchange_client.base import AggTrade, HistoryPrice
+from app.models import Tick
+from app.rates_utils.cache import get_cache_path
+from app.rates_utils.compression import COMPRESSION_EXTENSIONS, open_rates
+from app.rates_utils.store import history_to_columns, save_store
+from app.rates_utils.ticks import TicksWriter
+from app.rates_utils.trades import TradesWriter
+from app.settings import app_settings
+
+
+def test_get_rates_happy_path(rates_file: str):
+    response = get_rates(rates_file)
+
+    assert isinstance(response, list)
+    assert len(response) == 5
+    assert [tick.number for tick in response] == [0, 1, 2, 3, 4]
+    assert response[0].bid == response[0].ask == Decimal('21.79')
+    assert response[-1].bid == Decimal('21.72')
+
+
+def test_get_rates_every_n_tick(rates_file: str):
+    response = get_rates(rates_file, use_every_n_tick=2)
+
+    assert [tick.bid for tick in response] == [Decimal('21.58'), Decimal('21.64')]
+
+
+def test_get_rates_date_range(rates_file: str):
+    response = get_rates(
+        rates_file,
+        start_date=datetime(2023, 4, 23, 9, tzinfo=timezone.utc),
+        end_date=datetime(2023, 4, 23, 10, tzinfo=timezone.utc),
+    )
+
+    assert [tick.bid for tick in response] == [Decimal('21.58'), Decimal('21.6')]
+    assert [tick.number for tick in response] == [0, 1]
+
+
+def test_iter_rates_lazy(rates_file: str):
+    response = iter_rates(rates_file)
+
+    assert isinstance(response, GeneratorType)
+    assert next(response).bid == Decimal('21.79')
+    assert [tick.number for tick in response] == [1, 2, 3, 4]
+
+
+def test_get_rates_cache_disabled(rates_cache_disabled, rates_file: str):
+    response = get_rates(rates_file, use_every_n_tick=2)
+
+    assert [tick.bid for tick in response] == [Decimal('21.58'), Decimal('21.64')]
+
+
+def test_get_rates_same_with_cache(rates_path: str, rates_file: str, monkeypatch):
+    monkeypatch.setattr(app_settings, 'rates_cache_enabled', False)
+    expected = get_rates(rates_file)
+    monkeypatch.setattr(app_settings, 'rates_cache_enabled', True)
+
+    response = get_rates(rates_file)
+
+    assert os.path.exists(get_cache_path(os.path.join(rates_path, rates_file)))
+    # cached prices have common exponent: 21.60 instead of 21.6
+    assert [(tick.number, tick.bid.normalize(), tick.ask.normalize(), tick.bid_qty, tick.ask_qty) for tick in response] == [
+        (tick.number, tick.bid.normalize(), tick.ask.normalize(), tick.bid_qty, tick.ask_qty) for tick in expected
+    ]
+
+
+def test_get_rates_source_exponents(rates_path: str, rates_file: str):
+    response = get_rates(rates_file)
+
+    assert [str(tick.bid) for tick in response] == ['21.79', '21.58', '21.6', '21.64', '21.72']
+    assert not os.path.exists(get_cache_path(os.path.join(rates_path, rates_file)))
+
+
+def test_get_rates_date_range_cache_disabled(rates_cache_disabled, rates_file: str):
+    response = get_rates(
+        rates_file,
+        start_date=datetime(2023, 4, 23, 9, tzinfo=timezone.utc),
+        end_date=datetime(2023, 4, 23, 11, tzinfo=timezone.utc),
+        use_every_n_tick=2,
+    )
+
+    assert [tick.bid for tick in response] == [Decimal('21.58'), Decimal('21.64')]
+
+
+def test_get_rates_intrabar(rates_file: str):
+    response = get_rates(rates_file, intrabar_steps=1)
+
+    assert len(response) == 5 * 4
+    assert [tick.bid for tick in response[:4]] == [Decimal('21.79'), Decimal('21.8'), Decimal('21.44'), Decimal('21.58')]
+    assert [tick.number for tick in response] == list(range(20))
+
+
+def test_get_rates_intrabar_cache_disabled(rates_cache_disabled, rates_file: str):
+    response = get_rates(rates_file, intrabar_steps=2)
+
+    assert len(response) == 5 * 7
+    assert response[-1].bid == Decimal('21.75')
+
+
+def test_iter_catalog_rates(catalog_files: list[str]):
+    response = list(iter_catalog_rates(
+        'SOLUSDT',
+        '5m',
+        start_date=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        end_date=datetime(2023, 1, 2, tzinfo=timezone.utc),
+    ))
+
+    assert [tick.bid for tick in response] == [Decimal('10.1'), Decimal('10.6')]
+
+
+@pytest.mark.parametrize('compression', list(COMPRESSION_EXTENSIONS))
+def test_get_rates_compressed(rates_path: str, rates_file: str, compression: str):
+    with open(os.path.join(rates_path, rates_file)) as fd:
+        content = fd.read()
+    compressed_filename = rates_file + COMPRESSION_EXTENSIONS[compression]
+    with open_rates(os.path.join(rates_path, compressed_filename), 'wt') as fd:
+        fd.write(content)
+
+    response = get_rates(compressed_filename)
+
+    assert response == get_rates(rates_file)
+
+
+@pytest.mark.parametrize('compression', list(COMPRESSION_EXTENSIONS))
+def test_get_rates_compressed_cache_disabled(rates_cache_disabled, rates_path: str, rates_file: str, compression: str):
+    with open(os.path.join(rates_path, rates_file)) as fd:
+        content = fd.read()
+    compressed_filename = rates_file + COMPRESSION_EXTENSIONS[compression]
+    with open_rates(os.path.join(rates_path, compressed_filename), 'wt') as fd:
+        fd.write(content)
+
+    response = get_rates(
+        compressed_filename,
+        start_date=datetime(2023, 4, 23, 9, tzinfo=timezone.utc),
+        end_date=datetime(2023, 4, 23, 10, tzinfo=timezone.utc),
+    )
+
+    assert [tick.bid for tick in response] == [Decimal('21.58'), Decimal('21.6')]
+
+
+def test_get_rates_resample(rates_file: str):
+    response = get_rates(rates_file, resample_interval='4h')
+
+    assert [tick.bid for tick in response] == [Decimal('21.79'), Decimal('21.72')]
+
+
+def test_get_rates_resample_cache_disabled(rates_cache_disabled, rates_file: str):
+    response = get_rates(rates_file, resample_interval='4h', intrabar_steps=1)
+
+    assert [tick.bid for tick in response] == [
+        Decimal('21.79'), Decimal('21.8'), Decimal('21.44'), Decimal('21.72'),
+        Decimal('21.72'), Decimal('21.7'), Decimal('21.8'), Decimal('21.75'),
+    ]
+
+
+def test_iter_follow_rates(rates_file: str):
+    response = list(iter_follow_rates(
+        rates_file,
+        start_date=datetime(2023, 4, 23, 9, tzinfo=timezone.utc),
+        end_date=datetime(2023, 4, 23, 10, tzinfo=timezone.utc),
+        poll_interval=0.01,
+        idle_timeout=1,
+    ))
+
+    assert [tick.bid for tick in response] == [Decimal('21.58'), Decimal('21.6')]
+    assert [tick.number for tick in response] == [0, 1]
+
+
+def test_iter_telemetry_rates(monkeypatch):
+    rows = [
+        {'tick_number': 7, 'tick_timestamp': 1700000000, 'bid': Decimal('10.1'), 'ask': Decimal('10.2')},
+        {'tick_number': 9, 'tick_timestamp': 1700000005, 'bid': Decimal('10.0'), 'ask': Decimal('10.3')},
+    ]
+    monkeypatch.setattr('app.backtester.iter_telemetry_rows', lambda *args: iter(rows))
+
+    response = list(iter_telemetry_rates('trader-1'))
+
+    assert [(tick.number, tick.bid, tick.ask) for tick in response] == [
+        (0, Decimal('10.1'), Decimal('10.2')),
+        (1, Decimal('10.0'), Decimal('10.3')),
+    ]
+
+
+def test_get_rates_trades_file(rates_path: str):
+    with TradesWriter(os.path.join(rates_path, 'test.trades')) as writer:
+        writer.write([
+            AggTrade(trade_id=1, price=Decimal('21.79'), qty=Decimal(1), timestamp=1700000000000),
+            AggTrade(trade_id=2, price=Decimal('21.7'), qty=Decimal(2), timestamp=1700000000500),
+        ])
+
+    response = get_rates('test.trades')
+
+    assert [tick.bid for tick in response] == [Decimal('21.79'), Decimal('21.7')]
+
+
+def test_get_rates_store(rates_cache_disabled, rates_path: str):
+    save_store(os.path.join(rates_path, 'binance_SOLUSDT_1h_range.rates'), history_to_columns([
+        HistoryPrice(price=Decimal('21.79'), timestamp=1682236800000, high=Decimal('21.8'), low=Decimal('21.44'), close=Decimal('21.58')),
+        HistoryPrice(price=Decimal('21.58'), timestamp=1682240400000, high=Decimal('21.68'), low=Decimal('21.54'), close=Decimal('21.6')),
+    ]))
+
+    response = get_rates('binance_SOLUSDT_1h_range.rates', intrabar_steps=1)
+
+    assert [tick.bid for tick in response] == [
+        Decimal('21.79'), Decimal('21.8'), Decimal('21.44'), Decimal('21.58'),
+        Decimal('21.58'), Decimal('21.54'), Decimal('21.68'), Decimal('21.6'),
+    ]
+
+
+def test_get_rates_ticks_file(rates_path: str):
+    with TicksWriter(os.path.join(rates_path, 'test.ticks')) as writer:
+        writer.write([
+            (1682236800000, Tick(number=5, bid=Decimal('21.79'), ask=Decimal('21.8'), bid_qty=Decimal('1.5'), ask_qty=Decimal(2))),
+            (1682236805000, Tick(number=6, bid=Decimal('21.7'), ask=Decimal('21.75'), bid_qty=Decimal(3), ask_qty=Decimal('0.5'))),
+            (1682236810000, Tick(number=7, bid=Decimal('21.72'), ask=Decimal('21.74'), bid_qty=Decimal(1), ask_qty=Decimal(1))),
+        ])
+
+    response = get_rates(
+        'test.ticks',
+        start_date=datetime(2023, 4, 23, 8, 0, 5, tzinfo=timezone.utc),
+        end_date=datetime(2023, 4, 23, 8, 0, 10, tzinfo=timezone.utc),
+    )
+
+    assert [(tick.number, tick.bid, tick.ask, tick.bid_qty, tick.ask_qty) for tick in response] == [
+        (0, Decimal('21.7'), Decimal('21.75'), Decimal(3), Decimal('0.5')),
+        (1, Decimal('21.72'), Decimal('21.74'), Decimal(1), Decimal(1)),
+    ]
+
+
+def test_run_backtest_follow_results_while_idle(rates_file: str, monkeypatch):
+    monkeypatch.setattr(app_settings, 'follow_show_results_seconds', 0)
+    strategy = Mock()
+    strategy.tick = Mock(return_value=True)
+    monkeypatch.setattr('app.backtester.get_strategy_instance', lambda **kwargs: strategy)
+    follow_results = FollowResults()
+
+    run_backtest(
+        iter_follow_rates(rates_file, poll_interval=0.01, idle_timeout=0.2, on_idle=follow_results),
+        follow=True,
+        show_results=False,
+        follow_results=follow_results,
+    )
+
+    # five ticks, the rest is shown while rates file is idle
+    assert strategy.tick.call_count == 5
+    assert strategy.show_results.call_count > 10
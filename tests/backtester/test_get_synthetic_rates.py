@@ -0,0 +1,30 @@
+from decimal import Decimal
+
+from app.backtester import get_synthetic_rates
+from app.settings import app_settings
+
+
+def test_get_synthetic_rates_gbm():
+    response = get_synthetic_rates('gbm', paths=2, steps=50, seed=1, start_price=Decimal('21.79'), price_digits=2)
+
+    assert len(response) == 2
+    ticks = list(response[0])
+    assert len(ticks) == 51
+    assert [tick.number for tick in ticks[:3]] == [0, 1, 2]
+    assert ticks[0].bid == ticks[0].ask == Decimal('21.79')
+    assert ticks[1].bid.as_tuple().exponent == -2
+    assert [tick.bid for tick in ticks] == [
+        tick.bid for tick in get_synthetic_rates('gbm', paths=2, steps=50, seed=1, start_price=Decimal('21.79'), price_digits=2)[0]
+    ]
+
+
+def test_get_synthetic_rates_bootstrap(rates_path: str, rates_file: str, monkeypatch):
+    monkeypatch.setattr(app_settings, 'rates_filename', rates_file)
+
+    response = get_synthetic_rates('bootstrap', paths=3, steps=2, seed=1, block_size=2)
+
+    assert len(response) == 3
+    for path_ticks in response:
+        ticks = list(path_ticks)
+        assert len(ticks) == 3
+        assert ticks[0].bid == Decimal('21.58')
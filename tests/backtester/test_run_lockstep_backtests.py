@@ -0,0 +1,66 @@
+from decimal import Decimal
+
+import pytest
+
+from app.backtester import (
+    get_synthetic_columns,
+    run_lockstep_backtests,
+    run_parallel_backtests,
+    run_vectorized_backtest,
+    validate_settings,
+)
+from app.settings import app_settings
+from tests.helpers import get_stable_results
+
+_SETTINGS_GRID = [
+    {},
+    {'grid_step': '0.25'},
+    {'avg_rate_sell_limit': '1.5', 'buy_only_red_candles': False},
+    {
+        'baskets_enabled': True,
+        'baskets_thresholds': '99;101',
+        'baskets_buy_amount': '20;10;5',
+        'baskets_hold_position_limit': '8;4;2',
+        'baskets_grid_step': '0.25;0.5;1',
+    },
+]
+
+
+def test_run_lockstep_backtests(grid_settings):
+    columns = get_synthetic_columns('gbm', steps=5000, seed=11)[0]
+    expected = [
+        run_vectorized_backtest(
+            columns.open,
+            columns.price_digits,
+            show_results=False,
+            settings=app_settings.model_copy(update=validate_settings(overrides)),
+        ).get_results()
+        for overrides in _SETTINGS_GRID
+    ]
+
+    response = run_lockstep_backtests(_SETTINGS_GRID, columns.open, columns.price_digits)
+
+    assert [get_stable_results(results) for results in response] == [get_stable_results(results) for results in expected]
+    assert len({results['count_buy_transactions'] for results in response}) > 1
+    assert app_settings.grid_step == Decimal('0.5')
+    assert app_settings.baskets_enabled is False
+
+
+def test_run_lockstep_backtests_own_strategy_type(grid_settings, monkeypatch):
+    monkeypatch.setattr(app_settings, 'strategy_type', 'floating')
+    columns = get_synthetic_columns('gbm', steps=100, seed=11)[0]
+
+    response = run_lockstep_backtests([{'strategy_type': 'basic'}], columns.open, columns.price_digits)
+
+    assert len(response) == 1
+    with pytest.raises(ValueError):
+        run_lockstep_backtests([{}], columns.open, columns.price_digits)
+
+
+def test_run_lockstep_backtests_parallel(grid_settings, rates_file: str, monkeypatch):
+    monkeypatch.setattr(app_settings, 'rates_filename', rates_file)
+    expected = run_parallel_backtests(_SETTINGS_GRID, workers=2)
+
+    response = run_parallel_backtests(_SETTINGS_GRID, workers=2, engine='vectorized')
+
+    assert [get_stable_results(results) for results in response] == [get_stable_results(results) for results in expected]
@@ -0,0 +1,50 @@
+from decimal import Decimal
+
+import pytest
+
+from app.backtester import iter_rates, run_backtest, run_parallel_backtests, validate_settings
+from app.settings import app_settings
+
+
+def _without_start_date(results: dict) -> dict:
+    return {key: value for key, value in results.items() if key != 'start_date'}
+
+
+def test_run_parallel_backtests(rates_file: str, monkeypatch):
+    monkeypatch.setattr(app_settings, 'rates_filename', rates_file)
+    expected = _without_start_date(run_backtest(iter_rates(rates_file), show_results=False).get_results())
+
+    response = run_parallel_backtests(
+        [{}, {'baskets_enabled': False, 'hold_position_limit': 2, 'continue_buy_amount': '20'}],
+        workers=2,
+    )
+
+    assert len(response) == 2
+    assert _without_start_date(response[0]) == expected
+    assert response[1]['invest_body'] == 40.0
+    assert app_settings.continue_buy_amount != Decimal(20)
+
+
+def test_run_parallel_backtests_same_worker(rates_file: str, monkeypatch):
+    monkeypatch.setattr(app_settings, 'rates_filename', rates_file)
+    expected = _without_start_date(run_backtest(iter_rates(rates_file), show_results=False).get_results())
+
+    response = run_parallel_backtests(
+        [{'baskets_enabled': False, 'hold_position_limit': 2, 'continue_buy_amount': '20'}, {}],
+        workers=1,
+    )
+
+    assert response[0]['invest_body'] == 40.0
+    assert _without_start_date(response[1]) == expected
+
+
+def test_validate_settings():
+    response = validate_settings({'continue_buy_amount': '20.5'})
+
+    assert response == {'continue_buy_amount': Decimal('20.5')}
+    assert app_settings.continue_buy_amount != Decimal('20.5')
+
+
+def test_validate_settings_unknown():
+    with pytest.raises(ValueError):
+        validate_settings({'unknown_setting': 1})
@@ -0,0 +1,96 @@
+import os
+from decimal import Decimal
+
+import pytest
+
+from app.backtester import (
+    _get_columns_prices,
+    _get_range_rows,
+    _load_columns,
+    get_synthetic_columns,
+    iter_rates,
+    run_backtest,
+    run_vectorized_backtest,
+)
+from app.settings import app_settings
+from tests.helpers import get_stable_results, run_reference_backtest
+
+
+@pytest.mark.parametrize('overrides', [
+    {},
+    {'buy_only_red_candles': False, 'multiple_sell_on_tick': True},
+    {'sell_and_buy_onetime_enabled': True, 'ticker_price_digits': Decimal('0.1')},
+    {
+        'baskets_enabled': True,
+        'baskets_thresholds': '99;101',
+        'baskets_buy_amount': '20;10;5',
+        'baskets_hold_position_limit': '8;4;2',
+        'baskets_grid_step': '0.25;0.5;1',
+    },
+    {'stop_loss_enabled': True, 'stop_loss_steps': '0:3;10:5'},
+    {'stop_loss_enabled': True, 'stop_loss_steps': '0:20;1:0.5'},
+    {'stop_loss_hard_enabled': True, 'stop_loss_hard_threshold': Decimal(95)},
+    {'liquidation_enabled': True, 'liquidation_threshold': Decimal(95)},
+])
+def test_run_vectorized_backtest_synthetic(grid_settings, monkeypatch, overrides: dict):
+    for name, value in overrides.items():
+        monkeypatch.setattr(app_settings, name, value)
+    columns = get_synthetic_columns('gbm', steps=5000, seed=7)[0]
+
+    expected = run_reference_backtest(columns).get_results()
+    response = run_vectorized_backtest(columns.open, columns.price_digits, show_results=False).get_results()
+
+    assert expected['count_buy_transactions'] > 1
+    assert get_stable_results(response) == get_stable_results(expected)
+
+
+@pytest.mark.parametrize('overrides', [
+    {},
+    {'buy_only_red_candles': False, 'grid_step': Decimal('0.3'), 'continue_buy_amount': Decimal('7.77')},
+    {'ticker_price_digits': Decimal('0.001'), 'ticker_amount_digits': Decimal('0.0001')},
+    {
+        'baskets_enabled': True,
+        'baskets_thresholds': '99;101',
+        'baskets_buy_amount': '20;10;5',
+        'baskets_hold_position_limit': '8;4;2',
+        'baskets_grid_step': '0.25;0.5;1',
+    },
+])
+def test_run_vectorized_backtest_overrides(grid_settings, monkeypatch, overrides: dict):
+    for name, value in overrides.items():
+        monkeypatch.setattr(app_settings, name, value)
+    columns = get_synthetic_columns('gbm', steps=5000, seed=9)[0]
+
+    expected = run_reference_backtest(columns).get_results()
+    response = run_vectorized_backtest(columns.open, columns.price_digits, show_results=False).get_results()
+
+    assert expected['count_buy_transactions'] > 1
+    assert get_stable_results(response) == get_stable_results(expected)
+
+
+def test_run_vectorized_backtest_ticks_history(grid_settings):
+    columns = get_synthetic_columns('gbm', steps=5000, seed=7)[0]
+
+    expected = run_reference_backtest(columns)
+    response = run_vectorized_backtest(columns.open, columns.price_digits, show_results=False)
+
+    assert len(response._ticks_history) == response.tick_history_limit
+    assert response._ticks_history == expected._ticks_history
+
+
+def test_run_vectorized_backtest_intrabar(grid_settings, rates_file: str):
+    columns = _load_columns(os.path.join(app_settings.rates_path, rates_file))
+    prices = _get_columns_prices(columns, _get_range_rows(columns.timestamp, 1), intrabar_steps=3)
+
+    expected = run_backtest(iter_rates(rates_file, intrabar_steps=3), show_results=False).get_results()
+    response = run_vectorized_backtest(prices, columns.price_digits, show_results=False).get_results()
+
+    assert get_stable_results(response) == get_stable_results(expected)
+
+
+def test_run_vectorized_backtest_unsupported(grid_settings, monkeypatch):
+    monkeypatch.setattr(app_settings, 'strategy_type', 'floating')
+    columns = get_synthetic_columns('gbm', steps=10, seed=7)[0]
+
+    with pytest.raises(ValueError):
+        run_vectorized_backtest(columns.open, columns.price_digits, show_results=False)
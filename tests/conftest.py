@@ -1,3 +1,4 @@
+import os
 from decimal import Decimal
 from unittest.mock import Mock
 
@@ -104,3 +105,74 @@ def hard_stop_loss_enabled() -> Decimal:
     app_settings.stop_loss_hard_threshold = stop_loss_threshold_state
 
 
+@pytest.fixture
+def grid_settings(monkeypatch) -> None:
+    """Plain grid strategy without baskets, with buys on every 0.5 price step."""
+    monkeypatch.setattr(app_settings, 'enabled', True)
+    monkeypatch.setattr(app_settings, 'baskets_enabled', False)
+    monkeypatch.setattr(app_settings, 'grid_step', Decimal('0.5'))
+    monkeypatch.setattr(app_settings, 'continue_buy_amount', Decimal(10))
+    monkeypatch.setattr(app_settings, 'hold_position_limit', 30)
+    monkeypatch.setattr(app_settings, 'avg_rate_sell_limit', Decimal('0.5'))
+
+
+@pytest.fixture
+def rates_path(tmp_path) -> str:
+    rates_path_state = app_settings.rates_path
+    app_settings.rates_path = str(tmp_path)
+    yield str(tmp_path)
+    app_settings.rates_path = rates_path_state
+
+
+@pytest.fixture
+def rates_file(rates_path: str) -> str:
+    filename = 'test_rates.csv'
+    with open(os.path.join(rates_path, filename), 'w') as fd:
+        fd.write('time,open,high,low,close\n')
+        fd.write('2023-04-23T08:00:00+08:00,21.79,21.8,21.44,21.58\n')
+        fd.write('2023-04-23T09:00:00+08:00,21.58,21.68,21.54,21.6\n')
+        fd.write('2023-04-23T10:00:00+08:00,21.6,21.66,21.54,21.64\n')
+        fd.write('2023-04-23T11:00:00+08:00,21.64,21.77,21.63,21.72\n')
+        fd.write('2023-04-23T12:00:00+08:00,21.72,21.8,21.7,21.75\n')
+    yield filename
+
+
+@pytest.fixture
+def rates_cache_disabled() -> None:
+    saved_state = app_settings.rates_cache_enabled
+    app_settings.rates_cache_enabled = False
+    yield
+    app_settings.rates_cache_enabled = saved_state
+
+
+@pytest.fixture
+def catalog_files(rates_path: str) -> list[str]:
+    files = {
+        'binance_SOLUSDT_1m_2023-01-01_00-00-00_2023-01-01_00-04-00.csv': [
+            ('2023-01-01T00:00:00', '10.1'),
+            ('2023-01-01T00:01:00', '10.2'),
+            ('2023-01-01T00:02:00', '10.3'),
+            ('2023-01-01T00:03:00', '10.4'),
+            ('2023-01-01T00:04:00', '10.5'),
+        ],
+        'binance_SOLUSDT_1m_2023-01-01_00-03-00_2023-01-01_00-06-00.csv': [
+            ('2023-01-01T00:03:00', '10.4'),
+            ('2023-01-01T00:04:00', '10.5'),
+            ('2023-01-01T00:05:00', '10.65'),
+            ('2023-01-01T00:06:00', '10.7'),
+        ],
+        'binance_SOLUSDT_1m_2023-01-01_00-10-00_2023-01-01_00-11-00.csv': [
+            ('2023-01-01T00:10:00', '11'),
+            ('2023-01-01T00:11:00', '12'),
+        ],
+        'binance_SOLUSDT_5m_2023-01-01_00-00-00_2023-01-01_00-05-00.csv': [
+            ('2023-01-01T00:00:00', '10.1'),
+            ('2023-01-01T00:05:00', '10.6'),
+        ],
+    }
+    for filename, rows in files.items():
+        with open(os.path.join(rates_path, filename), 'w') as fd:
+            fd.write('time,open\n')
+            for row in rows:
+                fd.write('{0},{1}\n'.format(*row))
+    yield list(files)
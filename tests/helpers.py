@@ -0,0 +1,16 @@
+"""Helpers of tests comparing backtest engines and strategy fast paths with reference tick by tick run."""
+from app.backtester import _columns_to_ticks, run_backtest
+from app.rates_utils.columns import RatesColumns
+from app.strategy import BasicStrategy
+
+# start_date and xirr depend on wall clock
+VOLATILE_RESULTS = ('start_date', 'xirr')
+
+
+def get_stable_results(results: dict) -> dict:
+    return {key: value for key, value in results.items() if key not in VOLATILE_RESULTS}
+
+
+def run_reference_backtest(columns: RatesColumns) -> BasicStrategy:
+    """Backtest open prices of all columns rows tick by tick."""
+    return run_backtest(_columns_to_ticks(columns, slice(0, len(columns))), show_results=False)
@@ -0,0 +1,29 @@
+from decimal import Decimal
+
+from app.liquidation import Liquidation
+from app.models import Tick
+
+
+def test_get_trigger_price_disabled_by_settings() -> None:
+    instance = Liquidation()
+
+    result = instance.get_trigger_price()
+
+    assert result == Decimal('-Infinity')
+
+
+def test_get_trigger_price(liquidation_enabled) -> None:
+    instance = Liquidation()
+
+    result = instance.get_trigger_price()
+
+    assert result == Decimal(10)
+
+
+def test_get_trigger_price_active(liquidation_enabled) -> None:
+    instance = Liquidation()
+    instance.is_active(Tick(number=0, bid=Decimal(10), ask=Decimal(100500)))
+
+    result = instance.get_trigger_price()
+
+    assert result == Decimal('Infinity')
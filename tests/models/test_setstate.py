@@ -0,0 +1,52 @@
+import copy
+import pickle
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.models import Fee, OnHoldPositions, Position, Tick
+
+
+class _DictStateReduce:
+    """Pickle as models without slots did: class and instance __dict__."""
+
+    def __init__(self, cls: type, state: dict) -> None:
+        self.cls = cls
+        self.state = state
+
+    def __reduce__(self) -> tuple:
+        return object.__new__, (self.cls,), self.state
+
+
+_MODELS = [
+    Fee(qty=Decimal('0.1'), ticker='USDT'),
+    Position(
+        amount=Decimal('0.5'),
+        open_tick_number=1,
+        open_rate=Decimal('21.79'),
+        open_fee=Fee(qty=Decimal('0.01'), ticker='BNB'),
+        open_tick_datetime=datetime(2023, 4, 23),
+        grid_number='1_43',
+        basket_number=1,
+    ),
+    OnHoldPositions(quantity=Decimal(1), buy_amount=Decimal(10), tick_number=2, tick_rate=Decimal(10)),
+    Tick(number=3, bid=Decimal(9), ask=Decimal(11), bid_qty=Decimal(100500), ask_qty=Decimal(100500)),
+]
+
+
+@pytest.mark.parametrize('model', _MODELS)
+def test_setstate_dict_state(model):
+    state = {name: getattr(model, name) for name in model.__slots__}
+
+    response = pickle.loads(pickle.dumps(_DictStateReduce(type(model), state)))
+
+    assert type(response) is type(model)
+    assert response == model
+
+
+@pytest.mark.parametrize('model', _MODELS)
+def test_setstate_slots_state(model):
+    assert not hasattr(model, '__dict__')
+    assert pickle.loads(pickle.dumps(model)) == model
+    assert copy.deepcopy(model) == model
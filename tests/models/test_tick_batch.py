@@ -0,0 +1,45 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.models import Tick, TickBatch
+
+
+def test_tick_batch_iter():
+    prices = np.array([2179, 2180, 2175], dtype=np.int64)
+    batch = TickBatch(bid=prices, ask=prices, price_digits=2, tick_qty=Decimal(100500), first_number=10)
+
+    response = list(batch)
+
+    assert len(batch) == 3
+    assert response == [
+        Tick(number=10, bid=Decimal('21.79'), ask=Decimal('21.79'), bid_qty=Decimal(100500), ask_qty=Decimal(100500)),
+        Tick(number=11, bid=Decimal('21.80'), ask=Decimal('21.80'), bid_qty=Decimal(100500), ask_qty=Decimal(100500)),
+        Tick(number=12, bid=Decimal('21.75'), ask=Decimal('21.75'), bid_qty=Decimal(100500), ask_qty=Decimal(100500)),
+    ]
+    assert response[0].bid is response[0].ask
+
+
+def test_tick_batch_quantities():
+    batch = TickBatch(
+        bid=np.array([2179], dtype=np.int64),
+        ask=np.array([2180], dtype=np.int64),
+        price_digits=2,
+        bid_qty=np.array([15], dtype=np.int64),
+        ask_qty=np.array([5], dtype=np.int64),
+        qty_digits=1,
+    )
+
+    response = batch.get_tick(0)
+
+    assert response == Tick(number=0, bid=Decimal('21.79'), ask=Decimal('21.8'), bid_qty=Decimal('1.5'), ask_qty=Decimal('0.5'))
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'bid': np.array([1, 2], dtype=np.int64), 'ask': np.array([1], dtype=np.int64)},
+    {'bid': np.array([1], dtype=np.int64), 'ask': np.array([1], dtype=np.int64), 'bid_qty': np.array([1], dtype=np.int64)},
+])
+def test_tick_batch_invalid(kwargs: dict):
+    with pytest.raises(ValueError):
+        TickBatch(price_digits=0, **kwargs)
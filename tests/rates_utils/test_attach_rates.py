@@ -0,0 +1,46 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from app.rates_utils.columns import RatesColumns
+from app.rates_utils.shared import SharedRates, SharedRatesHandle, attach_rates
+
+
+def _columns(volume: bool = False) -> RatesColumns:
+    return RatesColumns(
+        timestamp=np.array([1000, 2000, 3000], dtype=np.int64),
+        open=np.array([2179, 2158, 2160], dtype=np.int64),
+        high=np.array([2180, 2168, 2164], dtype=np.int64),
+        low=np.array([2144, 2154, 2150], dtype=np.int64),
+        close=np.array([2158, 2160, 2164], dtype=np.int64),
+        price_digits=2,
+        volume=np.array([5, 10, 15], dtype=np.int64) if volume else None,
+        volume_digits=1 if volume else 0,
+    )
+
+
+def _sum_close(handle: SharedRatesHandle) -> int:
+    return int(attach_rates(handle).close.sum())
+
+
+def test_attach_rates():
+    with SharedRates(_columns(volume=True)) as shared_rates:
+        response = attach_rates(shared_rates.handle)
+
+        assert list(response.timestamp) == [1000, 2000, 3000]
+        assert list(response.high) == [2180, 2168, 2164]
+        assert list(response.close) == [2158, 2160, 2164]
+        assert response.volume is not None
+        assert list(response.volume) == [5, 10, 15]
+        assert response.volume_digits == 1
+        assert response.to_decimal(response.open[0]) == response.to_decimal(2179)
+        with pytest.raises(ValueError):
+            response.open[0] = 1
+
+
+def test_attach_rates_worker_process():
+    with SharedRates(_columns()) as shared_rates, ProcessPoolExecutor(max_workers=2) as executor:
+        response = list(executor.map(_sum_close, [shared_rates.handle] * 4))
+
+    assert response == [2158 + 2160 + 2164] * 4
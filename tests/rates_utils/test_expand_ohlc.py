@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from app.rates_utils.intrabar import expand_ohlc
+
+
+def test_expand_ohlc_directions():
+    timestamps, prices = expand_ohlc(
+        timestamp=np.array([0, 3600000], dtype=np.int64),
+        open_price=np.array([100, 110], dtype=np.int64),
+        high_price=np.array([120, 115], dtype=np.int64),
+        low_price=np.array([90, 95], dtype=np.int64),
+        close_price=np.array([110, 100], dtype=np.int64),
+    )
+
+    # bullish candle O-L-H-C, bearish candle O-H-L-C
+    assert list(prices) == [100, 90, 120, 110, 110, 115, 95, 100]
+    assert list(timestamps) == [0, 900000, 1800000, 2700000, 3600000, 4500000, 5400000, 6300000]
+
+
+def test_expand_ohlc_steps_per_leg():
+    timestamps, prices = expand_ohlc(
+        timestamp=np.array([60000], dtype=np.int64),
+        open_price=np.array([100], dtype=np.int64),
+        high_price=np.array([104], dtype=np.int64),
+        low_price=np.array([96], dtype=np.int64),
+        close_price=np.array([99], dtype=np.int64),
+        steps_per_leg=2,
+    )
+
+    assert list(prices) == [100, 102, 104, 100, 96, 98, 99]
+    assert list(timestamps) == [60000] * 7
+
+
+def test_expand_ohlc_empty():
+    empty = np.empty(0, dtype=np.int64)
+
+    timestamps, prices = expand_ohlc(empty, empty, empty, empty, empty, steps_per_leg=5)
+
+    assert not len(timestamps)
+    assert not len(prices)
+
+
+def test_expand_ohlc_invalid_steps():
+    empty = np.empty(0, dtype=np.int64)
+
+    with pytest.raises(ValueError):
+        expand_ohlc(empty, empty, empty, empty, empty, steps_per_leg=0)
@@ -0,0 +1,43 @@
+import os
+import threading
+import time
+
+import pytest
+
+from app.rates_utils.follow import follow_rates_lines
+
+
+def test_follow_rates_lines_appended(rates_path: str):
+    filepath = os.path.join(rates_path, 'live.csv')
+    with open(filepath, 'w') as fd:
+        fd.write('time,open\n2023-01-01T00:00:00,10\n2023-01-01T00:00:01,1')
+
+    def append_rates():
+        time.sleep(0.05)
+        with open(filepath, 'a') as fd:
+            fd.write('1\n2023-01-01T00:00:02,12\n')
+
+    writer = threading.Thread(target=append_rates)
+    writer.start()
+    response = list(follow_rates_lines(filepath, poll_interval=0.01, idle_timeout=0.3))
+    writer.join()
+
+    assert response == [
+        (1, '2023-01-01T00:00:00,10\n'),
+        (2, '2023-01-01T00:00:01,11\n'),
+        (3, '2023-01-01T00:00:02,12\n'),
+    ]
+
+
+def test_follow_rates_lines_idle_timeout(rates_path: str, rates_file: str):
+    started_at = time.monotonic()
+
+    response = list(follow_rates_lines(os.path.join(rates_path, rates_file), poll_interval=0.01, idle_timeout=0.1))
+
+    assert len(response) == 5
+    assert time.monotonic() - started_at >= 0.1
+
+
+def test_follow_rates_lines_compressed(rates_path: str):
+    with pytest.raises(ValueError):
+        next(follow_rates_lines(os.path.join(rates_path, 'rates.csv.gz')))
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from app.rates_utils.synthetic import (
+    generate_block_bootstrap,
+    generate_gbm,
+    generate_jump_diffusion,
+    generate_regime_switching,
+    paths_to_columns,
+)
+
+
+@pytest.mark.parametrize('generator', [generate_gbm, generate_jump_diffusion, generate_regime_switching])
+def test_generate_paths_seeded(generator):
+    response = generator(paths=3, steps=100, start_price=21.79, seed=7)
+
+    assert response.shape == (3, 101)
+    assert list(response[:, 0]) == [21.79, 21.79, 21.79]
+    assert np.array_equal(response, generator(paths=3, steps=100, start_price=21.79, seed=7))
+    assert not np.array_equal(response, generator(paths=3, steps=100, start_price=21.79, seed=8))
+    assert not np.array_equal(response[0], response[1])
+
+
+def test_generate_paths_fast():
+    response = generate_gbm(paths=1000, steps=10000, start_price=100, seed=1)
+
+    assert response.shape == (1000, 10001)
+    assert np.all(response > 0)
+
+
+def test_generate_jump_diffusion_crash():
+    response = generate_jump_diffusion(
+        paths=1,
+        steps=1000,
+        start_price=100,
+        volatility=0,
+        jump_intensity=0.01,
+        jump_mean=-0.2,
+        jump_std=0,
+        seed=3,
+    )
+
+    log_returns = np.diff(np.log(response[0]))
+    jumps = log_returns < -0.1
+    assert 0 < jumps.sum() < 50
+    assert np.allclose(log_returns[jumps] - log_returns[~jumps][0], -0.2)
+
+
+def test_generate_regime_switching_single_regime():
+    response = generate_regime_switching(
+        paths=2,
+        steps=10,
+        start_price=100,
+        drifts=(0.01,),
+        volatilities=(0.0,),
+        switch_probability=0.5,
+        seed=1,
+    )
+
+    assert np.allclose(response[:, -1], 100 * np.exp(0.1))
+
+
+def test_generate_regime_switching_invalid():
+    with pytest.raises(ValueError):
+        generate_regime_switching(paths=1, steps=10, start_price=100, drifts=(0.0, 0.1), volatilities=(0.1,))
+
+
+def test_generate_block_bootstrap():
+    log_returns = np.arange(10, dtype=np.float64) / 1000
+
+    response = generate_block_bootstrap(log_returns, paths=2, steps=7, start_price=10, block_size=3, seed=5)
+
+    assert response.shape == (2, 8)
+    path_returns = np.round(np.diff(np.log(response)) * 1000).astype(int)
+    # every block is consecutive history returns
+    for path in path_returns:
+        for block in (path[0:3], path[3:6]):
+            assert list(np.diff(block)) == [1, 1]
+
+
+def test_generate_block_bootstrap_short_history():
+    with pytest.raises(ValueError):
+        generate_block_bootstrap(np.zeros(2), paths=1, steps=10, start_price=10, block_size=3)
+
+
+def test_paths_to_columns():
+    response = paths_to_columns(np.array([[21.79, 21.581], [21.79, 0.0001]]), price_digits=2, start_ms=1000, interval_ms=500)
+
+    assert len(response) == 2
+    assert list(response[0].timestamp) == [1000, 1500]
+    assert list(response[0].open) == [2179, 2158]
+    assert list(response[1].close) == [2179, 1]
@@ -0,0 +1,17 @@
+import pytest
+
+from app.rates_utils.catalog import is_covered
+from app.rates_utils.columns import parse_rate_time
+
+
+@pytest.mark.parametrize('start_time, end_time, expected', [
+    ('2023-01-01T00:00:00', '2023-01-01T00:06:00', True),
+    ('2023-01-01T00:01:30', '2023-01-01T00:05:30', True),
+    ('2023-01-01T00:00:00', '2023-01-01T00:11:00', False),
+    ('2023-01-01T00:10:00', '2023-01-01T00:11:59', True),
+    ('2022-12-31T23:00:00', '2023-01-01T00:06:00', False),
+])
+def test_is_covered(catalog_files: list[str], start_time: str, end_time: str, expected: bool):
+    response = is_covered('SOLUSDT', '1m', parse_rate_time(start_time), parse_rate_time(end_time))
+
+    assert response is expected
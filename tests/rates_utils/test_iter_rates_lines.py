@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from app.rates_utils.columns import parse_rate_time
+from app.rates_utils.index import build_offsets_index, iter_rates_lines, load_offsets_index
+
+
+@pytest.fixture
+def long_rates_file(rates_path: str) -> str:
+    filepath = os.path.join(rates_path, 'long.csv')
+    with open(filepath, 'w') as fd:
+        fd.write('time,open\n')
+        for minute in range(3000):
+            fd.write('2023-01-{0:02d}T{1:02d}:{2:02d}:00,{3}\n'.format(
+                minute // 1440 + 1,
+                minute % 1440 // 60,
+                minute % 60,
+                minute,
+            ))
+    yield filepath
+
+
+def test_iter_rates_lines_full(long_rates_file: str):
+    response = list(iter_rates_lines(long_rates_file))
+
+    assert len(response) == 3000
+    assert response[0] == (1, '2023-01-01T00:00:00,0\n')
+
+
+def test_iter_rates_lines_range(long_rates_file: str):
+    response = list(iter_rates_lines(
+        long_rates_file,
+        parse_rate_time('2023-01-02T10:00:00'),
+        parse_rate_time('2023-01-02T10:59:59'),
+    ))
+
+    assert len(response) == 60
+    assert response[0] == (2041, '2023-01-02T10:00:00,2040\n')
+    assert response[-1] == (2100, '2023-01-02T10:59:00,2099\n')
+
+
+@pytest.mark.parametrize('start_time, end_time, expected_count', [
+    ('2022-12-31T00:00:00', '2023-01-01T00:00:00', 1),
+    ('2023-01-03T01:59:00', '2023-01-05T00:00:00', 1),
+    ('2023-01-04T00:00:00', '2023-01-05T00:00:00', 0),
+    ('2023-01-01T17:04:00', '2023-01-01T17:04:00', 1),
+])
+def test_iter_rates_lines_range_bounds(long_rates_file: str, start_time: str, end_time: str, expected_count: int):
+    response = list(iter_rates_lines(long_rates_file, parse_rate_time(start_time), parse_rate_time(end_time)))
+
+    assert len(response) == expected_count
+
+
+def test_build_offsets_index(long_rates_file: str):
+    response = build_offsets_index(long_rates_file, step=1000)
+
+    assert response.shape == (3, 3)
+    assert list(response[:, 2]) == [1, 1001, 2001]
+    with open(long_rates_file, 'rb') as fd:
+        fd.seek(int(response[1, 1]))
+        assert fd.readline() == b'2023-01-01T16:40:00,1000\n'
+
+
+def test_load_offsets_index_invalidate(long_rates_file: str):
+    load_offsets_index(long_rates_file)
+    with open(long_rates_file, 'w') as fd:
+        fd.write('time,open\n2023-01-01T00:00:00,1\n')
+
+    response = load_offsets_index(long_rates_file)
+
+    assert len(response) == 1
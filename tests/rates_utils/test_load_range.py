@@ -0,0 +1,34 @@
+from decimal import Decimal
+
+from app.rates_utils.catalog import load_range
+from app.rates_utils.columns import parse_rate_time
+
+
+def test_load_range_stitch_overlapped(catalog_files: list[str]):
+    response = load_range('SOLUSDT', '1m')
+
+    assert len(response) == 9
+    assert response.price_digits == 2
+    assert list(response.timestamp) == sorted(set(response.timestamp))
+    assert [response.to_decimal(price) for price in response.open[:7]] == [
+        Decimal(price) for price in ('10.1', '10.2', '10.3', '10.4', '10.5', '10.65', '10.7')
+    ]
+
+
+def test_load_range_slice(catalog_files: list[str]):
+    response = load_range(
+        'SOLUSDT',
+        '1m',
+        parse_rate_time('2023-01-01T00:04:00'),
+        parse_rate_time('2023-01-01T00:10:00'),
+    )
+
+    assert [response.to_decimal(price) for price in response.open] == [
+        Decimal(price) for price in ('10.5', '10.65', '10.7', '11')
+    ]
+
+
+def test_load_range_not_found(catalog_files: list[str]):
+    response = load_range('SOLUSDT', '1m', exchange='bybit')
+
+    assert not len(response)
@@ -0,0 +1,39 @@
+import os
+
+import numpy as np
+
+from app.rates_utils.cache import get_cache_path, load_rates_columns
+
+
+def test_load_rates_columns_build_cache(rates_path: str, rates_file: str):
+    filepath = os.path.join(rates_path, rates_file)
+
+    response = load_rates_columns(filepath)
+
+    assert os.path.exists(os.path.join(get_cache_path(filepath), 'meta.json'))
+    assert isinstance(response.timestamp, np.memmap)
+    assert len(response) == 5
+    assert response.to_decimal(response.open[-1]) == response.to_decimal(2172)
+
+
+def test_load_rates_columns_use_cache(rates_path: str, rates_file: str, monkeypatch):
+    filepath = os.path.join(rates_path, rates_file)
+    load_rates_columns(filepath)
+    monkeypatch.setattr('app.rates_utils.cache.read_csv_columns', None)
+
+    response = load_rates_columns(filepath)
+
+    assert len(response) == 5
+
+
+def test_load_rates_columns_invalidate_cache(rates_path: str, rates_file: str):
+    filepath = os.path.join(rates_path, rates_file)
+    load_rates_columns(filepath)
+    with open(filepath, 'a') as fd:
+        fd.write('2023-04-23T13:00:00+08:00,21.755,21.8,21.7,21.75\n')
+
+    response = load_rates_columns(filepath)
+
+    assert len(response) == 6
+    assert response.price_digits == 3
+    assert list(response.open[-2:]) == [21720, 21755]
@@ -0,0 +1,18 @@
+import os
+
+from app.rates_utils.cache import get_cache_path
+from app.rates_utils.resampler import load_resampled_columns
+
+
+def test_load_resampled_columns_cached(rates_path: str, rates_file: str, monkeypatch):
+    filepath = os.path.join(rates_path, rates_file)
+
+    response = load_resampled_columns(filepath, '4h')
+    monkeypatch.setattr('app.rates_utils.resampler.resample', None)
+    cached_response = load_resampled_columns(filepath, '4h')
+
+    assert os.path.exists(os.path.join(get_cache_path(filepath), 'resampled_4h', 'meta.json'))
+    assert list(response.open) == list(cached_response.open) == [2179, 2172]
+    assert list(response.high) == [2180, 2180]
+    assert list(response.low) == [2144, 2170]
+    assert list(response.close) == [2172, 2175]
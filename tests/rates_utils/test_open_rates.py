@@ -0,0 +1,18 @@
+import os
+
+import pytest
+
+from app.rates_utils.compression import COMPRESSION_EXTENSIONS, is_compressed, open_rates
+
+
+@pytest.mark.parametrize('compression', [None, *COMPRESSION_EXTENSIONS])
+def test_open_rates_roundtrip(rates_path: str, compression: str | None):
+    filepath = os.path.join(rates_path, 'rates.csv' + (COMPRESSION_EXTENSIONS[compression] if compression else ''))
+
+    with open_rates(filepath, 'wt') as fd:
+        fd.write('time,open\n2023-01-01T00:00:00,10.1\n')
+    with open_rates(filepath) as fd:
+        response = fd.readlines()
+
+    assert response == ['time,open\n', '2023-01-01T00:00:00,10.1\n']
+    assert is_compressed(filepath) is bool(compression)
@@ -0,0 +1,18 @@
+import pytest
+
+from app.rates_utils.catalog import parse_rates_filename
+
+
+@pytest.mark.parametrize('payload, expected', [
+    ('binance_SOLUSDT_1m_2023-01-01_00-00-00_2023-02-01_00-00-00.csv', ('binance', 'SOLUSDT', '1m')),
+    ('bybit_CHRUSDT_1s_2024-02-26_04-30-00_2024-03-04_08-30-00.csv', ('bybit', 'CHRUSDT', '1s')),
+    ('BINANCE_SOLUSDT, 60.csv', ('binance', 'SOLUSDT', '1h')),
+    ('BINANCE_SOLUSDT, 15.csv', ('binance', 'SOLUSDT', '15m')),
+    ('binance_SOLUSDT_1s_2023-01-01_00-00-00_2023-02-01_00-00-00.csv.zst', ('binance', 'SOLUSDT', '1s')),
+    ('float_strategy.csv', None),
+    ('.cache', None),
+])
+def test_parse_rates_filename(payload: str, expected: tuple | None):
+    response = parse_rates_filename(payload)
+
+    assert response == expected
@@ -0,0 +1,57 @@
+import os
+
+from app.rates_utils.columns import read_csv_columns
+
+
+def test_read_csv_columns_ohlc(rates_path: str, rates_file: str):
+    response = read_csv_columns(os.path.join(rates_path, rates_file))
+
+    assert len(response) == 5
+    assert response.price_digits == 2
+    assert response.timestamp[0] == 1682236800000
+    assert response.timestamp[1] - response.timestamp[0] == 3600 * 1000
+    assert list(response.open[:2]) == [2179, 2158]
+    assert list(response.high[:2]) == [2180, 2168]
+    assert list(response.low[:2]) == [2144, 2154]
+    assert list(response.close[:2]) == [2158, 2160]
+
+
+def test_read_csv_columns_open_only(rates_path: str):
+    filepath = os.path.join(rates_path, 'sampler.csv')
+    with open(filepath, 'w') as fd:
+        fd.write('time,open\n')
+        fd.write('2024-02-26T04:30:00,0.3215\n')
+        fd.write('2024-02-26T04:30:01,0.32\n')
+
+    response = read_csv_columns(filepath)
+
+    assert response.price_digits == 4
+    assert list(response.open) == [3215, 3200]
+    assert list(response.close) == list(response.low) == list(response.high) == list(response.open)
+    assert str(response.to_decimal(response.open[0])) == '0.3215'
+
+
+def test_read_csv_columns_volume(rates_path: str):
+    filepath = os.path.join(rates_path, 'sampler.csv')
+    with open(filepath, 'w') as fd:
+        fd.write('time,open,high,low,close,volume\n')
+        fd.write('2024-02-26T04:30:00,0.3215,0.33,0.32,0.325,12.5\n')
+        fd.write('2024-02-26T04:31:00,0.325,0.33,0.32,0.321,3\n')
+
+    response = read_csv_columns(filepath)
+
+    assert response.volume_digits == 1
+    assert response.volume is not None
+    assert list(response.volume) == [125, 30]
+
+
+def test_read_csv_columns_broken_last_line(rates_path: str):
+    filepath = os.path.join(rates_path, 'sampler.csv')
+    with open(filepath, 'w') as fd:
+        fd.write('time,open\n')
+        fd.write('2024-02-26T04:30:00,0.3215\n')
+        fd.write('2024-02-26T04:3')
+
+    response = read_csv_columns(filepath)
+
+    assert list(response.open) == [3215]
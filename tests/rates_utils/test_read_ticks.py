@@ -0,0 +1,63 @@
+import os
+from decimal import Decimal
+
+from app.models import Tick
+from app.rates_utils.ticks import TicksWriter, read_ticks
+
+
+def test_read_ticks_roundtrip(rates_path: str):
+    filepath = os.path.join(rates_path, 'test.ticks')
+    first_chunk = [
+        (1700000000000, Tick(number=1, bid=Decimal('21.79'), ask=Decimal('21.8'), bid_qty=Decimal('1.5'), ask_qty=Decimal(3))),
+        (1700000005000, Tick(number=2, bid=Decimal('21.78'), ask=Decimal('21.795'), bid_qty=Decimal('0.25'), ask_qty=Decimal(1))),
+    ]
+    second_chunk = [
+        (1700000010000, Tick(number=3, bid=Decimal('21.9'), ask=Decimal('21.91'), bid_qty=Decimal(10), ask_qty=Decimal('0.1'))),
+    ]
+
+    with TicksWriter(filepath) as writer:
+        writer.write(first_chunk)
+        writer.write([])
+    # recorder appends chunks to existing file after restart
+    with TicksWriter(filepath) as writer:
+        writer.write(second_chunk)
+    response = read_ticks(filepath)
+
+    assert len(response) == 3
+    assert response.price_digits == 3
+    assert response.qty_digits == 2
+    assert list(response.timestamp) == [1700000000000, 1700000005000, 1700000010000]
+    assert list(response.bid) == [21790, 21780, 21900]
+    assert list(response.ask) == [21800, 21795, 21910]
+    assert list(response.bid_qty) == [150, 25, 1000]
+    assert list(response.ask_qty) == [300, 100, 10]
+
+
+def test_read_ticks_truncated(rates_path: str):
+    filepath = os.path.join(rates_path, 'test.ticks')
+    with TicksWriter(filepath) as writer:
+        writer.write([(1, Tick(number=1, bid=Decimal('1.1'), ask=Decimal('1.2')))])
+        writer.write([(2, Tick(number=2, bid=Decimal('1.2'), ask=Decimal('1.3')))])
+    with open(filepath, 'r+b') as fd:
+        fd.truncate(os.path.getsize(filepath) - 3)
+
+    response = read_ticks(filepath)
+
+    assert list(response.bid) == [11]
+
+
+def test_read_ticks_append_after_truncated(rates_path: str):
+    filepath = os.path.join(rates_path, 'test.ticks')
+    with TicksWriter(filepath) as writer:
+        writer.write([(1, Tick(number=1, bid=Decimal('1.1'), ask=Decimal('1.2')))])
+        writer.write([(2, Tick(number=2, bid=Decimal('1.2'), ask=Decimal('1.3')))])
+    with open(filepath, 'r+b') as fd:
+        fd.truncate(os.path.getsize(filepath) - 3)
+
+    # recorder restarted after it was killed in the middle of chunk
+    with TicksWriter(filepath) as writer:
+        writer.write([(3, Tick(number=3, bid=Decimal('1.3'), ask=Decimal('1.4')))])
+    response = read_ticks(filepath)
+
+    assert list(response.timestamp) == [1, 3]
+    assert list(response.bid) == [11, 13]
@@ -0,0 +1,57 @@
+import os
+from decimal import Decimal
+
+from app.exchange_client.base import AggTrade
+from app.rates_utils.trades import TradesWriter, read_trades
+
+
+def test_read_trades_roundtrip(rates_path: str):
+    filepath = os.path.join(rates_path, 'test.trades')
+    first_chunk = [
+        AggTrade(trade_id=1, price=Decimal('21.79'), qty=Decimal('1.5'), timestamp=1700000000000),
+        AggTrade(trade_id=2, price=Decimal('21.78'), qty=Decimal('0.25'), timestamp=1700000000000),
+        AggTrade(trade_id=3, price=Decimal('21.8'), qty=Decimal('3'), timestamp=1700000000154),
+    ]
+    second_chunk = [
+        AggTrade(trade_id=4, price=Decimal('21.815'), qty=Decimal('10'), timestamp=1700000001000),
+    ]
+
+    with TradesWriter(filepath) as writer:
+        writer.write(first_chunk)
+        writer.write([])
+        writer.write(second_chunk)
+    response = read_trades(filepath)
+
+    assert len(response) == 4
+    assert response.price_digits == 3
+    assert response.qty_digits == 2
+    assert list(response.timestamp) == [trade.timestamp for trade in first_chunk + second_chunk]
+    assert list(response.price) == [21790, 21780, 21800, 21815]
+    assert list(response.qty) == [150, 25, 300, 1000]
+    assert list(response.to_rates_columns().close) == list(response.price)
+
+
+def test_read_trades_truncated(rates_path: str):
+    filepath = os.path.join(rates_path, 'test.trades')
+    with TradesWriter(filepath) as writer:
+        writer.write([AggTrade(trade_id=1, price=Decimal('1.1'), qty=Decimal(1), timestamp=1)])
+        writer.write([AggTrade(trade_id=2, price=Decimal('1.2'), qty=Decimal(1), timestamp=2)])
+    with open(filepath, 'r+b') as fd:
+        fd.truncate(os.path.getsize(filepath) - 3)
+
+    response = read_trades(filepath)
+
+    assert list(response.price) == [11]
+
+
+def test_read_trades_smaller_than_csv(rates_path: str):
+    trades = [
+        AggTrade(trade_id=num, price=Decimal('21.79') + Decimal(num % 7) / 100, qty=Decimal('0.5'), timestamp=1700000000000 + num * 37)
+        for num in range(10000)
+    ]
+    filepath = os.path.join(rates_path, 'test.trades')
+    with TradesWriter(filepath) as writer:
+        writer.write(trades)
+
+    csv_size = sum(len('2023-11-14T22:13:20.037,{0},{1}\n'.format(trade.price, trade.qty)) for trade in trades)
+    assert os.path.getsize(filepath) * 5 < csv_size
@@ -0,0 +1,32 @@
+import os
+from decimal import Decimal
+
+from app.rates_utils.catalog import refresh_catalog
+
+
+def test_refresh_catalog_happy_path(rates_path: str, catalog_files: list[str]):
+    response = refresh_catalog()
+
+    assert len(response) == 4
+    entry = [entry for entry in response if entry.filename == catalog_files[1]][0]
+    assert entry.exchange == 'binance'
+    assert entry.symbol == 'SOLUSDT'
+    assert entry.interval == '1m'
+    assert entry.rows == 4
+    assert entry.min_price == Decimal('10.4')
+    assert entry.max_price == Decimal('10.7')
+    assert entry.last_ms - entry.first_ms == 3 * 60 * 1000
+
+
+def test_refresh_catalog_changed_files(rates_path: str, catalog_files: list[str]):
+    refresh_catalog()
+    os.remove(os.path.join(rates_path, catalog_files[0]))
+    with open(os.path.join(rates_path, catalog_files[1]), 'a') as fd:
+        fd.write('2023-01-01T00:07:00,9.99\n')
+
+    response = refresh_catalog()
+
+    assert len(response) == 3
+    entry = [entry for entry in response if entry.filename == catalog_files[1]][0]
+    assert entry.rows == 5
+    assert entry.min_price == Decimal('9.99')
@@ -0,0 +1,60 @@
+import numpy as np
+
+from app.rates_utils.columns import RatesColumns, parse_rate_time
+from app.rates_utils.resampler import resample
+
+
+def _columns(rows: list[tuple[str, int, int, int, int]]) -> RatesColumns:
+    return RatesColumns(
+        timestamp=np.array([parse_rate_time(row[0]) for row in rows], dtype=np.int64),
+        open=np.array([row[1] for row in rows], dtype=np.int64),
+        high=np.array([row[2] for row in rows], dtype=np.int64),
+        low=np.array([row[3] for row in rows], dtype=np.int64),
+        close=np.array([row[4] for row in rows], dtype=np.int64),
+        price_digits=2,
+    )
+
+
+def test_resample_ohlc():
+    columns = _columns([
+        ('2023-01-01T00:00:00', 10, 12, 9, 11),
+        ('2023-01-01T00:00:30', 11, 15, 11, 14),
+        ('2023-01-01T00:00:59', 14, 14, 8, 9),
+        ('2023-01-01T00:01:00', 9, 10, 9, 10),
+        # gap in source data
+        ('2023-01-01T00:03:10', 20, 21, 19, 19),
+        ('2023-01-01T00:03:20', 19, 22, 18, 21),
+    ])
+
+    response = resample(columns, '1m')
+
+    assert list(response.timestamp) == [
+        parse_rate_time('2023-01-01T00:00:00'),
+        parse_rate_time('2023-01-01T00:01:00'),
+        parse_rate_time('2023-01-01T00:03:00'),
+    ]
+    assert list(response.open) == [10, 9, 20]
+    assert list(response.high) == [15, 10, 22]
+    assert list(response.low) == [8, 9, 18]
+    assert list(response.close) == [9, 10, 21]
+    assert response.price_digits == 2
+
+
+def test_resample_chained():
+    columns = _columns([
+        ('2023-01-01T00:{0:02d}:{1:02d}'.format(second // 60, second % 60), second, second + 1, second - 1, second)
+        for second in range(0, 1800, 10)
+    ])
+
+    response = resample(resample(columns, '1m'), '15m')
+
+    assert list(response.open) == [0, 900]
+    assert list(response.high) == [891, 1791]
+    assert list(response.low) == [-1, 899]
+    assert list(response.close) == [890, 1790]
+
+
+def test_resample_empty():
+    response = resample(_columns([]), '1h')
+
+    assert not len(response)
@@ -0,0 +1,40 @@
+import os
+from decimal import Decimal
+
+import numpy as np
+
+from app.exchange_client.base import HistoryPrice
+from app.rates_utils.cache import load_rates_columns
+from app.rates_utils.store import history_to_columns, is_store, save_store
+
+
+def test_save_store(rates_path: str):
+    store_path = os.path.join(rates_path, 'binance_SOLUSDT_1m_range.rates')
+    columns = history_to_columns([
+        HistoryPrice(price=Decimal('21.79'), timestamp=60000, high=Decimal('21.8'), low=Decimal('21.5'), close=Decimal('21.58'), volume=Decimal('10.50000000')),
+        HistoryPrice(price=Decimal('21.58'), timestamp=120000, high=Decimal('21.68'), low=Decimal('21.54'), close=Decimal('21.6'), volume=Decimal('0.25000000')),
+    ])
+
+    save_store(store_path, columns)
+    response = load_rates_columns(store_path)
+
+    assert is_store(store_path)
+    assert isinstance(response.timestamp, np.memmap)
+    assert list(response.timestamp) == [60000, 120000]
+    assert list(response.high) == [2180, 2168]
+    assert list(response.close) == [2158, 2160]
+    assert response.volume is not None
+    assert response.volume_digits == 2
+    assert list(response.volume) == [1050, 25]
+
+
+def test_save_store_replace(rates_path: str):
+    store_path = os.path.join(rates_path, 'binance_SOLUSDT_1m_range.rates')
+    save_store(store_path, history_to_columns([HistoryPrice(price=Decimal(1), timestamp=60000)]))
+
+    save_store(store_path, history_to_columns([HistoryPrice(price=Decimal(2), timestamp=60000)]))
+    response = load_rates_columns(store_path)
+
+    assert list(response.open) == list(response.close) == [2]
+    assert response.volume is None
+    assert os.listdir(rates_path) == ['binance_SOLUSDT_1m_range.rates']
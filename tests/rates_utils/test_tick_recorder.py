@@ -0,0 +1,35 @@
+import os
+from decimal import Decimal
+
+from app.models import Tick
+from app.rates_utils.recorder import TickRecorder
+from app.rates_utils.ticks import read_ticks
+
+
+def test_tick_recorder(rates_path: str):
+    recorder = TickRecorder(exchange='binance', symbol='SOLUSDT', flush_seconds=0.01, rotate_seconds=3600)
+
+    recorder.record(Tick(number=1, bid=Decimal('21.79'), ask=Decimal('21.8')), timestamp=1699999200000)
+    recorder.record(Tick(number=2, bid=Decimal('21.78'), ask=Decimal('21.79')), timestamp=1700002799000)
+    # next rotation period
+    recorder.record(Tick(number=3, bid=Decimal('21.7'), ask=Decimal('21.71')), timestamp=1700002800000)
+    recorder.close()
+
+    assert sorted(os.listdir(rates_path)) == [
+        'binance_SOLUSDT_ticks_2023-11-14_22-00-00.ticks',
+        'binance_SOLUSDT_ticks_2023-11-14_23-00-00.ticks',
+    ]
+    first_file = read_ticks(os.path.join(rates_path, 'binance_SOLUSDT_ticks_2023-11-14_22-00-00.ticks'))
+    assert list(first_file.bid) == [2179, 2178]
+    second_file = read_ticks(os.path.join(rates_path, 'binance_SOLUSDT_ticks_2023-11-14_23-00-00.ticks'))
+    assert list(second_file.ask) == [2171]
+
+
+def test_tick_recorder_flush_on_close(rates_path: str):
+    recorder = TickRecorder(exchange='binance', symbol='SOLUSDT', flush_seconds=3600)
+
+    recorder.record(Tick(number=1, bid=Decimal('21.79'), ask=Decimal('21.8')))
+    recorder.close()
+
+    filename = os.listdir(rates_path)[0]
+    assert len(read_ticks(os.path.join(rates_path, filename))) == 1
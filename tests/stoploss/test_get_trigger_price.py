@@ -0,0 +1,46 @@
+from decimal import Decimal
+
+import pytest
+
+from app.stoploss import StopLoss
+
+
+@pytest.mark.parametrize('bid, expected', [
+    (Decimal('62.4'), True),
+    (Decimal('62.41'), False),
+])
+def test_get_trigger_price(bid: Decimal, expected: bool, stop_loss_enabled) -> None:
+    pl_base = Decimal(-50)
+    open_quantity = Decimal(2)
+    stop_loss_instance = StopLoss()
+    stop_loss_instance.update_max_pl(Decimal(100))
+
+    result = stop_loss_instance.get_trigger_price(pl_base, open_quantity)
+
+    assert result == Decimal('62.4')
+    assert (bid <= result) is expected
+    assert stop_loss_instance.is_stop_loss_shot(pl_base + bid * open_quantity) is expected
+
+
+def test_get_trigger_price_max_pl_changed(stop_loss_enabled) -> None:
+    stop_loss_instance = StopLoss()
+    stop_loss_instance.update_max_pl(Decimal(100))
+    stop_loss_instance.get_trigger_price(Decimal(-50), Decimal(2))
+    stop_loss_instance.update_max_pl(Decimal(110))
+
+    result = stop_loss_instance.get_trigger_price(Decimal(-50), Decimal(2))
+
+    assert result == Decimal('67.4')
+
+
+@pytest.mark.parametrize('pl_base, expected', [
+    (Decimal(70), Decimal('Infinity')),
+    (Decimal(80), Decimal('-Infinity')),
+])
+def test_get_trigger_price_without_open_positions(pl_base: Decimal, expected: Decimal, stop_loss_enabled) -> None:
+    stop_loss_instance = StopLoss()
+    stop_loss_instance.update_max_pl(Decimal(100))
+
+    result = stop_loss_instance.get_trigger_price(pl_base, Decimal(0))
+
+    assert result == expected
@@ -54,6 +54,7 @@ def test_get_stats_average_open_position_rate(exchange_client_pass_mock):
             open_tick_number=1,
         ),
     ]
+    strategy._reset_positions_index()
 
     stats = strategy.get_results()
 
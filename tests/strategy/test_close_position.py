@@ -16,6 +16,7 @@ def test_close_position_exception():
     )
     strategy = BasicStrategy(exchange_client=mock)
     strategy._open_positions.append(position)
+    strategy._reset_positions_index()
 
     response = strategy._close_position(position, price=Decimal(123.1111), tick_number=1)
 
@@ -39,6 +40,7 @@ def test_close_position_expired():
     )
     strategy = BasicStrategy(exchange_client=mock)
     strategy._open_positions.append(position)
+    strategy._reset_positions_index()
 
     response = strategy._close_position(position, price=Decimal(123.1), tick_number=1)
 
@@ -55,6 +57,7 @@ def test_close_position_filled(exchange_client_pass_mock):
     )
     strategy = BasicStrategy(exchange_client=exchange_client_pass_mock)
     strategy._open_positions.append(position)
+    strategy._reset_positions_index()
 
     response = strategy._close_position(position, price=Decimal('123.1'), tick_number=999)
 
@@ -65,3 +68,18 @@ def test_close_position_filled(exchange_client_pass_mock):
     assert strategy._closed_positions[0].close_rate == Decimal('9.5791433891')
     assert strategy._closed_positions[0].close_tick_number == 999
     assert strategy._closed_positions[0].close_tick_datetime is not None
+
+
+def test_close_position_equal_open_positions(exchange_client_pass_mock):
+    strategy = BasicStrategy(exchange_client=exchange_client_pass_mock)
+    strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=0, open_rate=Decimal(10)))
+    strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=0, open_rate=Decimal(10)))
+    strategy._reset_positions_index()
+    position = strategy._get_open_positions_for_sell()[1]
+
+    response = strategy._close_position(position, price=Decimal(11), tick_number=1)
+
+    assert response is True
+    assert strategy._open_positions[0] is not position
+    assert strategy._closed_positions[0] is position
+    assert strategy._get_open_positions_for_sell() == strategy._open_positions
@@ -28,6 +28,7 @@ def test_get_invest_body_open_positions(baskets_disabled):
             open_rate=Decimal('123.1')
         )
     )
+    strategy._reset_positions_index()
 
     response = strategy._get_invest_body()
 
@@ -58,6 +59,7 @@ def test_get_invest_body_baskets_and_positions(baskets_enabled):
             open_rate=Decimal('123.1')
         )
     )
+    strategy._reset_positions_index()
 
     response = strategy._get_invest_body()
 
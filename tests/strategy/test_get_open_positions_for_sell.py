@@ -1,3 +1,4 @@
+from decimal import Decimal
 from unittest.mock import Mock
 
 from app.models import Position
@@ -6,10 +7,11 @@ from app.strategy import BasicStrategy
 
 def test_get_open_positions_for_sell_happy_path():
     strategy = BasicStrategy(exchange_client=Mock())
-    strategy._open_positions.append(Position(amount=1, open_tick_number=0, open_rate=10))
-    strategy._open_positions.append(Position(amount=1, open_tick_number=0, open_rate=9))
-    strategy._open_positions.append(Position(amount=1, open_tick_number=0, open_rate=11))
-    strategy._open_positions.append(Position(amount=1, open_tick_number=0, open_rate=8))
+    strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=0, open_rate=Decimal(10)))
+    strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=0, open_rate=Decimal(9)))
+    strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=0, open_rate=Decimal(11)))
+    strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=0, open_rate=Decimal(8)))
+    strategy._reset_positions_index()
 
     response = strategy._get_open_positions_for_sell()
 
@@ -0,0 +1,102 @@
+import random
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from app.backtester import _columns_to_ticks, get_synthetic_columns
+from app.exchange_client.dummy import Dummy
+from app.models import Position, Tick
+from app.settings import app_settings
+from app.strategy import BasicStrategy
+
+
+@pytest.fixture
+def grid_settings(grid_settings, monkeypatch) -> None:
+    monkeypatch.setattr(app_settings, 'results_verification_enabled', True)
+
+
+def test_get_results_running_totals(grid_settings):
+    columns = get_synthetic_columns('gbm', steps=3000, seed=3)[0]
+    strategy = BasicStrategy(exchange_client=Dummy(symbol='dummy'), dry_run=True)
+
+    for tick in _columns_to_ticks(columns, slice(0, len(columns))):
+        strategy.tick(tick)
+        if tick.number % 100 == 0:
+            strategy.get_results()
+
+    response = strategy.get_results()
+
+    assert response['count_sell_transactions'] > 1
+    assert response['count_unsuccessful_deals'] > 1
+
+
+def test_get_results_running_totals_rounding(grid_settings):
+    # fee adjusted open rates have 20 digits, totals are rounded on every step as sums over positions lists
+    rnd = random.Random(3)
+    strategy = BasicStrategy(exchange_client=Dummy(symbol='dummy'), dry_run=True)
+    price = Decimal(100)
+
+    for number in range(3000):
+        price = max(Decimal(1), price + Decimal(rnd.randint(-60, 60)) / 100)
+        strategy.tick(Tick(number, bid=price, ask=price, bid_qty=Decimal(10 ** 9), ask_qty=Decimal(10 ** 9)))
+
+    response = strategy.get_results()
+
+    assert response['buy_total_amount_usd'] == sum(
+        [pos.open_rate * pos.amount for pos in strategy._closed_positions]
+    ) + sum([pos.open_rate * pos.amount for pos in strategy._open_positions])
+
+
+def test_get_results_last_24h_success_deals(grid_settings, exchange_client_pass_mock):
+    strategy = BasicStrategy(exchange_client=exchange_client_pass_mock)
+    strategy._push_ticks_history(Tick(0, bid=Decimal(12), ask=Decimal(12)))
+    for days in (3, 0, 2, 0):
+        strategy._closed_positions.append(Position(
+            amount=Decimal(1),
+            open_tick_number=0,
+            open_rate=Decimal(10),
+            close_rate=Decimal(11),
+            close_tick_datetime=datetime.utcnow() - timedelta(days=days),
+        ))
+    strategy._reset_positions_index()
+
+    response = strategy.get_results()
+
+    assert response['last_24h_success_deals'] == 2
+    assert response['sell_without_current_opened_amount_usd'] == Decimal(44)
+
+
+def test_get_results_verification_mismatch(grid_settings, exchange_client_pass_mock):
+    strategy = BasicStrategy(exchange_client=exchange_client_pass_mock)
+    strategy._push_ticks_history(Tick(0, bid=Decimal(12), ask=Decimal(12)))
+    strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=0, open_rate=Decimal(10)))
+    strategy._reset_positions_index()
+    strategy.get_results()
+
+    strategy._results_accumulator.add_closed(Position(amount=Decimal(1), open_tick_number=0, open_rate=Decimal(10)))
+
+    with pytest.raises(RuntimeError):
+        strategy.get_results()
+
+
+def test_get_results_verification_last_day_threshold(grid_settings, exchange_client_pass_mock, monkeypatch):
+    strategy = BasicStrategy(exchange_client=exchange_client_pass_mock)
+    strategy._push_ticks_history(Tick(0, bid=Decimal(12), ask=Decimal(12)))
+    close_datetime = datetime.utcnow() - timedelta(hours=24)
+    strategy._closed_positions.append(Position(
+        amount=Decimal(1),
+        open_tick_number=0,
+        open_rate=Decimal(10),
+        close_rate=Decimal(11),
+        close_tick_datetime=close_datetime,
+    ))
+    strategy._reset_positions_index()
+    # every clock reading is a microsecond later, position leaves 24 hours window between readings
+    clock = iter(close_datetime + timedelta(hours=24, microseconds=num) for num in range(100))
+    monkeypatch.setattr('app.strategy.datetime', Mock(utcnow=lambda: next(clock)))
+
+    response = strategy.get_results()
+
+    assert response['last_24h_success_deals'] == 1
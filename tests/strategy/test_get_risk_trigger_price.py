@@ -0,0 +1,29 @@
+from decimal import Decimal
+
+import pytest
+
+from app.backtester import get_synthetic_columns
+from app.settings import app_settings
+from app.strategy import BasicStrategy
+from tests.helpers import get_stable_results, run_reference_backtest
+
+
+@pytest.mark.parametrize('overrides', [
+    {'stop_loss_enabled': True, 'stop_loss_steps': '0:20;2:1'},
+    {'stop_loss_enabled': True, 'stop_loss_steps': '0:20;5:2'},
+    {'stop_loss_hard_enabled': True, 'stop_loss_hard_threshold': Decimal(100)},
+    {'liquidation_enabled': True, 'liquidation_threshold': Decimal(100)},
+])
+def test_get_risk_trigger_price_backtest(grid_settings, monkeypatch, overrides: dict):
+    for name, value in overrides.items():
+        monkeypatch.setattr(app_settings, name, value)
+    columns = get_synthetic_columns('gbm', steps=3000, seed=3)[0]
+    response = run_reference_backtest(columns)
+
+    # risk checks on every tick with P/L of full results
+    monkeypatch.setattr(BasicStrategy, '_get_risk_trigger_price', lambda self: Decimal('Infinity'))
+    monkeypatch.setattr(BasicStrategy, '_get_current_pl', lambda self, bid: Decimal(self.get_results()['pl_amount_usd']))
+    expected = run_reference_backtest(columns)
+
+    assert response.get_last_tick() == expected.get_last_tick()
+    assert get_stable_results(response.get_results()) == get_stable_results(expected.get_results())
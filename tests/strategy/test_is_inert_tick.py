@@ -0,0 +1,82 @@
+from decimal import Decimal
+
+import pytest
+
+from app.backtester import get_synthetic_columns
+from app.models import Position, Tick
+from app.settings import app_settings
+from app.strategy import BasicStrategy
+from tests.helpers import get_stable_results, run_reference_backtest
+
+
+@pytest.fixture
+def grid_settings(grid_settings, monkeypatch) -> None:
+    monkeypatch.setattr(app_settings, 'grid_step', Decimal(1))
+
+
+def _get_strategy(exchange_client, previous_bid: Decimal = Decimal(22)) -> BasicStrategy:
+    strategy = BasicStrategy(exchange_client=exchange_client)
+    strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=0, open_rate=Decimal(20), grid_number='0_20'))
+    strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=1, open_rate=Decimal(21), grid_number='0_21'))
+    strategy._reset_positions_index()
+    strategy._push_ticks_history(Tick(1, bid=previous_bid, ask=previous_bid))
+    return strategy
+
+
+@pytest.mark.parametrize('bid, ask, expected', [
+    (Decimal('20.09'), Decimal('20.09'), True),
+    (Decimal('20.1'), Decimal('20.1'), False),
+    (Decimal('19.99'), Decimal('21.994'), True),
+    (Decimal('19.99'), Decimal('21.996'), False),
+    (Decimal('19.99'), Decimal('19.99'), False),
+])
+def test_is_inert_tick(exchange_client_pass_mock, grid_settings, bid: Decimal, ask: Decimal, expected: bool):
+    strategy = _get_strategy(exchange_client_pass_mock)
+    tick = Tick(2, bid=bid, ask=ask)
+    strategy._push_ticks_history(tick)
+
+    assert strategy._is_inert_tick(tick) is expected
+
+
+def test_is_inert_tick_green_candle(exchange_client_pass_mock, grid_settings):
+    strategy = _get_strategy(exchange_client_pass_mock, previous_bid=Decimal(19))
+    tick = Tick(2, bid=Decimal('19.5'), ask=Decimal('19.5'))
+    strategy._push_ticks_history(tick)
+
+    assert strategy._is_inert_tick(tick) is True
+
+
+def test_is_inert_tick_positions_changed(exchange_client_pass_mock, grid_settings):
+    strategy = _get_strategy(exchange_client_pass_mock)
+    tick = Tick(2, bid=Decimal('19.5'), ask=Decimal('19.5'))
+    strategy._push_ticks_history(tick)
+    assert strategy._is_inert_tick(tick) is False
+
+    strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=2, open_rate=Decimal('19.5'), grid_number='0_19'))
+    strategy._reset_positions_index()
+
+    assert strategy._is_inert_tick(tick) is True
+
+
+@pytest.mark.parametrize('overrides', [
+    {},
+    {'buy_only_red_candles': False, 'grid_step': Decimal('0.25')},
+    {
+        'baskets_enabled': True,
+        'baskets_thresholds': '99;101',
+        'baskets_buy_amount': '20;10;5',
+        'baskets_hold_position_limit': '8;4;2',
+        'baskets_grid_step': '0.25;0.5;1',
+    },
+])
+def test_is_inert_tick_backtest(grid_settings, monkeypatch, overrides: dict):
+    for name, value in overrides.items():
+        monkeypatch.setattr(app_settings, name, value)
+    columns = get_synthetic_columns('gbm', steps=3000, seed=5)[0]
+    response = run_reference_backtest(columns).get_results()
+
+    monkeypatch.setattr(BasicStrategy, '_is_inert_tick', lambda self, tick: False)
+    expected = run_reference_backtest(columns).get_results()
+
+    assert response['count_buy_transactions'] > 1
+    assert get_stable_results(response) == get_stable_results(expected)
@@ -0,0 +1,22 @@
+from decimal import Decimal
+
+from app.models import Position
+from app.strategy import BasicStrategy
+
+
+def test_restore_state_from_positions_index(exchange_client_pass_mock):
+    strategy = BasicStrategy(exchange_client=exchange_client_pass_mock)
+    strategy._open_position(quantity=Decimal(1), price=Decimal(10), tick_number=0, grid_number='0_20')
+    assert strategy._get_price_triggers().open_quantity == Decimal('12.888')
+
+    # the same positions count, other values
+    strategy.restore_state_from({
+        '_open_positions': [Position(amount=Decimal(2), open_tick_number=0, open_rate=Decimal(20), grid_number='0_40')],
+        '_closed_positions': [Position(amount=Decimal(1), open_tick_number=0, open_rate=Decimal(10), close_rate=Decimal(11))],
+    })
+    response = strategy._get_price_triggers()
+
+    assert response.open_quantity == Decimal(2)
+    assert response.pl_base == Decimal(11) - Decimal(10) - Decimal(40)
+    assert set(response.filled_grid_numbers) == {'0_40'}
+    assert strategy._get_open_positions_for_sell() == strategy._open_positions
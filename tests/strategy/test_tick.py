@@ -63,6 +63,7 @@ def test_sell_something(exchange_client_pass_mock):
     strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=0, open_rate=buy_price))
     strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=0, open_rate=buy_price))
     strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=2, open_rate=hold_price))
+    strategy._reset_positions_index()
     strategy._push_ticks_history(Tick(1, bid=Decimal(1), ask=buy_price, bid_qty=Decimal(100500), ask_qty=Decimal(100500)))
     strategy._push_ticks_history(Tick(2, bid=Decimal(1), ask=hold_price, bid_qty=Decimal(100500), ask_qty=Decimal(100500)))
 
@@ -85,6 +86,7 @@ def test_sell_something_decline_by_ask_qty(exchange_client_pass_mock):
     minimal_sell_price = buy_price + buy_price * app_settings.avg_rate_sell_limit / Decimal(100)
     strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=0, open_rate=buy_price))
     strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=0, open_rate=buy_price))
+    strategy._reset_positions_index()
     strategy._push_ticks_history(Tick(0, bid=Decimal(1), ask=buy_price, bid_qty=Decimal(100500), ask_qty=Decimal(100500)))
     strategy._push_ticks_history(Tick(0, bid=Decimal(1), ask=buy_price, bid_qty=Decimal(100500), ask_qty=Decimal(100500)))
 
@@ -98,6 +100,7 @@ def test_hard_stop_loss_fired(exchange_client_pass_mock, hard_stop_loss_enabled:
     strategy = BasicStrategy(exchange_client=exchange_client_pass_mock)
     buy_price = Decimal('10.0')
     strategy._open_positions.append(Position(amount=Decimal(1), open_tick_number=0, open_rate=buy_price))
+    strategy._reset_positions_index()
     strategy._push_ticks_history(Tick(1, bid=Decimal(1), ask=buy_price, bid_qty=Decimal(100500), ask_qty=Decimal(100500)))
 
     response = strategy.tick(Tick(number=2, bid=hard_stop_loss_enabled, ask=Decimal(100500), bid_qty=Decimal(100500), ask_qty=Decimal(100500)))
@@ -0,0 +1,94 @@
+import dataclasses
+from decimal import Decimal
+
+import pytest
+
+from app import baskets
+from app.models import FloatingMatrix, FloatingStep
+from app.settings import app_settings
+from app.strategy_config import get_strategy_config
+
+
+@pytest.mark.parametrize('price, basket_number, grid_number', [
+    (Decimal(0), 0, '0_0'),
+    (Decimal(5), 0, '0_5'),
+    (Decimal('5.001'), 1, '1_2'),
+    (Decimal(7), 1, '1_3'),
+    (Decimal(10), 1, '1_5'),
+    (Decimal('10.001'), 2, '2_3'),
+    (Decimal(100500), 2, '2_33500'),
+])
+def test_get_strategy_config_baskets(baskets_enabled, price: Decimal, basket_number: int, grid_number: str):
+    config = get_strategy_config()
+
+    assert config.get_basket_number(price) == basket_number
+    assert config.get_continue_buy_amount(price) == [Decimal(10), Decimal('9.5'), Decimal(5)][basket_number]
+    assert config.get_grid_step(price) == Decimal(basket_number + 1)
+    assert config.get_hold_position_limit(price) == basket_number + 1
+    assert config.get_floating_matrix(price) == FloatingMatrix(matrix=[
+        [FloatingStep(percent=Decimal('0.5'), tries=1)],
+        [FloatingStep(percent=Decimal('1.5'), tries=3)],
+        [FloatingStep(percent=Decimal('109.0'), tries=122)],
+    ][basket_number])
+    assert config.get_grid_number(price) == grid_number
+    assert config.get_total_deposit() == Decimal(44)
+
+
+def test_get_strategy_config_baskets_disabled(baskets_disabled):
+    config = get_strategy_config()
+
+    assert config.get_basket_number(Decimal(100500)) == 0
+    assert config.get_continue_buy_amount(Decimal(1)) == Decimal(15)
+    assert config.get_hold_position_limit(Decimal(1)) == 99
+    assert config.get_floating_matrix(Decimal(1)) == baskets.get_floating_matrix(Decimal(1))
+    assert config.get_total_deposit() == baskets.get_total_deposit()
+
+
+def test_get_strategy_config_stop_loss_steps(stop_loss_enabled):
+    config = get_strategy_config()
+
+    assert config.stop_loss_steps[0] == (Decimal(99), Decimal('25.2'))
+    assert config.stop_loss_steps[-1] == (Decimal(0), Decimal(25))
+
+
+def test_get_strategy_config_settings_copy(baskets_disabled):
+    settings = app_settings.model_copy(update={'continue_buy_amount': Decimal(20)})
+
+    config = get_strategy_config(settings)
+
+    assert config.get_continue_buy_amount(Decimal(1)) == Decimal(20)
+    assert get_strategy_config().get_continue_buy_amount(Decimal(1)) == Decimal(15)
+
+
+def test_get_strategy_config_unsorted_thresholds(baskets_enabled, monkeypatch):
+    monkeypatch.setattr(app_settings, 'baskets_thresholds', '10;5')
+
+    with pytest.raises(ValueError):
+        get_strategy_config()
+
+
+def test_get_strategy_config_frozen():
+    config = get_strategy_config()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.enabled = False  # type: ignore[misc]
+
+
+def test_get_strategy_config_floating_matrix_lazy(baskets_disabled, monkeypatch):
+    monkeypatch.setattr(app_settings, 'float_steps_path', '/nonexistent/float_strategy.csv')
+
+    config = get_strategy_config()
+
+    assert config.get_continue_buy_amount(Decimal(1)) == Decimal(15)
+    with pytest.raises(FileNotFoundError):
+        config.get_floating_matrix(Decimal(1))
+
+
+def test_get_strategy_config_floating_matrix_invalid(baskets_enabled, monkeypatch):
+    monkeypatch.setattr(app_settings, 'baskets_floating_matrix', 'invalid')
+
+    config = get_strategy_config()
+
+    assert config.get_grid_step(Decimal(1)) == Decimal(1)
+    with pytest.raises(ValueError):
+        config.get_floating_matrix(Decimal(1))
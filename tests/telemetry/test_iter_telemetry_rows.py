@@ -0,0 +1,27 @@
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from pymysql.cursors import SSDictCursor
+
+from app.telemetry.replay import iter_telemetry_rows
+
+
+def test_iter_telemetry_rows_batches(monkeypatch):
+    rows = [
+        {'tick_number': num, 'tick_timestamp': 1700000000 + num, 'bid': Decimal(num), 'ask': Decimal(num + 1)}
+        for num in range(5)
+    ]
+    cursor = MagicMock()
+    cursor.fetchmany.side_effect = [rows[:2], rows[2:4], rows[4:], []]
+    connection = MagicMock()
+    connection.cursor.return_value.__enter__.return_value = cursor
+    connect = MagicMock(return_value=connection)
+    monkeypatch.setattr('app.telemetry.replay.pymysql.connect', connect)
+
+    response = list(iter_telemetry_rows('trader-1', 1700000000, 1700000100, batch_size=2))
+
+    assert response == rows
+    assert connect.call_args.kwargs['cursorclass'] is SSDictCursor
+    assert cursor.execute.call_args.args[1] == ('trader-1', 1700000000, 1700000100)
+    cursor.fetchmany.assert_called_with(2)
+    connection.close.assert_called_once()
@@ -0,0 +1,67 @@
+from decimal import Decimal
+
+import pytest
+
+from app.models import Position
+from app.position_book import PositionBook
+
+
+def _get_position(open_rate: str, grid_number: str = '0_0', basket_number: int = 0, tick_number: int = 0) -> Position:
+    return Position(
+        amount=Decimal(1),
+        open_tick_number=tick_number,
+        open_rate=Decimal(open_rate),
+        grid_number=grid_number,
+        basket_number=basket_number,
+    )
+
+
+def test_position_book_sorted_by_open_rate():
+    positions = [
+        _get_position('10', tick_number=0),
+        _get_position('9', tick_number=1),
+        _get_position('10', tick_number=2),
+        _get_position('8', tick_number=3),
+    ]
+    position_book = PositionBook(positions)
+
+    response = position_book.get_sorted_by_open_rate()
+
+    assert response == sorted(positions, key=lambda x: x.open_rate)
+    assert [position.open_tick_number for position in response] == [3, 1, 0, 2]
+    assert position_book.get_lowest_open_rate() == Decimal(8)
+    assert len(position_book) == 4
+
+
+def test_position_book_remove():
+    first = _get_position('10', grid_number='0_10', basket_number=1)
+    second = _get_position('10', grid_number='0_10', basket_number=1)
+    position_book = PositionBook([first, second, _get_position('12', grid_number='0_12')])
+
+    position_book.remove(second)
+
+    assert position_book.get_sorted_by_open_rate()[0] is first
+    assert position_book.is_grid_filled('0_10') is True
+    assert position_book.get_basket_count(1) == 1
+
+    position_book.remove(first)
+
+    assert position_book.is_grid_filled('0_10') is False
+    assert position_book.get_basket_count(1) == 0
+    assert set(position_book.grid_numbers) == {'0_12'}
+    assert position_book.basket_counts == {0: 1}
+
+
+def test_position_book_remove_missing():
+    position_book = PositionBook([_get_position('10')])
+
+    with pytest.raises(ValueError):
+        position_book.remove(_get_position('11'))
+
+
+def test_position_book_empty():
+    position_book = PositionBook()
+
+    assert position_book.get_lowest_open_rate() is None
+    assert position_book.get_sorted_by_open_rate() == []
+    assert position_book.is_grid_filled('0_0') is False
@@ -0,0 +1,66 @@
+import os
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import Mock
+
+from app.exchange_client.base import AggTrade
+from app.rates_utils.trades import read_trades
+from app.sampler import sample_trades
+
+
+def test_sample_trades_paging(rates_path: str, monkeypatch):
+    start_ms = int(datetime(2023, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    pages = [
+        [AggTrade(trade_id=1, price=Decimal(1), qty=Decimal(1), timestamp=start_ms), AggTrade(trade_id=2, price=Decimal(2), qty=Decimal(1), timestamp=start_ms + 5)],
+        [AggTrade(trade_id=2, price=Decimal(2), qty=Decimal(1), timestamp=start_ms + 5), AggTrade(trade_id=3, price=Decimal(3), qty=Decimal(1), timestamp=start_ms + 5)],
+        [AggTrade(trade_id=3, price=Decimal(3), qty=Decimal(1), timestamp=start_ms + 5)],
+        [],
+    ]
+    client = Mock()
+    client.get_agg_trades = Mock(side_effect=pages)
+    monkeypatch.setattr('app.sampler._get_exchange_client', lambda *args: client)
+    monkeypatch.setattr('app.sampler.TRADES_WINDOW_MS', 1000)
+
+    response = sample_trades(
+        'SOLUSDT',
+        datetime(2023, 1, 1, tzinfo=timezone.utc),
+        datetime(2023, 1, 1, 0, 0, 1, 999000, tzinfo=timezone.utc),
+        limit=2,
+    )
+
+    assert response == 3
+    assert client.get_agg_trades.call_args_list[1].args == (start_ms + 5, start_ms + 1004, 2)
+    assert client.get_agg_trades.call_args_list[-1].args == (start_ms + 1005, start_ms + 1999, 2)
+    trades = read_trades(os.path.join(rates_path, os.listdir(rates_path)[0]))
+    assert list(trades.price) == [1, 2, 3]
+
+
+def test_sample_trades_same_ms_over_limit(rates_path: str, monkeypatch):
+    start_ms = int(datetime(2023, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    all_trades = [
+        AggTrade(trade_id=trade_id, price=Decimal(trade_id), qty=Decimal(1), timestamp=start_ms + (trade_id > 5))
+        for trade_id in range(1, 7)
+    ]
+
+    def get_agg_trades(from_ms: int, to_ms: int, limit: int, from_id: int | None = None) -> list[AggTrade]:
+        return [
+            trade
+            for trade in all_trades
+            if (from_ms <= trade.timestamp if from_id is None else trade.trade_id >= from_id) and trade.timestamp <= to_ms
+        ][:limit]
+
+    client = Mock()
+    client.get_agg_trades = Mock(side_effect=get_agg_trades)
+    monkeypatch.setattr('app.sampler._get_exchange_client', lambda *args: client)
+    monkeypatch.setattr('app.sampler.TRADES_WINDOW_MS', 1000)
+
+    response = sample_trades(
+        'SOLUSDT',
+        datetime(2023, 1, 1, tzinfo=timezone.utc),
+        datetime(2023, 1, 1, 0, 0, 0, 999000, tzinfo=timezone.utc),
+        limit=2,
+    )
+
+    assert response == 6
+    trades = read_trades(os.path.join(rates_path, os.listdir(rates_path)[0]))
+    assert list(trades.price) == [1, 2, 3, 4, 5, 6]
@@ -1,6 +1,15 @@
+import os
+import time
 from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import Mock
 
-from app.sampler import main
+import numpy as np
+import pytest
+
+from app.exchange_client.base import HistoryPrice
+from app.rates_utils import catalog
+from app.sampler import RateLimiter, find_missing_ranges, main, resume, split_windows, subtract_ranges
 
 
 def test_sampler_happy_path():
@@ -10,3 +19,255 @@ def test_sampler_happy_path():
     response = main(symbol='BTCUSDT', start_date=start_date, end_date=end_date)
 
     assert response > 100
+
+
+def test_sampler_concurrent_windows(rates_path: str, monkeypatch):
+    def get_klines(interval: str, start_ms: int, limit: int) -> list[HistoryPrice]:
+        # slow first window must not break rates order
+        time.sleep(0.05 if start_ms == start_date_ms else 0)
+        return [
+            HistoryPrice(price=Decimal((timestamp - start_date_ms) // 60000), timestamp=timestamp)
+            for timestamp in range(start_ms, start_ms + limit * 60000, 60000)
+        ]
+
+    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    start_date_ms = int(start_date.timestamp() * 1000)
+    client = Mock()
+    client.get_klines = Mock(side_effect=get_klines)
+    monkeypatch.setattr('app.sampler._get_exchange_client', lambda *args: client)
+
+    response = main(
+        symbol='SOLUSDT',
+        start_date=start_date,
+        end_date=start_date + timedelta(days=2, minutes=-1),
+        interval='1m',
+    )
+
+    assert response == 2 * 24 * 60
+    assert client.get_klines.call_count == 3
+    filename = [filename for filename in os.listdir(rates_path) if filename.endswith('.csv')][0]
+    with open(os.path.join(rates_path, filename)) as fd:
+        lines = fd.readlines()
+    assert len(lines) == 2 * 24 * 60 + 1
+    assert lines[0] == 'time,open,high,low,close\n'
+    assert lines[1] == '2023-01-01T00:00:00,0,0,0,0\n'
+    assert lines[-1] == '2023-01-02T23:59:00,2879,2879,2879,2879\n'
+
+
+def test_sampler_ohlcv(rates_path: str, monkeypatch):
+    client = Mock()
+    client.get_klines = Mock(return_value=[
+        HistoryPrice(
+            price=Decimal('21.50'),
+            timestamp=1672531200000,
+            high=Decimal('21.75'),
+            low=Decimal('21.25'),
+            close=Decimal('21.6'),
+            volume=Decimal('3.5'),
+        ),
+    ])
+    monkeypatch.setattr('app.sampler._get_exchange_client', lambda *args: client)
+    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+    response = main(symbol='SOLUSDT', start_date=start_date, end_date=start_date + timedelta(minutes=1), interval='1m')
+
+    assert response == 1
+    filename = [filename for filename in os.listdir(rates_path) if filename.endswith('.csv')][0]
+    with open(os.path.join(rates_path, filename)) as fd:
+        lines = fd.readlines()
+    assert lines == [
+        'time,open,high,low,close,volume\n',
+        '2023-01-01T00:00:00,21.5,21.75,21.25,21.6,3.5\n',
+    ]
+
+
+def test_sampler_failed_download(rates_path: str, monkeypatch):
+    def get_klines(interval: str, start_ms: int, limit: int) -> list[HistoryPrice]:
+        if start_ms != start_date_ms:
+            raise ConnectionError('Connection reset')
+        return [HistoryPrice(price=Decimal(1), timestamp=timestamp) for timestamp in range(start_ms, start_ms + limit * 60000, 60000)]
+
+    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    start_date_ms = int(start_date.timestamp() * 1000)
+    client = Mock()
+    client.get_klines = Mock(side_effect=get_klines)
+    monkeypatch.setattr('app.sampler._get_exchange_client', lambda *args: client)
+
+    with pytest.raises(ConnectionError):
+        main(symbol='SOLUSDT', start_date=start_date, end_date=start_date + timedelta(days=1), interval='1m')
+
+    assert [filename for filename in os.listdir(rates_path) if filename.endswith('.csv')] == []
+
+
+def test_sampler_resume_failed_write(rates_path: str, monkeypatch):
+    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    client = Mock()
+    client.get_klines = Mock(return_value=[HistoryPrice(price=Decimal(1), timestamp=1672531200000)])
+    monkeypatch.setattr('app.sampler._get_exchange_client', lambda *args: client)
+    monkeypatch.setattr('app.sampler._format_rate_values', Mock(side_effect=OSError('No space left on device')))
+
+    with pytest.raises(OSError):
+        resume(symbol='SOLUSDT', start_date=start_date, end_date=start_date, interval='1m')
+
+    assert [filename for filename in os.listdir(rates_path) if filename.startswith('.tmp_')] == []
+
+
+def test_sampler_store(rates_path: str, monkeypatch):
+    def get_klines(interval: str, start_ms: int, limit: int) -> list[HistoryPrice]:
+        return [
+            HistoryPrice(
+                price=Decimal('21.5'),
+                timestamp=timestamp,
+                high=Decimal('21.75'),
+                low=Decimal('21.25'),
+                close=Decimal('21.6'),
+                volume=Decimal('3.5'),
+            )
+            for timestamp in range(start_ms, start_ms + limit * 60000, 60000)
+        ]
+
+    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    client = Mock()
+    client.get_klines = Mock(side_effect=get_klines)
+    monkeypatch.setattr('app.sampler._get_exchange_client', lambda *args: client)
+
+    response = main(
+        symbol='SOLUSDT',
+        start_date=start_date,
+        end_date=start_date + timedelta(days=1, minutes=-1),
+        interval='1m',
+        store=True,
+    )
+
+    assert response == 24 * 60
+    assert catalog.is_covered('SOLUSDT', '1m', int(start_date.timestamp() * 1000), int(start_date.timestamp() * 1000) + 86340000)
+    rates = catalog.load_range('SOLUSDT', '1m')
+    assert len(rates) == 24 * 60
+    assert rates.to_decimal(rates.high[-1]) == Decimal('21.75')
+    assert rates.volume is not None
+    assert int(rates.volume.sum()) == 35 * 24 * 60
+
+
+def test_sampler_resume(rates_path: str, monkeypatch):
+    def get_klines(interval: str, start_ms: int, limit: int) -> list[HistoryPrice]:
+        return [
+            HistoryPrice(
+                price=Decimal('1.5'),
+                timestamp=timestamp,
+                high=Decimal('1.75'),
+                low=Decimal('1.25'),
+                close=Decimal('1.6'),
+                volume=Decimal('3.5'),
+            )
+            for timestamp in range(start_ms, start_ms + limit * 60000, 60000)
+        ]
+
+    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    with open(os.path.join(rates_path, 'binance_SOLUSDT_1m_part.csv'), 'w') as fd:
+        fd.write('time,open\n')
+        fd.write('2023-01-01T00:01:00,21.7\n')
+        fd.write('2023-01-01T00:02:00,21.75\n')
+        fd.write('2023-01-01T00:04:00,21.8\n')
+    client = Mock()
+    client.get_klines = Mock(side_effect=get_klines)
+    monkeypatch.setattr('app.sampler._get_exchange_client', lambda *args: client)
+
+    response = resume(
+        symbol='SOLUSDT',
+        start_date=start_date,
+        end_date=start_date + timedelta(minutes=5),
+        interval='1m',
+    )
+
+    assert response == 3
+    assert [call.args[1] for call in client.get_klines.call_args_list] == [1672531200000, 1672531380000, 1672531500000]
+    filename = [filename for filename in os.listdir(rates_path) if filename.startswith('binance_SOLUSDT_1m_2023')][0]
+    with open(os.path.join(rates_path, filename)) as fd:
+        lines = fd.readlines()
+    assert lines == [
+        'time,open,high,low,close\n',
+        '2023-01-01T00:00:00,1.5,1.75,1.25,1.6\n',
+        '2023-01-01T00:01:00,21.7,21.7,21.7,21.7\n',
+        '2023-01-01T00:02:00,21.75,21.75,21.75,21.75\n',
+        '2023-01-01T00:03:00,1.5,1.75,1.25,1.6\n',
+        '2023-01-01T00:04:00,21.8,21.8,21.8,21.8\n',
+        '2023-01-01T00:05:00,1.5,1.75,1.25,1.6\n',
+    ]
+
+
+def test_sampler_resume_empty_ranges(rates_path: str, monkeypatch):
+    def get_klines(interval: str, start_ms: int, limit: int) -> list[HistoryPrice]:
+        # exchange has no candles after 00:01
+        return [
+            HistoryPrice(
+                price=Decimal('1.5'),
+                timestamp=timestamp,
+                high=Decimal('1.75'),
+                low=Decimal('1.25'),
+                close=Decimal('1.6'),
+                volume=Decimal('3.5'),
+            )
+            for timestamp in range(start_ms, min(start_ms + limit * 60000, 1672531260001), 60000)
+        ]
+
+    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    with open(os.path.join(rates_path, 'binance_SOLUSDT_1m_part.csv'), 'w') as fd:
+        fd.write('time,open,high,low,close,volume\n')
+        fd.write('2023-01-01T00:00:00,21.7,21.8,21.6,21.75,2\n')
+    client = Mock()
+    client.get_klines = Mock(side_effect=get_klines)
+    monkeypatch.setattr('app.sampler._get_exchange_client', lambda *args: client)
+
+    first_response = resume(symbol='SOLUSDT', start_date=start_date, end_date=start_date + timedelta(minutes=5), interval='1m')
+    second_response = resume(symbol='SOLUSDT', start_date=start_date, end_date=start_date + timedelta(minutes=5), interval='1m')
+
+    assert first_response == 1
+    assert second_response == 0
+    assert client.get_klines.call_count == 1
+    assert catalog.get_empty_ranges('SOLUSDT', '1m', 'binance') == [(1672531320000, 1672531500000)]
+    filename = [filename for filename in os.listdir(rates_path) if filename.startswith('binance_SOLUSDT_1m_2023')][0]
+    with open(os.path.join(rates_path, filename)) as fd:
+        lines = fd.readlines()
+    assert lines == [
+        'time,open,high,low,close,volume\n',
+        '2023-01-01T00:00:00,21.7,21.8,21.6,21.75,2\n',
+        '2023-01-01T00:01:00,1.5,1.75,1.25,1.6,3.5\n',
+    ]
+
+
+def test_find_missing_ranges():
+    timestamps = np.array([100, 110, 140, 150], dtype=np.int64)
+
+    response = find_missing_ranges(timestamps, 80, 180, 10)
+
+    assert response == [(80, 90), (120, 130), (160, 180)]
+
+
+def test_find_missing_ranges_covered():
+    timestamps = np.array([100, 110, 120], dtype=np.int64)
+
+    response = find_missing_ranges(timestamps, 100, 120, 10)
+
+    assert response == []
+
+
+def test_subtract_ranges():
+    response = subtract_ranges([(0, 100), (200, 300)], [(50, 60), (90, 210), (250, 250)])
+
+    assert response == [(0, 49), (61, 89), (211, 249), (251, 300)]
+
+
+def test_split_windows():
+    response = split_windows(0, 2500, 1000)
+
+    assert response == [(0, 999), (1000, 1999), (2000, 2500)]
+
+
+def test_rate_limiter():
+    rate_limiter = RateLimiter(requests_per_second=50)
+    started_at = time.monotonic()
+
+    for _ in range(6):
+        rate_limiter.wait()
+
+    assert time.monotonic() - started_at >= 0.1